@@ -7,10 +7,33 @@
 
 # Aurthor: Tristan Sim
 # Date: 11/11/2025
-# Version: 1.01
+# Version: 1.05
 # Changelog: 
+# - RT/RTH Columns are restored to float64 before Aggregation (Block Store keeps RT as float32)
+# - Channel-aware Analysis for the Diagnostic Channels (Flow, Supply/Return/Delta Temperature)
+# - RT vs RTH Consistency Check (Integrated RT compared with RTH Register Deltas over Sliding Windows)
+# - Monthly Consumption is Segment-aware (RTH Register Resets / Meter Replacements and Rollovers are detected for all Meters at once)
+# - Consistency Statistics hold Python Floats and at most CONSISTENCY_INTERVAL_LIMIT Divergent Intervals per Meter
 
 import pandas as pd
+import numpy as np
+import parse_data
+
+# Cooling Capacity from Flow and Delta T: RT = Flow (m3/h) x Delta T (degC) x 1.163 kW/(m3/h.K) / 3.517 kW/RT
+RT_PER_FLOW_DELTA_T = 1.163 / 3.517
+LOW_DELTA_T_THRESHOLD = 3.0  # Delta T (degC) below which a running Meter is flagged as Low Delta T
+
+# RTH Register Discontinuities
+RTH_ROLLOVER_VALUE = None      # Register Capacity (e.g. 99999999.999) - None: Register never rolls over
+RTH_ROLLOVER_FRACTION = 0.1    # A Drop from the top 10% of the Capacity into the bottom 10% is a Rollover
+RTH_RESET_TOLERANCE = 1.0      # Drops up to this Size are Register Jitter (kept as-is), larger Drops are Resets
+
+# RT vs RTH Consistency Check
+CONSISTENCY_WINDOW_MINUTES = 60       # Length of each Sliding Window
+CONSISTENCY_STRIDE_MINUTES = 30       # Step between Window Starts
+CONSISTENCY_TOLERANCE_PERCENTAGE = 10.0
+CONSISTENCY_MINIMUM_RTH = 1.0         # Windows expecting less RTH than this are compared against this Floor
+CONSISTENCY_INTERVAL_LIMIT = 20       # Divergent Intervals listed per Meter in the Diagnostics (All are counted)
 
 def analyze_Meter_RT_Data(blockDataFrame: pd.DataFrame, meterName: str, includeFaultyData: bool = True) -> dict:
     """
@@ -24,7 +47,7 @@ def analyze_Meter_RT_Data(blockDataFrame: pd.DataFrame, meterName: str, includeF
     """
     
     rt_Column = f'{meterName}_RT'
-    rt_Data = blockDataFrame[rt_Column]
+    rt_Data = parse_data.restore_Float64_Precision(blockDataFrame[[rt_Column]])[rt_Column]
     rt_healthy = rt_Data[rt_Data > 0]
     
     # Determine which data to use for calculations
@@ -122,20 +145,116 @@ def analyze_Block_RT_Data(blockDataFrame: pd.DataFrame, meterList: list, blockNu
     return analyzed_BlockData_RT
 
 
-def analyze_Meter_RTH_Data(blockDataFrame: pd.DataFrame, meterName: str) -> dict:
+def build_RTH_Step_Matrix(rthMatrix: np.ndarray, rolloverValue: float = RTH_ROLLOVER_VALUE,
+                          resetTolerance: float = RTH_RESET_TOLERANCE) -> dict:
+    """
+    Step of every Healthy RTH Reading from the previous Healthy Reading of the same Meter (Minutes x Meters).
+    Args:
+        rthMatrix: RTH Block Matrix (float64, Unhealthy Readings are 0)
+        rolloverValue: Register Capacity (None: Register never rolls over)
+        resetTolerance: Largest Drop treated as Register Jitter
+    Returns:
+        Dictionary of Matrices: 'Step' (Raw Step), 'Consumption' (Step with Rollovers wrapped and Resets as 0),
+        'Previous_Value', 'Rollover' and 'Reset' (bool)
+    """
+    
+    healthy = rthMatrix > 0
+    minuteIndex = np.arange(rthMatrix.shape[0])[:, None]
+    meterColumns = np.arange(rthMatrix.shape[1])[None, :]
+    
+    # Previous Healthy Reading (strictly before each Minute) of every Meter
+    lastHealthy = np.maximum.accumulate(np.where(healthy, minuteIndex, -1), axis=0)
+    previousHealthy = np.vstack([np.full((1, rthMatrix.shape[1]), -1), lastHealthy[:-1]])
+    stepped = healthy & (previousHealthy >= 0)
+    
+    previousValue = rthMatrix[np.maximum(previousHealthy, 0), meterColumns]
+    step = np.where(stepped, rthMatrix - previousValue, 0.0)
+    drop = step < -resetTolerance
+    
+    if rolloverValue is not None:
+        rollover = drop & (previousValue >= rolloverValue * (1 - RTH_ROLLOVER_FRACTION)) & (rthMatrix <= rolloverValue * RTH_ROLLOVER_FRACTION)
+    else:
+        rollover = np.zeros_like(drop)
+    reset = drop & ~rollover
+    
+    consumption = np.where(reset, 0.0, step + np.where(rollover, rolloverValue if rolloverValue is not None else 0.0, 0.0))
+    
+    return {'Step': step, 'Consumption': consumption, 'Previous_Value': previousValue, 'Rollover': rollover, 'Reset': reset}
+
+
+def analyze_RTH_Segments(blockDataFrame: pd.DataFrame, meterNames: list, rolloverValue: float = RTH_ROLLOVER_VALUE,
+                         resetTolerance: float = RTH_RESET_TOLERANCE) -> dict:
+    """
+    Detect RTH Register Resets and Rollovers for many Meters at once (one diff over the Block Matrix).
+    Each Healthy Reading is compared with the previous Healthy Reading of the same Meter:
+    - Rollover: the Register wrapped past rolloverValue - the Step counts as (rolloverValue - Previous + Current)
+    - Reset: any other Drop larger than resetTolerance (Meter Replacement / Register Reset) - the Step counts as 0
+    Args:
+        blockDataFrame: DataFrame containing meter data
+        meterNames: List of meter names to analyze
+        rolloverValue: Register Capacity (None: Register never rolls over)
+        resetTolerance: Largest Drop treated as Register Jitter
+    Returns:
+        Dictionary of Meter Name to {'Monthly_Consumption', 'Monthly_Consumption_Raw', 'Number_of_Segments', 'Reset_Events'}
+    """
+    
+    if not meterNames:
+        return {}
+    
+    rthMatrix = blockDataFrame[[f'{meter}_RTH' for meter in meterNames]].to_numpy(dtype='float64')
+    healthy = rthMatrix > 0
+    
+    rthSteps = build_RTH_Step_Matrix(rthMatrix, rolloverValue, resetTolerance)
+    step, previousValue, rollover, reset = rthSteps['Step'], rthSteps['Previous_Value'], rthSteps['Rollover'], rthSteps['Reset']
+    drop = rollover | reset
+    
+    # Correction applied to (Last - First): Rollovers add the wrapped Capacity, Resets remove the Drop
+    correction = np.where(rollover, rolloverValue if rolloverValue is not None else 0.0, 0.0) - np.where(reset, step, 0.0)
+    
+    timestamps = blockDataFrame['timestamp'].to_numpy()
+    rthSegments = {}
+    
+    for column, meter in enumerate(meterNames):
+        healthyRows = np.flatnonzero(healthy[:, column])
+        rawConsumption = rthMatrix[healthyRows[-1], column] - rthMatrix[healthyRows[0], column] if len(healthyRows) else 0.0
+        eventRows = np.flatnonzero(drop[:, column])
+        
+        rthSegments[meter] = {
+            'Monthly_Consumption': rawConsumption + correction[eventRows, column].sum() if len(eventRows) else rawConsumption,
+            'Monthly_Consumption_Raw': rawConsumption,
+            'Number_of_Segments': int(reset[:, column].sum()) + 1,
+            'Reset_Events': [
+                {
+                    'Timestamp': timestamps[row],
+                    'Type': 'Rollover' if rollover[row, column] else 'Reset',
+                    'Previous_RTH': previousValue[row, column],
+                    'RTH': rthMatrix[row, column]
+                }
+                for row in eventRows
+            ]
+        }
+    
+    return rthSegments
+
+
+def analyze_Meter_RTH_Data(blockDataFrame: pd.DataFrame, meterName: str, rthSegments: dict = None) -> dict:
     """
     Process RTH (accumulated) meter data and extract statistics for 1 Meter.
     
     Args:
         blockDataFrame: DataFrame containing meter data
         meterName: Full meter name (e.g., 'J_B_82_10_27')
+        rthSegments: Precomputed Segments of this Meter (analyze_RTH_Segments) - computed here when None
     
     Returns:
         Dictionary containing RTH statistics
     """
     
+    if rthSegments is None:
+        rthSegments = analyze_RTH_Segments(blockDataFrame, [meterName])[meterName]
+    
     rth_Column = f'{meterName}_RTH'
-    rth_Data = blockDataFrame[rth_Column]
+    rth_Data = parse_data.restore_Float64_Precision(blockDataFrame[[rth_Column]])[rth_Column]
     rth_healthy = rth_Data[rth_Data > 0]
     
     # Find first and last healthy RTH values with timestamps
@@ -149,8 +268,8 @@ def analyze_Meter_RTH_Data(blockDataFrame: pd.DataFrame, meterName: str) -> dict
         first_rth_timestamp = blockDataFrame.loc[first_rth_idx, 'timestamp']
         last_rth_timestamp = blockDataFrame.loc[last_rth_idx, 'timestamp']
         
-        # Monthly consumption (Last - First for billing)
-        monthly_consumption = last_rth_value - first_rth_value
+        # Monthly consumption (Sum of the Segment Deltas for billing - Last - First when the Register is continuous)
+        monthly_consumption = rthSegments['Monthly_Consumption']
     else:
         first_rth_value = 0.0
         last_rth_value = 0.0
@@ -175,7 +294,10 @@ def analyze_Meter_RTH_Data(blockDataFrame: pd.DataFrame, meterName: str) -> dict
         'First_Healthy_RTH_Timestamp': first_rth_timestamp,
         'Last_Healthy_RTH_ProcessValue': last_rth_value,
         'Last_Healthy_RTH_Timestamp': last_rth_timestamp,
-        'Monthly_Consumption': monthly_consumption,  # For billing (Last - First)
+        'Monthly_Consumption': monthly_consumption,  # For billing (Sum of Segment Deltas)
+        'Monthly_Consumption_Raw': rthSegments['Monthly_Consumption_Raw'],  # Last - First
+        'Number_of_Segments': rthSegments['Number_of_Segments'],
+        'Reset_Events': rthSegments['Reset_Events'],
         'Totalized_Value': totalized_value,  # Sum of all healthy data
         'Totalized_Value_Unfiltered': totalized_value_unfiltered,
         'Number_of_DataPoints': total_datapoints,
@@ -203,8 +325,12 @@ def analyze_Block_RTH_Data(blockDataFrame: pd.DataFrame, meterList: list, blockN
     # Find all meters in this block
     meters_in_block = [meter for meter in meterList if meter.split('_')[2] == blockNumber]
     
+    # Register Resets / Rollovers of every Meter in one Pass
+    block_segments = analyze_RTH_Segments(blockDataFrame, meters_in_block)
+    
     # Initialize aggregated values
     total_monthly_consumption = 0.0
+    total_reset_events = 0
     total_totalized = 0.0
     total_healthy_datapoints = 0
     total_faulty_datapoints = 0
@@ -214,11 +340,12 @@ def analyze_Block_RTH_Data(blockDataFrame: pd.DataFrame, meterList: list, blockN
     
     # Process each meter and aggregate
     for meter in meters_in_block:
-        meter_stats = analyze_Meter_RTH_Data(blockDataFrame, meter)
+        meter_stats = analyze_Meter_RTH_Data(blockDataFrame, meter, block_segments[meter])
         meter_statistics[meter] = meter_stats
         
         # Aggregate totals
         total_monthly_consumption += meter_stats['Monthly_Consumption']
+        total_reset_events += len(meter_stats['Reset_Events'])
         total_totalized += meter_stats['Totalized_Value']
         total_healthy_datapoints += meter_stats['Number_of_Healthy_DataPoints']
         total_faulty_datapoints += meter_stats['Number_of_Faulty_DataPoints']
@@ -231,6 +358,7 @@ def analyze_Block_RTH_Data(blockDataFrame: pd.DataFrame, meterList: list, blockN
         'Block_Number': blockNumber,
         'Number_of_Meters': len(meters_in_block),
         'Block_Monthly_Consumption': total_monthly_consumption,  # For billing
+        'Block_Reset_Events': total_reset_events,
         'Block_Totalized_Value': total_totalized,
         'Block_Total_Healthy_DataPoints': total_healthy_datapoints,
         'Block_Total_Faulty_DataPoints': total_faulty_datapoints,
@@ -241,6 +369,188 @@ def analyze_Block_RTH_Data(blockDataFrame: pd.DataFrame, meterList: list, blockN
     return analyzed_BlockData_RTH
 
 
+def analyze_Meter_Channel_Data(blockDataFrame: pd.DataFrame, meterName: str, channel: str) -> dict:
+    """
+    Process one Channel (RT, RTH, FLOW, TSUPPLY, TRETURN, TDELTA) of 1 Meter using the Health Bitmask.
+    Args:
+        blockDataFrame: DataFrame containing meter data
+        meterName: Full meter name (e.g., 'J_B_82_10_27')
+        channel: Channel name
+    Returns:
+        Dictionary containing Channel statistics (Healthy Data only)
+    """
+    
+    channelData = blockDataFrame[f'{meterName}_{channel}'].to_numpy(dtype='float64').round(parse_data.METER_DECIMALS)
+    healthyMask = (blockDataFrame[f'{meterName}_Health'].to_numpy() & parse_data.HEALTH_BITS[channel]) > 0
+    healthyData = channelData[healthyMask]
+    
+    total_datapoints = len(channelData)
+    healthy_datapoints = len(healthyData)
+    
+    analyzed_MeterData_Channel = {
+        'Channel': channel,
+        'Average_Value': healthyData.mean() if healthy_datapoints > 0 else 0.0,
+        'Minimum_Value': healthyData.min() if healthy_datapoints > 0 else 0.0,
+        'Maximum_Value': healthyData.max() if healthy_datapoints > 0 else 0.0,
+        'Number_of_DataPoints': total_datapoints,
+        'Number_of_Healthy_DataPoints': healthy_datapoints,
+        'Number_of_Faulty_DataPoints': total_datapoints - healthy_datapoints,
+        'Data_Completeness_Percentage': round((healthy_datapoints / total_datapoints * 100) if total_datapoints > 0 else 0.0, 2)
+    }
+    
+    return analyzed_MeterData_Channel
+
+
+def analyze_Meter_Hydraulics(blockDataFrame: pd.DataFrame, meterName: str) -> dict:
+    """
+    Compare the measured RT with the RT calculated from Flow and Delta T for 1 Meter.
+    Only Minutes where RT, Flow and Delta T are all Healthy are used.
+    Args:
+        blockDataFrame: DataFrame containing meter data (with RT, FLOW and TDELTA columns)
+        meterName: Full meter name (e.g., 'J_B_82_10_27')
+    Returns:
+        Dictionary containing Hydraulic Diagnostics
+    """
+    
+    requiredBits = parse_data.HEALTH_BITS['RT'] | parse_data.HEALTH_BITS['FLOW'] | parse_data.HEALTH_BITS['TDELTA']
+    healthyMask = (blockDataFrame[f'{meterName}_Health'].to_numpy() & requiredBits) == requiredBits
+    
+    rtData = blockDataFrame[f'{meterName}_RT'].to_numpy(dtype='float64')[healthyMask]
+    flowData = blockDataFrame[f'{meterName}_FLOW'].to_numpy(dtype='float64')[healthyMask]
+    deltaTData = blockDataFrame[f'{meterName}_TDELTA'].to_numpy(dtype='float64')[healthyMask]
+    calculatedRT = flowData * deltaTData * RT_PER_FLOW_DELTA_T
+    
+    runningMask = flowData > 0
+    
+    analyzed_MeterData_Hydraulics = {
+        'Number_of_Compared_DataPoints': int(healthyMask.sum()),
+        'Average_RT': rtData.mean() if len(rtData) > 0 else 0.0,
+        'Average_Calculated_RT': calculatedRT.mean() if len(calculatedRT) > 0 else 0.0,
+        'RT_To_Calculated_RT_Ratio': rtData.sum() / calculatedRT.sum() if calculatedRT.sum() > 0 else 0.0,
+        'Average_Flow': flowData.mean() if len(flowData) > 0 else 0.0,
+        'Average_Delta_T': deltaTData[runningMask].mean() if runningMask.any() else 0.0,
+        'Low_Delta_T_Minutes': int((runningMask & (deltaTData < LOW_DELTA_T_THRESHOLD)).sum())
+    }
+    
+    return analyzed_MeterData_Hydraulics
+
+
+def analyze_Block_Channel_Data(blockDataFrame: pd.DataFrame, meterList: list, blockNumber: str, channels: list = None) -> dict:
+    """
+    Process every Channel loaded for each meter in a block (Adds Hydraulic Diagnostics when RT, FLOW and TDELTA are loaded).
+    Args:
+        blockDataFrame: DataFrame containing all meter data for the block
+        meterList: List of all meter names
+        blockNumber: Block number ('82')
+        channels: Channels to analyze (Default: every Channel present in the Block DataFrame)
+    Returns:
+        Dictionary of Meter Name to {Channel: Channel Statistics, 'Hydraulics': Hydraulic Diagnostics}
+    """
+    
+    meters_in_block = [meter for meter in meterList if meter.split('_')[2] == blockNumber]
+    meter_statistics = {}
+    
+    for meter in meters_in_block:
+        meterChannels = channels if channels is not None else [channel for channel in parse_data.ALL_CHANNELS if f'{meter}_{channel}' in blockDataFrame.columns]
+        meter_statistics[meter] = {channel: analyze_Meter_Channel_Data(blockDataFrame, meter, channel) for channel in meterChannels}
+        
+        if all(channel in meterChannels for channel in ['RT', 'FLOW', 'TDELTA']):
+            meter_statistics[meter]['Hydraulics'] = analyze_Meter_Hydraulics(blockDataFrame, meter)
+    
+    return meter_statistics
+
+
+def analyze_Block_RT_RTH_Consistency(blockDataFrame: pd.DataFrame, meterList: list, blockNumber: str,
+                                     windowMinutes: int = CONSISTENCY_WINDOW_MINUTES, strideMinutes: int = CONSISTENCY_STRIDE_MINUTES,
+                                     tolerancePercentage: float = CONSISTENCY_TOLERANCE_PERCENTAGE,
+                                     minimumRTH: float = CONSISTENCY_MINIMUM_RTH) -> dict:
+    """
+    Check that each meter's RTH Register rises by the Integral of its RT (RT x Minutes / 60) - All meters in one Vectorized Pass.
+    For every Sliding Window the first and last Healthy RTH Readings are compared with the Integrated RT between them.
+    Windows with an RT Gap between those Readings are skipped (the Integral would be incomplete).
+    Args:
+        blockDataFrame: DataFrame containing all meter data for the block
+        meterList: List of all meter names
+        blockNumber: Block number ('82')
+        windowMinutes: Length of each Sliding Window
+        strideMinutes: Step between Window Starts
+        tolerancePercentage: Allowed Difference between Integrated RT and RTH Delta
+        minimumRTH: Floor for the Expected RTH of a Window (Avoids flagging Windows with almost no Load)
+    Returns:
+        Dictionary of Meter Name to Consistency Statistics (with the first CONSISTENCY_INTERVAL_LIMIT Divergent Intervals)
+    """
+    
+    meters_in_block = [meter for meter in meterList if meter.split('_')[2] == blockNumber]
+    if not meters_in_block:
+        return {}
+    
+    # Block Matrices (Minutes x Meters)
+    rtMatrix = blockDataFrame[[f'{meter}_RT' for meter in meters_in_block]].to_numpy(dtype='float64').round(parse_data.METER_DECIMALS)
+    rthMatrix = blockDataFrame[[f'{meter}_RTH' for meter in meters_in_block]].to_numpy(dtype='float64')
+    healthMatrix = blockDataFrame[[f'{meter}_Health' for meter in meters_in_block]].to_numpy()
+    rtHealthy = (healthMatrix & parse_data.HEALTH_BITS['RT']) > 0
+    rthHealthy = ((healthMatrix & parse_data.HEALTH_BITS['RTH']) > 0) & (rthMatrix > 0)
+    
+    numberOfMinutes = rtMatrix.shape[0]
+    minuteIndex = np.arange(numberOfMinutes)[:, None]
+    
+    # Integrated RT (RTH) and Count of RT Gaps up to each Minute
+    integratedRT = np.cumsum(np.where(rtHealthy, rtMatrix, 0.0), axis=0) / 60.0
+    rtGaps = np.cumsum(~rtHealthy, axis=0)
+    
+    # Next Healthy RTH at or after each Minute / Previous Healthy RTH at or before each Minute
+    nextHealthy = np.minimum.accumulate(np.where(rthHealthy, minuteIndex, numberOfMinutes)[::-1], axis=0)[::-1]
+    previousHealthy = np.maximum.accumulate(np.where(rthHealthy, minuteIndex, -1), axis=0)
+    
+    # Sliding Windows [start, start + windowMinutes)
+    windowStarts = np.arange(0, max(numberOfMinutes - windowMinutes, 0) + 1, strideMinutes)
+    windowEnds = np.minimum(windowStarts + windowMinutes, numberOfMinutes) - 1
+    firstReading = nextHealthy[windowStarts]              # Windows x Meters
+    lastReading = previousHealthy[windowEnds]
+    compared = (firstReading < lastReading) & (lastReading >= 0) & (firstReading < numberOfMinutes)
+    
+    first = np.where(compared, firstReading, 0)
+    last = np.where(compared, lastReading, 0)
+    meterColumns = np.arange(len(meters_in_block))[None, :]
+    expectedRTH = integratedRT[last, meterColumns] - integratedRT[first, meterColumns]
+    actualRTH = rthMatrix[last, meterColumns] - rthMatrix[first, meterColumns]
+    completeRT = (rtGaps[last, meterColumns] - rtGaps[first, meterColumns]) == 0
+    evaluated = compared & completeRT
+    
+    differencePercentage = np.abs(actualRTH - expectedRTH) / np.maximum(expectedRTH, minimumRTH) * 100
+    divergent = evaluated & (differencePercentage > tolerancePercentage)
+    
+    timestamps = blockDataFrame['timestamp'].to_numpy()
+    consistencyStatistics = {}
+    
+    for column, meter in enumerate(meters_in_block):
+        meterEvaluated = evaluated[:, column]
+        totalExpected = float(expectedRTH[meterEvaluated, column].sum())
+        totalActual = float(actualRTH[meterEvaluated, column].sum())
+        divergentWindows = np.flatnonzero(divergent[:, column])
+        
+        consistencyStatistics[meter] = {
+            'Expected_RTH': totalExpected,
+            'Actual_RTH': totalActual,
+            'Consistency_Ratio': totalActual / totalExpected if totalExpected > 0 else 0.0,
+            'Number_of_Windows': len(windowStarts),
+            'Number_of_Evaluated_Windows': int(meterEvaluated.sum()),
+            'Number_of_Divergent_Windows': len(divergentWindows),
+            'Is_Divergent': len(divergentWindows) > 0,
+            'Divergent_Intervals': [
+                {
+                    'Start': timestamps[first[window, column]],
+                    'End': timestamps[last[window, column]],
+                    'Expected_RTH': round(float(expectedRTH[window, column]), 3),
+                    'Actual_RTH': round(float(actualRTH[window, column]), 3)
+                }
+                for window in divergentWindows[:CONSISTENCY_INTERVAL_LIMIT]
+            ]
+        }
+    
+    return consistencyStatistics
+
+
 def print_Meter_Statistics(meter_name: str, rt_stats: dict, rth_stats: dict):
     """Print meter statistics in a formatted way."""
     
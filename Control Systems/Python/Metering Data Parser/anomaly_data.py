@@ -0,0 +1,150 @@
+# Project: Metering Data Parser
+# File Type: Function File
+
+# Description: Anomaly Data
+# Contains the Anomaly Detection of the parsed Meter Arrays - Spikes (Rolling Z-Score), Flat-lined Sensors (Stuck-Value
+# Run Length) and impossible Step Changes (Rate-of-Change Limit) are found with vectorized Passes over the Healthy Samples
+# of a File - the Merge flags them in the Anomaly Bits of the Health Bitmask (parse_data.ANOMALY_REJECTION also rejects them)
+
+# Aurthor: Tristan Sim
+# Date: 19/10/2026
+# Version: 1.01
+# Changelog:
+# - Anomalies are returned as a Flag Array - the Merge decides to flag (Default, Value kept) or reject them
+
+import numpy as np
+
+# Anomaly Rules per Channel (None disables a Rule)
+# - Z_Score: Rolling Z-Score Limit of a Sample against its Neighbours (Window: Neighbouring Healthy Samples, Sample excluded)
+# - Min_Deviation: Floor of the Rolling Standard Deviation (A Flat Signal does not turn Meter Resolution into Spikes)
+# - Stuck_Samples: Run of identical non-zero Samples counted as a Flat-lined Sensor (Zero is a stopped Plant, not a Fault)
+# - Max_Step: Largest Change per Minute between two Healthy Samples (Site Limit - the Return from a Single-Sample Spike is kept)
+# RTH is a cumulative Register - its Resets and Rollovers are handled by the Segment-aware Consumption (analyze_data)
+ANOMALY_RULES = {
+    'RT': {'Z_Score': 6.0, 'Window': 61, 'Min_Deviation': 1.0, 'Stuck_Samples': 180, 'Max_Step': None},
+    'RTH': {'Z_Score': None, 'Window': None, 'Min_Deviation': None, 'Stuck_Samples': None, 'Max_Step': None},
+    'FLOW': {'Z_Score': 6.0, 'Window': 61, 'Min_Deviation': 0.1, 'Stuck_Samples': 180, 'Max_Step': None},
+    'TSUPPLY': {'Z_Score': 6.0, 'Window': 61, 'Min_Deviation': 0.1, 'Stuck_Samples': 360, 'Max_Step': 5.0},
+    'TRETURN': {'Z_Score': 6.0, 'Window': 61, 'Min_Deviation': 0.1, 'Stuck_Samples': 360, 'Max_Step': 5.0},
+    'TDELTA': {'Z_Score': 6.0, 'Window': 61, 'Min_Deviation': 0.1, 'Stuck_Samples': 360, 'Max_Step': 5.0}
+}
+
+ANOMALY_TIMESTAMP_LIMIT = 20  # Rejected Sample Timestamps listed per File in the Diagnostics
+
+
+def find_Z_Score_Anomalies(values: np.ndarray, zScore: float, window: int, minDeviation: float) -> np.ndarray:
+    """
+    Rolling Z-Score of every Sample against the Mean / Standard Deviation of its Neighbours (Prefix Sums - One Pass).
+    The Window is centred and excludes the Sample, so a Level Change (Plant starting) is not a Spike.
+    Args:
+        values: Healthy Sample Values in File Order
+        zScore: Z-Score Limit
+        window: Neighbouring Samples (Centred)
+        minDeviation: Floor of the Standard Deviation
+    Returns:
+        bool Array - True where the Sample is a Spike (Samples with less than half a Window of Neighbours are not judged)
+    """
+    halfWindow = window // 2
+    centred = values - values.mean() if len(values) else values  # Smaller Prefix Sums (No Cancellation on large Readings)
+
+    valueSums = np.concatenate(([0.0], np.cumsum(centred)))
+    squareSums = np.concatenate(([0.0], np.cumsum(centred * centred)))
+    positions = np.arange(len(values))
+    windowStart = np.maximum(positions - halfWindow, 0)
+    windowStop = np.minimum(positions + halfWindow + 1, len(values))
+
+    neighbours = windowStop - windowStart - 1
+    neighbourMean = (valueSums[windowStop] - valueSums[windowStart] - centred) / np.maximum(neighbours, 1)
+    neighbourSquares = (squareSums[windowStop] - squareSums[windowStart] - centred * centred) / np.maximum(neighbours, 1)
+    deviation = np.maximum(np.sqrt(np.maximum(neighbourSquares - neighbourMean * neighbourMean, 0.0)), minDeviation)
+
+    return (neighbours >= halfWindow) & (np.abs(centred - neighbourMean) > zScore * deviation)
+
+
+def find_Stuck_Anomalies(values: np.ndarray, stuckSamples: int) -> np.ndarray:
+    """
+    Runs of identical non-zero Samples at least stuckSamples long (Flat-lined Sensor) - every Sample of the Run is flagged.
+    Args:
+        values: Healthy Sample Values in File Order
+        stuckSamples: Shortest Run counted as Stuck
+    Returns:
+        bool Array - True where the Sample belongs to a Stuck Run
+    """
+    if len(values) == 0:
+        return np.zeros(0, dtype=bool)
+
+    runBreaks = np.concatenate(([True], values[1:] != values[:-1]))
+    runIds = np.cumsum(runBreaks) - 1
+    runLengths = np.diff(np.append(np.flatnonzero(runBreaks), len(values)))
+
+    return (runLengths[runIds] >= stuckSamples) & (values != 0.0)
+
+
+def find_Step_Anomalies(values: np.ndarray, timestamps: np.ndarray, maxStep: float) -> np.ndarray:
+    """
+    Samples reached by a Change larger than maxStep per Minute from the previous Healthy Sample.
+    The Step back after a Single-Sample Spike (to within the Limit of the Sample before the Spike) is not flagged.
+    Args:
+        values: Healthy Sample Values in File Order
+        timestamps: Timestamps of the Samples (datetime64)
+        maxStep: Largest Change per Minute
+    Returns:
+        bool Array - True where the Sample follows an impossible Step
+    """
+    if len(values) < 2:
+        return np.zeros(len(values), dtype=bool)
+
+    minutes = timestamps.astype('datetime64[s]').astype(np.int64) / 60.0
+    steps = np.diff(values)
+    stepLimit = maxStep * np.maximum(np.diff(minutes), 1.0)
+    isStep = np.concatenate(([False], np.abs(steps) > stepLimit))
+
+    # Return from a Spike: Step in the opposite Direction of a flagged Step, landing within the Limit of the Sample before it
+    isReturn = np.zeros(len(values), dtype=bool)
+    isReturn[2:] = (isStep[1:-1] & (np.sign(steps[1:]) == -np.sign(steps[:-1]))
+                    & (np.abs(values[2:] - values[:-2]) <= maxStep * np.maximum(minutes[2:] - minutes[:-2], 1.0)))
+
+    return isStep & ~isReturn
+
+
+def find_Anomalies(timestamps: np.ndarray, values: np.ndarray, health: np.ndarray, channel: str, anomalyRules: dict = None) -> tuple:
+    """
+    Find the anomalous Samples of one parsed File. Only Healthy Samples are judged and used as Neighbours.
+    Args:
+        timestamps: Sample Timestamps (datetime64)
+        values: Sample Values
+        health: Sample Health Flags
+        channel: Channel of the File ('RT', 'RTH', 'FLOW', ...)
+        anomalyRules: Rules per Channel (Default: ANOMALY_RULES)
+    Returns:
+        Tuple of (bool Array - True where the Sample is anomalous, anomalyStatistics - Samples found per Rule, in total
+        and their first Timestamps)
+    """
+    if anomalyRules is None:
+        anomalyRules = ANOMALY_RULES
+    rules = anomalyRules.get(channel, {})
+
+    healthyRows = np.flatnonzero(health)
+    healthyValues = values[healthyRows]
+    ruleFlags = {}
+
+    if rules.get('Z_Score') is not None:
+        ruleFlags['z_score'] = find_Z_Score_Anomalies(healthyValues, rules['Z_Score'], rules['Window'], rules['Min_Deviation'])
+    if rules.get('Stuck_Samples') is not None:
+        ruleFlags['stuck'] = find_Stuck_Anomalies(healthyValues, rules['Stuck_Samples'])
+    if rules.get('Max_Step') is not None:
+        ruleFlags['rate_of_change'] = find_Step_Anomalies(healthyValues, timestamps[healthyRows], rules['Max_Step'])
+
+    isHealthyAnomaly = np.zeros(len(healthyRows), dtype=bool)
+    for flags in ruleFlags.values():
+        isHealthyAnomaly |= flags
+    anomalyRows = healthyRows[isHealthyAnomaly]
+
+    anomalyStatistics = {f'anomaly_{rule}': int(np.count_nonzero(flags)) for rule, flags in ruleFlags.items()}
+    anomalyStatistics['anomaly_data'] = len(anomalyRows)
+    anomalyStatistics['anomaly_timestamps'] = [str(timestamp).replace('T', ' ') for timestamp in timestamps[anomalyRows[:ANOMALY_TIMESTAMP_LIMIT]]]
+
+    isAnomaly = np.zeros(len(values), dtype=bool)
+    isAnomaly[anomalyRows] = True
+
+    return isAnomaly, anomalyStatistics
@@ -0,0 +1,247 @@
+# Project: Metering Data Parser
+# Description:
+# Main Program that executes the Metering Data Parsing for a Range of Months in one Run (Year-To-Date / Annual Reconciliation)
+# The Directory Index and the Meter Filter are read once, every (Month, Meter, Channel) is parsed by a Process Pool
+# and each Month is written as soon as its Files are parsed - followed by a consolidated Multi-Month Summary
+
+# Aurthor: Tristan Sim
+# Date: 19/10/2026
+# Version: 1.01
+# Changelog:
+# - Per-Month Block Data as compressed Columnar Files (Parquet / Feather / CSV.gz) - COLUMNAR_EXPORT_FORMATS
+# - Files of a Task are prefetched concurrently while the Worker parses (fetch_data.prefetch_Raw_Files)
+# - Tariff Rates and Public Holidays read from the Billing Configuration - Months of a Year without a complete Configuration are not billed
+# - Boundary Consumption written to the Analysis Report and the Billing Report of each Month
+
+import os
+import time
+import pandas as pd
+from multiprocessing import Pool, freeze_support
+
+# Import Custom Library
+import fetch_data
+import parse_data
+import analyze_data
+import export_data
+import rollup_data
+import month_state
+import billing_data
+
+# Configuration
+batchStartMonth = '2025-01'  # First Month of the Batch (YYYY-MM)
+batchEndMonth = '2025-10'    # Last Month of the Batch (YYYY-MM)
+pathDataFolder = r'C:\Repository\ControlSystems\Control Systems\Python\Metering Data Parser\data\PDD_BTUmeter'
+pathOutputFolder = r'C:\Repository\ControlSystems\Control Systems\Python\Metering Data Parser\data\Metering Summary Report'
+pathMeterFilterFile = r'C:\Repository\ControlSystems\Control Systems\Python\Metering Data Parser\filter\FilterList_CWSA.xlsx'
+
+NUM_WORKERS = 8
+EXPORT_EXCEL = True  # Per-Month Excel Workbook (Slowest Output - Disable for a quick Reconciliation)
+COLUMNAR_EXPORT_FORMATS = ['csv.gz']  # Per-Month Block Data: 'csv.gz', 'parquet' / 'feather' (Need pyarrow) ([] disables)
+
+btuNamePrefix = ["J_B_"]
+dataFilePrefix = "X01_01_"
+meterChannels = ['RT', 'RTH']
+
+
+def list_Batch_Months(startMonth: str, endMonth: str) -> list:
+    """
+    List every Month of the Batch.
+    Args:
+        startMonth: First Month ('2025-01')
+        endMonth: Last Month ('2025-12')
+    Returns:
+        List of (Month, Year) - [('01', '2025'), ('02', '2025'), ...]
+    """
+    return [(period.strftime('%m'), period.strftime('%Y')) for period in pd.period_range(startMonth, endMonth, freq='M')]
+
+
+def list_Batch_Tasks(directoryIndex: dict, batchMonths: list, channels: list) -> list:
+    """
+    One Parse Task per (Month, Meter, Channel) with Files in the Directory Index - ordered by Month.
+    Args:
+        directoryIndex: Directory Index (fetch_data.build_Directory_Index)
+        batchMonths: List of (Month, Year)
+        channels: Channels to load
+    Returns:
+        List of (Month, Year, Meter Name, Channel, List of File Paths)
+    """
+    batchTasks = []
+
+    for month, year in batchMonths:
+        for meterName in sorted(directoryIndex):
+            for channel in channels:
+                fileNames = [fileName for fileDate, fileName in directoryIndex[meterName].get(channel, [])
+                             if fileDate.startswith(year + month)]
+                if fileNames:
+                    batchTasks.append((month, year, meterName, channel,
+                                       [os.path.join(pathDataFolder, meterName, fileName) for fileName in fileNames]))
+
+    return batchTasks
+
+
+def parse_Batch_Task(batchTask: tuple) -> tuple:
+    """
+    Parse the Files of one (Month, Meter, Channel) - runs in a Worker Process.
+    Args:
+        batchTask: (Month, Year, Meter Name, Channel, List of File Paths)
+    Returns:
+        Tuple of (Month, Year, Meter Name, Channel, List of (timestamps, values, health, diagnosticStatistics) per File)
+    """
+    month, year, meterName, channel, filePaths = batchTask
+
+    parsedFiles = []
+    with fetch_data.prefetch_Raw_Files(filePaths):
+        for filePath in filePaths:
+            timestamps, values, health, diagnosticStatistics = fetch_data.read_Raw_Text_Arrays(filePath)
+            diagnosticStatistics['channel'] = channel
+            parsedFiles.append((timestamps, values, health, diagnosticStatistics))
+
+    return month, year, meterName, channel, parsedFiles
+
+
+def process_Batch_Month(month: str, year: str, parsedTasks: list, meterList: list, blockList: list, categoryMeters: list,
+                        previousState: dict, billingConfig: dict) -> tuple:
+    """
+    Build, analyze and write the Outputs of one Month from its parsed Tasks.
+    Args:
+        month: Target month
+        year: Target year
+        parsedTasks: Results of parse_Batch_Task for this Month
+        meterList: List of all meter names
+        blockList: List of all block numbers
+        categoryMeters: List of CWSA Meter Names
+        previousState: Month-End State of the previous Month
+        billingConfig: Billing Configuration (billing_data.load_Billing_Config)
+    Returns:
+        Tuple of (List of Block Summary Rows, Month-End State of this Month)
+    """
+    monthStart = time.time()
+    diagnoseStatsRegisters = []
+    blockDataFrames = {}
+    blockRollups = {}
+    monthEndState = {}
+    blockCharges = {}
+    monthBoundary = {}
+    monthSummary = []
+
+    billingProblems = billing_data.check_Billing_Config(billingConfig, year)
+    if billingProblems:
+        print(f"WARNING: Time-of-Use Billing skipped for {month}/{year} - {'; '.join(billingProblems)}")
+
+    # Step 2: Block DataFrames from the parsed Arrays
+    for block in blockList:
+        blockDataFrames[block] = parse_data.initialize_Block_DataFrame(month=month, year=year, blockNumber=block,
+                                                                       meterList=meterList, channels=meterChannels)
+
+    for _, _, meterName, channel, parsedFiles in parsedTasks:
+        block = meterName.split('_')[2]
+        for timestamps, values, health, diagnosticStatistics in parsedFiles:
+            diagnoseStatsRegisters.append(diagnosticStatistics)
+            blockDataFrames[block] = parse_data.merge_Meter_Arrays(blockDataFrames[block], timestamps, values, health,
+                                                                   meterName, channel, diagnosticStatistics)
+
+    for block in blockList:
+        blockRollups[block] = rollup_data.build_Block_Rollups(blockDataFrames[block], meterList, block)
+
+        # Step 2.5: Category Sums
+        blockDataFrames[block], categoryMask = parse_data.insert_Category_Sum_Columns(blockDataFrames[block], meterList,
+                                                                                      block, categoryMeters)
+
+        # Step 3: Block Statistics, Boundary Consumption and Charges
+        block_rt_stats = analyze_data.analyze_Block_RT_Data(blockDataFrames[block], meterList, block, includeFaultyData = True)
+        block_rth_stats = analyze_data.analyze_Block_RTH_Data(blockDataFrames[block], meterList, block)
+        block_boundary = month_state.analyze_Month_Boundary(blockDataFrames[block], meterList, block, previousState)
+        monthBoundary[block] = block_boundary
+        if not billingProblems:
+            blockCharges[block] = billing_data.compute_Block_Charges(blockDataFrames[block], meterList, block, categoryMask,
+                                                                     billingConfig, year, block_boundary)
+        monthEndState.update(month_state.build_Month_End_State(blockDataFrames[block], meterList, block, previousState))
+
+        for meter, meter_rth_stats in block_rth_stats['Individual_Meters'].items():
+            if meter_rth_stats['Reset_Events']:
+                diagnoseStatsRegisters.append({'meter': meter, 'rth_reset_events': meter_rth_stats['Reset_Events']})
+
+        monthSummary.append({
+            'Period': f"{year}-{month}",
+            'Block': block,
+            'Meters': block_rth_stats['Number_of_Meters'],
+            'RT_Totalized': block_rt_stats['Block_Totalized_Value'],
+            'RT_Data_Completeness': block_rt_stats['Block_Data_Completeness_Percentage'],
+            'RTH_Consumption': block_rth_stats['Block_Monthly_Consumption'],
+            'RTH_Boundary_Consumption': sum(stats['Boundary_Consumption'] for stats in block_boundary.values()),
+            'RTH_Reset_Events': block_rth_stats['Block_Reset_Events'],
+            'RTH_Data_Completeness': block_rth_stats['Block_Data_Completeness_Percentage'],
+            'Total_Charge': blockCharges[block]['Total_Charge'].sum() if block in blockCharges else None
+        })
+
+    # Step 4: Per-Month Outputs (Same Layout as metering_data_parser)
+    export_data.write_Analysis_Report(blockDataFrames, blockList, meterList, pathOutputFolder, month, year, analyze_data, monthBoundary)
+    if EXPORT_EXCEL:
+        export_data.write_DataFrames_to_Excel(blockDataFrames, blockList, pathOutputFolder, month, year, blockRollups)
+    if COLUMNAR_EXPORT_FORMATS:
+        export_data.write_DataFrames_to_Columnar(blockDataFrames, blockList, pathOutputFolder, month, year, COLUMNAR_EXPORT_FORMATS)
+    for block in blockList:
+        rollup_data.write_Block_Rollups(blockRollups[block], pathOutputFolder, block, month, year)
+    if blockCharges:
+        export_data.write_Billing_Report(blockCharges, pathOutputFolder, month, year)
+    month_state.write_Month_End_State(monthEndState, pathOutputFolder, month, year)
+    export_data.write_Diagnostic_Log(diagnoseStatsRegisters, pathOutputFolder, month, year, time.time() - monthStart)
+
+    return monthSummary, monthEndState
+
+
+def main():
+    """Main execution function - must be called from if __name__ == '__main__' block"""
+
+    start_time = time.time()
+    batchMonths = list_Batch_Months(batchStartMonth, batchEndMonth)
+
+    # Step 1: Directory Index and Meter Filter (Read once for the whole Batch)
+    print(f"\nStep 1: Index the Data Folder for {len(batchMonths)} Months ({batchStartMonth} to {batchEndMonth})")
+
+    directoryIndex = fetch_data.build_Directory_Index(pathDataFolder, btuNamePrefix, dataFilePrefix)
+    btuNameList = sorted(directoryIndex.keys())
+    btuBlockList = fetch_data.list_Meter_Blocks(nameList = btuNameList)
+
+    meterClassification = pd.read_excel(pathMeterFilterFile)
+    meterList_CWSA_Filter = meterClassification['Device Name'].dropna().tolist()
+    billingConfig = billing_data.load_Billing_Config(billing_data.billing_Config_Path(pathMeterFilterFile))
+
+    batchTasks = list_Batch_Tasks(directoryIndex, batchMonths, meterChannels)
+    print(f"Found {len(btuNameList)} Meters in {len(btuBlockList)} Blocks - {len(batchTasks)} (Month, Meter, Channel) Tasks")
+
+    # Step 2-4: Parse in the Process Pool, write each Month once all its Tasks are parsed (Tasks are ordered by Month)
+    print(f"\nStep 2-4: Parsing with {NUM_WORKERS} Workers...")
+
+    batchSummary = []
+    previousState = month_state.read_Month_End_State(pathOutputFolder, *month_state.previous_Month(*batchMonths[0]))
+    monthTasks = {monthYear: [] for monthYear in batchMonths}
+    remainingTasks = {monthYear: 0 for monthYear in batchMonths}
+    for batchTask in batchTasks:
+        remainingTasks[(batchTask[0], batchTask[1])] += 1
+
+    with Pool(processes=NUM_WORKERS) as pool:
+        parsedResults = pool.imap(parse_Batch_Task, batchTasks, chunksize=4)
+
+        for month, year in batchMonths:
+            while remainingTasks[(month, year)] > 0:
+                parsedTask = next(parsedResults)
+                monthTasks[(month, year)].append(parsedTask)
+                remainingTasks[(month, year)] -= 1
+
+            print(f"\nWriting {month}/{year} ({len(monthTasks[(month, year)])} Tasks)...")
+            monthSummary, previousState = process_Batch_Month(month, year, monthTasks.pop((month, year)), btuNameList,
+                                                              btuBlockList, meterList_CWSA_Filter, previousState,
+                                                              billingConfig)
+            batchSummary.extend(monthSummary)
+
+    # Step 5: Consolidated Multi-Month Summary
+    export_data.write_Batch_Summary(pd.DataFrame(batchSummary), pathOutputFolder, batchStartMonth, batchEndMonth)
+
+    runtime = time.time() - start_time
+    print(f"\nTotal Runtime: {runtime:.2f} seconds ({runtime/60:.2f} minutes)\n")
+
+
+if __name__ == '__main__':
+    freeze_support()
+    main()
@@ -0,0 +1,200 @@
+# Project: Metering Data Parser
+# File Type: Function File
+
+# Description: Billing Data
+# Contains the Time-of-Use Billing Engine - Tariff Bands, Public Holidays and per-Category Rates are applied to the
+# RTH Consumption of every Meter in a Block in one Matrix Pass (Consumption x Band One-hot Matrix)
+
+# Aurthor: Tristan Sim
+# Date: 19/10/2026
+# Version: 1.01
+# Changelog:
+# - Rates and Public Holidays are read from the Billing Configuration (JSON next to the Meter Filter Workbook) - no built-in Rates
+# - Boundary Consumption (Previous Month-End to the first Reading of the Month) reported per Meter in a Boundary_RTH Column
+
+import os
+import json
+import numpy as np
+import pandas as pd
+import parse_data
+import analyze_data
+
+# Time-of-Use Bands - First matching Band wins, Minutes not matched by any Band fall into DEFAULT_BAND
+# Days: 'weekday' (Mon-Fri), 'weekend' (Sat-Sun) or 'all' - Start/End: 'HH:MM' (End exclusive)
+TARIFF_BANDS = [
+    {'Band': 'Peak', 'Days': 'weekday', 'Start': '08:00', 'End': '18:00'},
+    {'Band': 'Shoulder', 'Days': 'weekday', 'Start': '18:00', 'End': '22:00'}
+]
+DEFAULT_BAND = 'Off-Peak'
+HOLIDAY_BAND = 'Off-Peak'  # Public Holidays are billed entirely in this Band
+
+# Billing Configuration - JSON File next to the Meter Filter Workbook (Contracted Rates change without a Code Change)
+# {"Tariff_Rates": {"CWSA": {"Peak": 0.25, "Shoulder": 0.20, "Off-Peak": 0.15}, "Retail": {...}},
+#  "Public_Holidays": {"2025": ["2025-01-01", "2025-01-29", ...]},
+#  "Tariff_Bands": [...]}  <- Optional (Default: TARIFF_BANDS)
+BILLING_CONFIG_FILE = 'Billing_Tariffs.json'
+
+
+def billing_Config_Path(meterFilterFile: str) -> str:
+    """
+    Path of the Billing Configuration next to the Meter Filter Workbook.
+    Args:
+        meterFilterFile: Path to the Meter Filter Workbook
+    Returns:
+        Path of BILLING_CONFIG_FILE in the Folder of the Workbook
+    """
+    return os.path.join(os.path.dirname(meterFilterFile), BILLING_CONFIG_FILE)
+
+
+def load_Billing_Config(configPath: str) -> dict:
+    """
+    Read the Billing Configuration (Rates per Category and Band, Public Holidays per Year, Tariff Bands).
+    Args:
+        configPath: Path of the JSON File (billing_Config_Path)
+    Returns:
+        Dictionary {'Tariff_Rates': {Category: {Band: Rate}}, 'Public_Holidays': {Year: ['YYYY-MM-DD', ...]},
+                    'Tariff_Bands': List of Band Definitions} - Empty Rates and Holidays when the File does not exist
+    """
+    billingConfig = {}
+    if os.path.exists(configPath):
+        with open(configPath, 'r', encoding='utf-8') as configFile:
+            billingConfig = json.load(configFile)
+
+    return {
+        'Tariff_Rates': billingConfig.get('Tariff_Rates', {}),
+        'Public_Holidays': {str(year): holidays for year, holidays in billingConfig.get('Public_Holidays', {}).items()},
+        'Tariff_Bands': billingConfig.get('Tariff_Bands', TARIFF_BANDS)
+    }
+
+
+def check_Billing_Config(billingConfig: dict, targetYear: str) -> list:
+    """
+    Problems that prevent billing a Month of targetYear - every Category needs a Rate for every Band, and the Year needs a
+    Holiday List (An empty List is a Year without Public Holidays).
+    Args:
+        billingConfig: Billing Configuration (load_Billing_Config)
+        targetYear: Target year ('2025')
+    Returns:
+        List of Problem Descriptions - Empty when the Month can be billed
+    """
+    billingProblems = []
+    bandNames = list_Tariff_Bands(billingConfig['Tariff_Bands'])
+
+    for category in parse_data.METER_CATEGORIES:
+        missingBands = [band for band in bandNames if billingConfig['Tariff_Rates'].get(category, {}).get(band) is None]
+        if missingBands:
+            billingProblems.append(f"No {category} Rate for {', '.join(missingBands)}")
+    if targetYear not in billingConfig['Public_Holidays']:
+        billingProblems.append(f"No Public Holiday List for {targetYear}")
+
+    return billingProblems
+
+
+def list_Tariff_Bands(tariffBands: list = None) -> list:
+    """
+    Band Names in Column Order of the Band Matrix (Configured Bands, then the Default and Holiday Band).
+    Args:
+        tariffBands: List of Band Definitions (Default: TARIFF_BANDS)
+    Returns:
+        List of unique Band Names
+    """
+    if tariffBands is None:
+        tariffBands = TARIFF_BANDS
+
+    bandNames = []
+    for bandName in [band['Band'] for band in tariffBands] + [DEFAULT_BAND, HOLIDAY_BAND]:
+        if bandName not in bandNames:
+            bandNames.append(bandName)
+    return bandNames
+
+
+def build_Band_Matrix(timestamps, publicHolidays: list, tariffBands: list = None) -> tuple:
+    """
+    One-hot Band Matrix of the Minute Grid (Minutes x Bands).
+    Args:
+        timestamps: Timestamps of the Block DataFrame ('2025-10-01 00:00:00')
+        publicHolidays: List of Public Holidays ('YYYY-MM-DD')
+        tariffBands: List of Band Definitions (Default: TARIFF_BANDS)
+    Returns:
+        Tuple of (Band Names, float64 Band Matrix)
+    """
+    if tariffBands is None:
+        tariffBands = TARIFF_BANDS
+
+    minutes = pd.to_datetime(pd.Series(timestamps)).to_numpy(dtype='datetime64[m]')
+    days = minutes.astype('datetime64[D]')
+    minuteOfDay = (minutes - days).astype('int64')
+    weekday = (days.astype('int64') + 3) % 7  # 1970-01-01 was a Thursday - 0 = Monday
+    holiday = np.isin(days, np.array(publicHolidays, dtype='datetime64[D]'))
+
+    bandNames = list_Tariff_Bands(tariffBands)
+    bandIndex = np.full(len(minutes), bandNames.index(DEFAULT_BAND))
+    unassigned = ~holiday
+
+    for band in tariffBands:
+        startMinute = int(band['Start'][:2]) * 60 + int(band['Start'][3:5])
+        endMinute = int(band['End'][:2]) * 60 + int(band['End'][3:5])
+        dayMatch = {'weekday': weekday < 5, 'weekend': weekday >= 5, 'all': np.ones(len(minutes), dtype=bool)}[band['Days']]
+        if startMinute <= endMinute:
+            timeMatch = (minuteOfDay >= startMinute) & (minuteOfDay < endMinute)
+        else:
+            timeMatch = (minuteOfDay >= startMinute) | (minuteOfDay < endMinute)  # Band across Midnight
+
+        matched = unassigned & dayMatch & timeMatch
+        bandIndex[matched] = bandNames.index(band['Band'])
+        unassigned &= ~matched
+
+    bandIndex[holiday] = bandNames.index(HOLIDAY_BAND)
+
+    bandMatrix = np.zeros((len(minutes), len(bandNames)))
+    bandMatrix[np.arange(len(minutes)), bandIndex] = 1.0
+    return bandNames, bandMatrix
+
+
+def compute_Block_Charges(blockDataFrame: pd.DataFrame, meterList: list, blockNumber: str, categoryMask: np.ndarray,
+                          billingConfig: dict, targetYear: str, monthBoundary: dict = None) -> pd.DataFrame:
+    """
+    Time-of-Use Charges of every Meter (Tenant) in a Block.
+    The RTH Consumption of each Step (Register Resets as 0, Rollovers wrapped) is billed in the Band of the Minute it was read.
+    Args:
+        blockDataFrame: DataFrame containing all meter data for the block
+        meterList: List of all meter names
+        blockNumber: Block number ('82')
+        categoryMask: One-hot Category Mask of the Block (parse_data.build_Category_Mask - Meter Order of meterList)
+        billingConfig: Billing Configuration (load_Billing_Config - checked with check_Billing_Config)
+        targetYear: Target year ('2025') - selects the Public Holiday List
+        monthBoundary: Boundary Statistics of the Block (month_state.analyze_Month_Boundary) - Default: No Boundary Column
+    Returns:
+        DataFrame with one row per Meter: Meter, Category, {Band}_RTH, {Band}_Charge, Total_RTH, Total_Charge and
+        Boundary_RTH (Consumption between the previous Month-End and the first Reading - not in a Band, not charged)
+    """
+    tariffRates = billingConfig['Tariff_Rates']
+
+    meters_in_block = [meter for meter in meterList if meter.split('_')[2] == blockNumber]
+    bandNames, bandMatrix = build_Band_Matrix(blockDataFrame['timestamp'], billingConfig['Public_Holidays'][targetYear],
+                                              billingConfig['Tariff_Bands'])
+
+    # Consumption per Meter and Band (Meters x Bands)
+    rthMatrix = blockDataFrame[[f'{meter}_RTH' for meter in meters_in_block]].to_numpy(dtype='float64')
+    consumptionMatrix = analyze_data.build_RTH_Step_Matrix(rthMatrix)['Consumption']
+    bandConsumption = consumptionMatrix.T @ bandMatrix
+
+    # Rate per Meter and Band (Category Mask x Category Rates)
+    rateMatrix = categoryMask @ np.array([[tariffRates[category][band] for band in bandNames]
+                                          for category in parse_data.METER_CATEGORIES])
+    bandCharges = bandConsumption * rateMatrix
+
+    blockCharges = pd.DataFrame({
+        'Meter': meters_in_block,
+        'Category': np.array(parse_data.METER_CATEGORIES)[categoryMask.argmax(axis=1)]
+    })
+    for column, band in enumerate(bandNames):
+        blockCharges[f'{band}_RTH'] = bandConsumption[:, column].round(parse_data.METER_DECIMALS)
+        blockCharges[f'{band}_Charge'] = bandCharges[:, column].round(2)
+    blockCharges['Total_RTH'] = bandConsumption.sum(axis=1).round(parse_data.METER_DECIMALS)
+    blockCharges['Total_Charge'] = bandCharges.sum(axis=1).round(2)
+    if monthBoundary is not None:
+        blockCharges['Boundary_RTH'] = np.round([monthBoundary.get(meter, {}).get('Boundary_Consumption', 0.0) for meter in meters_in_block],
+                                                parse_data.METER_DECIMALS)
+
+    return blockCharges
@@ -0,0 +1,336 @@
+# Project: Metering Data Parser
+# File Type: Function File
+
+# Description: Excel Package
+# Contains Functions that render the Sheets of the Metering Report in separate Worker Processes and assemble the
+# rendered Sheet Parts into one .xlsx Package (Summary Sheet first) - Same Layout and Styles as export_data.write_DataFrames_to_Excel
+
+# Aurthor: Tristan Sim
+# Date: 19/10/2026
+# Version: 1.01
+# Changelog:
+# - Block Sheets are rendered without the Health Bitmask Columns
+
+import os
+import re
+import shutil
+import zipfile
+import tempfile
+from multiprocessing import Pool
+import pandas as pd
+import openpyxl
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, Alignment, PatternFill
+import parse_data
+
+# Cell Styles of the Report - primed in this fixed Order in every Worker, so every Sheet Part refers to the same
+# Style Index for the same Style (Index 0 is the unstyled Default)
+HEADER_FONT = Font(bold=True, color="FFFFFF")
+CENTER_ALIGNMENT = Alignment(horizontal="center", vertical="center")
+REPORT_CELL_STYLES = {
+    'Header Light': (HEADER_FONT, PatternFill(start_color="003B76", end_color="003B76", fill_type="solid")),  # Summary Block Headers (Even Blocks)
+    'Header': (HEADER_FONT, PatternFill(start_color="00153E", end_color="00153E", fill_type="solid")),        # Sheet Headers (Dark Navy)
+    'Data Dark': (None, PatternFill(start_color="CCDAEC", end_color="CCDAEC", fill_type="solid")),           # Summary Timestamps / Odd Blocks
+    'Data': (None, PatternFill(start_color="DAEEF3", end_color="DAEEF3", fill_type="solid")),                # Data Cells
+    'Computed': (None, PatternFill(start_color="B8CCE4", end_color="B8CCE4", fill_type="solid"))             # Computed Columns (Category Sums)
+}
+COMPUTED_COLUMNS = range(3, 8)  # Columns D to H of a Block Sheet (Category Sums and Meter Counts)
+BLOCK_COLUMN_WIDTH = 22.5
+SUMMARY_COLUMN_WIDTH = 18.5
+
+SPREADSHEET_NAMESPACE = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+RELATIONSHIP_NAMESPACE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+WORKSHEET_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"
+COMMON_PACKAGE_PARTS = ['_rels/.rels', 'docProps/app.xml', 'docProps/core.xml', 'xl/theme/theme1.xml', 'xl/styles.xml']
+
+
+def create_Styled_Cell(worksheet, value, styleName: str = None) -> WriteOnlyCell:
+    """
+    Write-only Cell with one of the Report Cell Styles.
+    Args:
+        worksheet: Write-only Worksheet
+        value: Cell Value
+        styleName: Name in REPORT_CELL_STYLES (None: Default Style)
+    Returns:
+        WriteOnlyCell
+    """
+    cell = WriteOnlyCell(worksheet, value)
+    if styleName is not None:
+        font, fill = REPORT_CELL_STYLES[styleName]
+        if font is not None:
+            cell.font = font
+        cell.fill = fill
+        cell.alignment = CENTER_ALIGNMENT
+    return cell
+
+
+def prime_Report_Styles(worksheet):
+    """
+    Register every Report Cell Style in the Workbook in the fixed Order of REPORT_CELL_STYLES.
+    Args:
+        worksheet: Write-only Worksheet of the Part Workbook
+    """
+    for styleName in REPORT_CELL_STYLES:
+        create_Styled_Cell(worksheet, None, styleName).style_id  # Reading the Style Index registers the Cell Style
+
+
+def build_Cell_Rows(worksheet, columns: list, columnStyles: list):
+    """
+    Rows of Styled Cells from Column Arrays (NaN written as empty Cells).
+    Args:
+        worksheet: Write-only Worksheet
+        columns: List of Column Arrays (Equal Length)
+        columnStyles: Style Name of each Column (None: Default Style)
+    Returns:
+        Generator of Cell Rows
+    """
+    columnValues = [pd.Series(column).astype(object).where(pd.notna(column), None).tolist() for column in columns]
+
+    for rowValues in zip(*columnValues):
+        yield [create_Styled_Cell(worksheet, value, styleName) for value, styleName in zip(rowValues, columnStyles)]
+
+
+def render_Block_Sheet(worksheet, blockDataFrame: pd.DataFrame):
+    """
+    Block Sheet - Row 1 blank, Header in Row 2, Computed Columns highlighted.
+    Args:
+        worksheet: Write-only Worksheet
+        blockDataFrame: Block DataFrame (with the Category Sum Columns - Health Columns are not rendered)
+    """
+    blockDataFrame = parse_data.restore_Float64_Precision(parse_data.drop_Health_Columns(blockDataFrame))
+
+    for i in range(1, len(blockDataFrame.columns) + 1):
+        worksheet.column_dimensions[openpyxl.utils.get_column_letter(i)].width = BLOCK_COLUMN_WIDTH
+
+    worksheet.append([])
+    worksheet.append([create_Styled_Cell(worksheet, column, 'Header') for column in blockDataFrame.columns])
+
+    columnStyles = ['Computed' if i in COMPUTED_COLUMNS else 'Data' for i in range(len(blockDataFrame.columns))]
+    for row in build_Cell_Rows(worksheet, [blockDataFrame[column].to_numpy() for column in blockDataFrame.columns], columnStyles):
+        worksheet.append(row)
+
+
+def render_Summary_Sheet(worksheet, summaryColumns: dict, blockList: list) -> list:
+    """
+    Summary Sheet - Merged Block Headers in Row 2, Column Headers in Row 3, Category Sums of every Block from Row 4.
+    Args:
+        worksheet: Write-only Worksheet
+        summaryColumns: {'timestamp', 'date', 'time': Arrays of the first Block, Block: (Total, CWSA, Retail RT Sum Arrays)}
+        blockList: List of block numbers
+    Returns:
+        List of Merged Cell Ranges ('D2:F2')
+    """
+    numberOfColumns = 3 + 3 * len(blockList)
+    for i in range(1, numberOfColumns + 1):
+        worksheet.column_dimensions[openpyxl.utils.get_column_letter(i)].width = SUMMARY_COLUMN_WIDTH
+
+    # Alternating Block Colours (Even Blocks: Light Header / Light Data)
+    headerStyles = ['Header Light' if idx % 2 == 0 else 'Header' for idx in range(len(blockList))]
+    dataStyles = ['Data' if idx % 2 == 0 else 'Data Dark' for idx in range(len(blockList))]
+
+    blockHeaderRow = [None, None, None]
+    columnHeaderRow = [create_Styled_Cell(worksheet, title, 'Header') for title in ['Timestamp', 'Date', 'Time']]
+    mergedRanges = []
+    for idx, block in enumerate(blockList):
+        startColumn = 4 + 3 * idx
+        blockHeaderRow += [create_Styled_Cell(worksheet, f"Block {block}", headerStyles[idx]), None, None]
+        columnHeaderRow += [create_Styled_Cell(worksheet, title, headerStyles[idx]) for title in ['Total RT Sum', 'CWSA RT Sum', 'Retail RT Sum']]
+        mergedRanges.append(f"{openpyxl.utils.get_column_letter(startColumn)}2:{openpyxl.utils.get_column_letter(startColumn + 2)}2")
+
+    worksheet.append([])
+    worksheet.append(blockHeaderRow)
+    worksheet.append(columnHeaderRow)
+
+    columns = [summaryColumns['timestamp'], summaryColumns['date'], summaryColumns['time']]
+    columnStyles = ['Data Dark'] * 3
+    for idx, block in enumerate(blockList):
+        columns += list(summaryColumns[block])
+        columnStyles += [dataStyles[idx]] * 3
+
+    for row in build_Cell_Rows(worksheet, columns, columnStyles):
+        worksheet.append(row)
+
+    return mergedRanges
+
+
+def render_Daily_Sheet(worksheet, dailyDataFrame: pd.DataFrame):
+    """
+    Daily Sheet - Header in Row 1, unstyled Data (Same Design as export_data.write_Daily_Rollup_Sheet).
+    Args:
+        worksheet: Write-only Worksheet
+        dailyDataFrame: Daily Block Totals (One Column per Block and Statistic)
+    """
+    for i in range(1, len(dailyDataFrame.columns) + 1):
+        worksheet.column_dimensions[openpyxl.utils.get_column_letter(i)].width = BLOCK_COLUMN_WIDTH
+
+    worksheet.append([create_Styled_Cell(worksheet, column, 'Header') for column in dailyDataFrame.columns])
+    for row in build_Cell_Rows(worksheet, [dailyDataFrame[column].to_numpy() for column in dailyDataFrame.columns],
+                               [None] * len(dailyDataFrame.columns)):
+        worksheet.append(row)
+
+
+def convert_Shared_Strings(sheetXml: str, sharedStringsXml: str) -> str:
+    """
+    Replace Shared String References of a Sheet with Inline Strings (every Part has its own Shared String Table).
+    Args:
+        sheetXml: Worksheet XML
+        sharedStringsXml: Shared String Table XML of the same Part
+    Returns:
+        Worksheet XML without Shared String References
+    """
+    # Inner XML of every String Item (<t> or Rich Text Runs) - already escaped, copied as is
+    sharedStrings = re.findall(r'<si>(.*?)</si>', sharedStringsXml, flags=re.DOTALL)
+
+    return re.sub(r'<c ([^>]*?)t="s"([^>]*)><v>(\d+)</v></c>',
+                  lambda match: f'<c {match.group(1)}t="inlineStr"{match.group(2)}><is>{sharedStrings[int(match.group(3))]}</is></c>',
+                  sheetXml)
+
+
+def render_Sheet_Part(sheetTask: tuple) -> tuple:
+    """
+    Render one Sheet as a Part in a Worker Process.
+    The Sheet XML is written to the Part Folder with Inline Strings and its Merged Cells, ready to be copied into the Package.
+    Args:
+        sheetTask: (Part Index, Sheet Kind 'block' / 'summary' / 'daily', Sheet Title, Sheet Data, Part Folder)
+    Returns:
+        Tuple of (Part Index, Path of the Part Workbook, Path of the Sheet XML, Styles XML of the Part)
+    """
+    partIndex, sheetKind, sheetTitle, sheetData, partFolder = sheetTask
+
+    workbook = openpyxl.Workbook(write_only=True)
+    worksheet = workbook.create_sheet(sheetTitle)
+    prime_Report_Styles(worksheet)
+
+    mergedRanges = []
+    if sheetKind == 'block':
+        render_Block_Sheet(worksheet, sheetData)
+    elif sheetKind == 'summary':
+        mergedRanges = render_Summary_Sheet(worksheet, *sheetData)
+    else:
+        render_Daily_Sheet(worksheet, sheetData)
+
+    partPath = os.path.join(partFolder, f"part{partIndex}.xlsx")
+    workbook.save(partPath)
+
+    with zipfile.ZipFile(partPath, 'r') as partFile:
+        sheetXml = partFile.read('xl/worksheets/sheet1.xml').decode('utf-8')
+        stylesXml = partFile.read('xl/styles.xml')
+        if 'xl/sharedStrings.xml' in partFile.namelist():
+            sheetXml = convert_Shared_Strings(sheetXml, partFile.read('xl/sharedStrings.xml').decode('utf-8'))
+
+    # Merged Cells follow the Sheet Data (Write-only Worksheets cannot merge Cells)
+    if mergedRanges:
+        mergeXml = ''.join(f'<mergeCell ref="{mergedRange}" />' for mergedRange in mergedRanges)
+        sheetXml = sheetXml.replace('</sheetData>', f'</sheetData><mergeCells count="{len(mergedRanges)}">{mergeXml}</mergeCells>', 1)
+
+    sheetPath = os.path.join(partFolder, f"sheet{partIndex}.xml")
+    with open(sheetPath, 'w', encoding='utf-8') as sheetFile:
+        sheetFile.write(sheetXml)
+
+    return partIndex, partPath, sheetPath, stylesXml
+
+
+def assemble_Package(renderedParts: list, sheetTitles: list, outputPath: str):
+    """
+    Assemble the rendered Sheet Parts into one .xlsx Package (Sheets in Part Order).
+    Args:
+        renderedParts: Results of render_Sheet_Part in Part Order
+        sheetTitles: Sheet Title of each Part
+        outputPath: Path of the .xlsx File
+    """
+    # Priming makes the Styles of every Part identical - a different Part would carry wrong Style Indices
+    stylesXml = renderedParts[0][3]
+    if any(part[3] != stylesXml for part in renderedParts):
+        raise ValueError("Sheet Parts have different Styles - every Cell Style must be listed in REPORT_CELL_STYLES")
+
+    numberOfSheets = len(renderedParts)
+    sheetsXml = ''.join(f'<sheet name="{title}" sheetId="{i}" state="visible" r:id="rId{i}" />'
+                        for i, title in enumerate(sheetTitles, start=1))
+    workbookXml = (f'<workbook xmlns="{SPREADSHEET_NAMESPACE}" xmlns:r="{RELATIONSHIP_NAMESPACE}"><workbookPr />'
+                   f'<bookViews><workbookView activeTab="0" /></bookViews><sheets>{sheetsXml}</sheets>'
+                   f'<calcPr calcId="124519" fullCalcOnLoad="1" /></workbook>')
+
+    relationshipsXml = ''.join(f'<Relationship Type="{RELATIONSHIP_NAMESPACE}/worksheet" Target="/xl/worksheets/sheet{i}.xml" Id="rId{i}" />'
+                               for i in range(1, numberOfSheets + 1))
+    relationshipsXml += (f'<Relationship Type="{RELATIONSHIP_NAMESPACE}/styles" Target="styles.xml" Id="rId{numberOfSheets + 1}" />'
+                         f'<Relationship Type="{RELATIONSHIP_NAMESPACE}/theme" Target="theme/theme1.xml" Id="rId{numberOfSheets + 2}" />')
+    workbookRelationshipsXml = f'<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">{relationshipsXml}</Relationships>'
+
+    with zipfile.ZipFile(renderedParts[0][1], 'r') as firstPart:
+        contentTypesXml = firstPart.read('[Content_Types].xml').decode('utf-8')
+        commonParts = {name: firstPart.read(name) for name in COMMON_PACKAGE_PARTS}
+
+    # Content Types of the first Part with one Worksheet Override per Sheet (no Shared String Table in the Package)
+    contentTypesXml = re.sub(r'<Override PartName="/xl/(worksheets/sheet\d+|sharedStrings)\.xml"[^>]*/>', '', contentTypesXml)
+    worksheetOverrides = ''.join(f'<Override PartName="/xl/worksheets/sheet{i}.xml" ContentType="{WORKSHEET_CONTENT_TYPE}" />'
+                                 for i in range(1, numberOfSheets + 1))
+    contentTypesXml = contentTypesXml.replace('</Types>', f'{worksheetOverrides}</Types>')
+
+    with zipfile.ZipFile(outputPath, 'w', compression=zipfile.ZIP_DEFLATED) as package:
+        package.writestr('[Content_Types].xml', contentTypesXml)
+        for name, content in commonParts.items():
+            package.writestr(name, content)
+        package.writestr('xl/workbook.xml', workbookXml)
+        package.writestr('xl/_rels/workbook.xml.rels', workbookRelationshipsXml)
+        for i, part in enumerate(renderedParts, start=1):
+            package.write(part[2], f'xl/worksheets/sheet{i}.xml')
+
+
+def build_Daily_DataFrame(blockRollups: dict, blockList: list) -> pd.DataFrame:
+    """
+    Daily Block Totals (RT Sum, RT Max and RTH Consumption) of every Block - Columns of the 'Daily' Sheet.
+    Args:
+        blockRollups: Dictionary of Block Rollups (rollup_data.build_Block_Rollups)
+        blockList: List of block numbers
+    Returns:
+        DataFrame with one row per Day (None without Rollups)
+    """
+    dailyDataFrame = None
+    for block in blockList:
+        blockDaily = blockRollups[block]['daily']['block']
+        blockColumns = pd.DataFrame({
+            'Date': blockDaily['Period'],
+            f'Block {block} RT Sum': blockDaily['RT_Sum'].round(3),
+            f'Block {block} RT Max': blockDaily['RT_Max'].round(3),
+            f'Block {block} RTH Consumption': blockDaily['RTH_Delta'].round(3)
+        })
+        dailyDataFrame = blockColumns if dailyDataFrame is None else dailyDataFrame.merge(blockColumns, on='Date', how='outer')
+
+    return dailyDataFrame
+
+
+def write_Excel_Package(blockDataFrames: dict, blockList: list, outputPath: str, blockRollups: dict = None,
+                        numberOfWorkers: int = None) -> str:
+    """
+    Render every Sheet of the Metering Report in its own Worker Process and assemble them into one Workbook.
+    Sheet Order: Summary, one Sheet per Block, Daily (when Rollups are given).
+    Args:
+        blockDataFrames: Dictionary of block DataFrames (with the Category Sum Columns)
+        blockList: List of block numbers
+        outputPath: Path of the .xlsx File
+        blockRollups: Dictionary of Block Rollups - Adds the 'Daily' sheet when given
+        numberOfWorkers: Worker Processes (Default: CPU Count)
+    Returns:
+        Path of the .xlsx File
+    """
+    # Summary Columns: Timestamps of the first Block, Category Sums (Columns 4-6) of every Block
+    firstDataFrame = blockDataFrames[blockList[0]]
+    summaryColumns = {name: firstDataFrame.iloc[:, i].to_numpy() for i, name in enumerate(['timestamp', 'date', 'time'])}
+    for block in blockList:
+        summaryColumns[block] = tuple(blockDataFrames[block].iloc[:, i].to_numpy() for i in range(3, 6))
+
+    partFolder = tempfile.mkdtemp(prefix='excel_parts_', dir=os.path.dirname(outputPath))
+    sheetTasks = [(0, 'summary', 'Summary', (summaryColumns, blockList), partFolder)]
+    sheetTasks += [(i, 'block', f'Block {block}', df, partFolder) for i, (block, df) in enumerate(blockDataFrames.items(), start=1)]
+    if blockRollups:
+        sheetTasks.append((len(sheetTasks), 'daily', 'Daily', build_Daily_DataFrame(blockRollups, blockList), partFolder))
+
+    try:
+        with Pool(processes=min(numberOfWorkers or os.cpu_count() or 1, len(sheetTasks))) as pool:
+            renderedParts = sorted(pool.imap_unordered(render_Sheet_Part, sheetTasks), key=lambda part: part[0])
+
+        assemble_Package(renderedParts, [task[2] for task in sheetTasks], outputPath)
+    finally:
+        shutil.rmtree(partFolder, ignore_errors=True)
+
+    return outputPath
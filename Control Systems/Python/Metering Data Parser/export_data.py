@@ -4,11 +4,33 @@ import os
 from datetime import datetime
 import pandas as pd
 from openpyxl.styles import Font, Alignment, PatternFill
+from openpyxl.formatting.rule import ColorScaleRule
 import openpyxl
+import parse_data
+import excel_package
+
+try:
+    import pyarrow  # Optional: Parquet / Feather Export
+except ImportError:
+    pyarrow = None
+
+try:
+    from matplotlib.figure import Figure  # Optional: Data-Quality Heatmap Image
+except ImportError:
+    Figure = None
+
+# Columnar Block Data: File Extension per Format ('parquet' and 'feather' need pyarrow - 'csv.gz' always works)
+COLUMNAR_FILE_EXTENSIONS = {'parquet': '.parquet', 'feather': '.feather', 'csv.gz': '.csv.gz'}
+COLUMNAR_COMPRESSION = 'zstd'
+COLUMNAR_DERIVED_COLUMNS = ['date', 'time']  # Derivable from the timestamp - not stored in Parquet / Feather
+
+# Data-Quality Heatmap: Completeness % Colour Scale (Red 0% - Yellow 50% - Green 100%)
+QUALITY_COLOR_SCALE = ColorScaleRule(start_type='num', start_value=0, start_color='F8696B', mid_type='num', mid_value=50,
+                                     mid_color='FFEB84', end_type='num', end_value=100, end_color='63BE7B')
 
 def write_Analysis_Report(blockDataFrames: dict, blockList: list, meterList: list, 
                           outputPath: str, targetMonth: str, targetYear: str,
-                          analyze_data_module):
+                          analyze_data_module, monthBoundary: dict = None):
     """
     Generate complete analysis report and save to text file.
     
@@ -20,6 +42,7 @@ def write_Analysis_Report(blockDataFrames: dict, blockList: list, meterList: lis
         targetMonth: Target month
         targetYear: Target year
         analyze_data_module: Reference to analyze_data module for analysis functions
+        monthBoundary: Dictionary of Block Number to Boundary Statistics (month_state.analyze_Month_Boundary) - Optional
     """
     
     # Create output file path
@@ -42,21 +65,14 @@ def write_Analysis_Report(blockDataFrames: dict, blockList: list, meterList: lis
         # Process all blocks and meters
         for block in blockList:
             
-            # Find all meters in this block
-            meters_in_block = [meter for meter in meterList if meter.split('_')[2] == block]
-            
             # Analyze block-level statistics
             block_rt_stats = analyze_data_module.analyze_Block_RT_Data(blockDataFrames[block], meterList, block)
             block_rth_stats = analyze_data_module.analyze_Block_RTH_Data(blockDataFrames[block], meterList, block)
             
             # Write block summary
             write_Block_Statistics(report_file, block, block_rt_stats, block_rth_stats)
-            
-            # Write individual meter statistics
-            for meter in meters_in_block:
-                rt_stats = analyze_data_module.analyze_Meter_RT_Data(blockDataFrames[block], meter)
-                rth_stats = analyze_data_module.analyze_Meter_RTH_Data(blockDataFrames[block], meter)
-                # write_Meter_Statistics(report_file, meter, rt_stats, rth_stats)
+            if monthBoundary and monthBoundary.get(block):
+                write_Boundary_Statistics(report_file, block_rth_stats, monthBoundary[block])
         
         # Write footer
         report_file.write("\n" + "="*80 + "\n")
@@ -84,6 +100,10 @@ def write_Meter_Statistics(file, meter_name: str, rt_stats: dict, rth_stats: dic
     
     file.write(f"\n--- RTH Statistics ---\n")
     file.write(f"  Monthly Consumption:    {rth_stats['Monthly_Consumption']:>15,.4f}  (BILLING)\n")
+    if rth_stats['Reset_Events']:
+        file.write(f"  Last - First (Raw):     {rth_stats['Monthly_Consumption_Raw']:>15,.4f}\n")
+        for event in rth_stats['Reset_Events']:
+            file.write(f"  Register {event['Type']:<9}      {event['Timestamp']}  {event['Previous_RTH']:,.4f} -> {event['RTH']:,.4f}\n")
     file.write(f"  Totalized Value:        {rth_stats['Totalized_Value']:>15,.4f}\n")
     file.write(f"  First Value:            {rth_stats['First_Healthy_RTH_ProcessValue']:>15,.4f}\n")
     file.write(f"  First Timestamp:        {rth_stats['First_Healthy_RTH_Timestamp']:>15}\n")
@@ -94,6 +114,19 @@ def write_Meter_Statistics(file, meter_name: str, rt_stats: dict, rth_stats: dic
     file.write(f"  Data Completeness:      {rth_stats['Data_Completeness_Percentage']:>15,.2f}%\n")
 
 
+def write_Boundary_Statistics(file, block_rth_stats: dict, block_boundary: dict):
+    """Write the Boundary Consumption of a Block (Previous Month-End to the first Healthy RTH of this Month) to file (internal helper)."""
+    
+    boundaryConsumption = sum(stats['Boundary_Consumption'] for stats in block_boundary.values())
+    
+    file.write(f"\n--- Month Boundary ---\n")
+    file.write(f"  Boundary Consumption:   {boundaryConsumption:>15,.4f}  ({len(block_boundary)} Meters with previous Month State)\n")
+    file.write(f"  Monthly + Boundary:     {block_rth_stats['Block_Monthly_Consumption'] + boundaryConsumption:>15,.4f}\n")
+    for meter, stats in block_boundary.items():
+        note = "  (Register Reset)" if stats['Boundary_Reset'] else ""
+        file.write(f"  {meter:<22}  {stats['Boundary_Consumption']:>15,.4f}{note}\n")
+
+
 def write_Block_Statistics(file, block_number: str, block_rt_stats: dict, block_rth_stats: dict):
     """Write block statistics to file (internal helper)."""
     
@@ -111,11 +144,13 @@ def write_Block_Statistics(file, block_number: str, block_rt_stats: dict, block_
     file.write(f"\n--- Block RTH Statistics ---\n")
     file.write(f"  Number of Meters:       {block_rth_stats['Number_of_Meters']:>15}\n")
     file.write(f"  Monthly Consumption:    {block_rth_stats['Block_Monthly_Consumption']:>15,.4f}  (BILLING)\n")
+    file.write(f"  Register Resets:        {block_rth_stats['Block_Reset_Events']:>15}\n")
     file.write(f"  Block Totalized Value:  {block_rth_stats['Block_Totalized_Value']:>15,.4f}\n")
     file.write(f"  Data Completeness:      {block_rth_stats['Block_Data_Completeness_Percentage']:>15,.2f}%\n")
 
 
-def write_DataFrames_to_Excel(blockDataFrames: dict, blockList: list, outputPath: str, targetMonth: str, targetYear: str):
+def write_DataFrames_to_Excel(blockDataFrames: dict, blockList: list, outputPath: str, targetMonth: str, targetYear: str,
+                              blockRollups: dict = None):
     """
     Export block DataFrames to Excel file with each block as a separate sheet.
     
@@ -125,6 +160,7 @@ def write_DataFrames_to_Excel(blockDataFrames: dict, blockList: list, outputPath
         outputPath: Path to output folder
         targetMonth: Target month
         targetYear: Target year
+        blockRollups: Dictionary of Block Rollups (rollup_data.build_Block_Rollups) - Adds a 'Daily' sheet when given
     """
     
     # Create output file path
@@ -140,6 +176,7 @@ def write_DataFrames_to_Excel(blockDataFrames: dict, blockList: list, outputPath
         # Write each block DataFrame to a separate sheet
         for block, df in blockDataFrames.items():
             sheet_name = f'Block {block}'
+            df = parse_data.restore_Float64_Precision(parse_data.drop_Health_Columns(df))
             
             # Write DataFrame starting from row 2 (leave row 1 blank)
             df.to_excel(writer, sheet_name=sheet_name, index=False, startrow=1)
@@ -272,11 +309,351 @@ def write_DataFrames_to_Excel(blockDataFrames: dict, blockList: list, outputPath
         # Set column widths for summary sheet
         for i in range(1, col_index):
             summary_sheet.column_dimensions[openpyxl.utils.get_column_letter(i)].width = 18.5
+
+        # Daily Sheet (Built from the Rollups - no rescan of the Minute Data)
+        if blockRollups:
+            write_Daily_Rollup_Sheet(writer, blockRollups, blockList)
         
     print(f"\nDataFrames exported to Excel: {full_output_path}")
     return full_output_path
 
 
+def write_DataFrames_to_Excel_Parallel(blockDataFrames: dict, blockList: list, outputPath: str, targetMonth: str, targetYear: str,
+                                       blockRollups: dict = None, numberOfWorkers: int = None):
+    """
+    Export block DataFrames to the same Excel file as write_DataFrames_to_Excel, rendering every sheet in its own process.
+    
+    Args:
+        blockDataFrames: Dictionary of block DataFrames
+        blockList: List of block numbers
+        outputPath: Path to output folder
+        targetMonth: Target month
+        targetYear: Target year
+        blockRollups: Dictionary of Block Rollups (rollup_data.build_Block_Rollups) - Adds a 'Daily' sheet when given
+        numberOfWorkers: Worker Processes (Default: CPU Count)
+    """
+    
+    # Create output file path
+    output_filename = f"Metering_Report_{targetMonth}_{targetYear}.xlsx"
+    full_output_path = os.path.join(outputPath, "Reports", output_filename)
+    
+    # Ensure output directory exists
+    os.makedirs(os.path.join(outputPath, "Reports"), exist_ok=True)
+    
+    # Summary, Block and Daily Sheets rendered in parallel, then assembled into one Workbook (Summary first)
+    excel_package.write_Excel_Package(blockDataFrames, blockList, full_output_path, blockRollups, numberOfWorkers)
+    
+    print(f"\nDataFrames exported to Excel: {full_output_path}")
+    return full_output_path
+
+
+def build_Columnar_Block(blockDataFrame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Block DataFrame with per-Column dtypes for Parquet / Feather (No Conversion to Text).
+    Args:
+        blockDataFrame: Block DataFrame
+    Returns:
+        DataFrame with a datetime64 timestamp, without the derived date / time Columns -
+        Channel (float32 / float64) and Health (uint16) Columns keep their Storage dtype
+    """
+    columnarBlock = blockDataFrame.drop(columns=[column for column in COLUMNAR_DERIVED_COLUMNS if column in blockDataFrame.columns])
+    columnarBlock['timestamp'] = pd.to_datetime(columnarBlock['timestamp'], format='%Y-%m-%d %H:%M:%S')
+    return columnarBlock.reset_index(drop=True)
+
+
+def columnar_Block_Path(outputPath: str, blockNumber: str, targetMonth: str, targetYear: str, fileFormat: str) -> str:
+    """
+    Path of the Columnar Block Data - partitioned like the Rollups (Block Data/Year=YYYY/Month=MM/Block=NN).
+    Args:
+        outputPath: Path to output folder
+        blockNumber: Block number
+        targetMonth: Target month
+        targetYear: Target year
+        fileFormat: 'parquet', 'feather' or 'csv.gz'
+    Returns:
+        File Path
+    """
+    partitionFolder = os.path.join(outputPath, "Block Data", f"Year={targetYear}", f"Month={targetMonth}", f"Block={blockNumber}")
+    return os.path.join(partitionFolder, f"Block_{blockNumber}_{targetMonth}_{targetYear}{COLUMNAR_FILE_EXTENSIONS[fileFormat]}")
+
+
+def write_Block_Columnar(blockDataFrame: pd.DataFrame, blockNumber: str, outputPath: str, targetMonth: str, targetYear: str,
+                         fileFormats: list) -> list:
+    """
+    Export one Block DataFrame to compressed Columnar / CSV Files (Machine-readable Alternative to the Excel Sheet).
+    Args:
+        blockDataFrame: Block DataFrame
+        blockNumber: Block number
+        outputPath: Path to output folder
+        targetMonth: Target month
+        targetYear: Target year
+        fileFormats: List of Formats ('parquet', 'feather', 'csv.gz') - Parquet / Feather fall back to 'csv.gz' without pyarrow
+    Returns:
+        List of written File Paths
+    """
+    for fileFormat in fileFormats:
+        if fileFormat not in COLUMNAR_FILE_EXTENSIONS:
+            raise ValueError(f"Unknown Columnar Format: {fileFormat} (Formats: {', '.join(COLUMNAR_FILE_EXTENSIONS)})")
+
+    if pyarrow is None and any(fileFormat != 'csv.gz' for fileFormat in fileFormats):
+        print(f"Warning: pyarrow is not installed - Block {blockNumber} written as csv.gz instead of {', '.join(fileFormats)}")
+        fileFormats = ['csv.gz']
+
+    writtenFiles = []
+    for fileFormat in dict.fromkeys(fileFormats):
+        filePath = columnar_Block_Path(outputPath, blockNumber, targetMonth, targetYear, fileFormat)
+        os.makedirs(os.path.dirname(filePath), exist_ok=True)
+
+        if fileFormat == 'parquet':
+            build_Columnar_Block(blockDataFrame).to_parquet(filePath, engine='pyarrow', compression=COLUMNAR_COMPRESSION, index=False)
+        elif fileFormat == 'feather':
+            build_Columnar_Block(blockDataFrame).to_feather(filePath, compression=COLUMNAR_COMPRESSION)
+        else:
+            # Text Format: float32 Columns restored to the Meter Precision (Same Values as the Excel Sheet)
+            parse_data.restore_Float64_Precision(blockDataFrame).to_csv(filePath, index=False, compression='gzip')
+
+        writtenFiles.append(filePath)
+
+    return writtenFiles
+
+
+def write_DataFrames_to_Columnar(blockDataFrames: dict, blockList: list, outputPath: str, targetMonth: str, targetYear: str,
+                                 fileFormats: list) -> list:
+    """
+    Export block DataFrames to Columnar Files - one Partition per Block and Month.
+    
+    Args:
+        blockDataFrames: Dictionary of block DataFrames
+        blockList: List of block numbers
+        outputPath: Path to output folder
+        targetMonth: Target month
+        targetYear: Target year
+        fileFormats: List of Formats ('parquet', 'feather', 'csv.gz')
+    Returns:
+        List of written File Paths
+    """
+    writtenFiles = []
+    for block in blockList:
+        writtenFiles.extend(write_Block_Columnar(blockDataFrames[block], block, outputPath, targetMonth, targetYear, fileFormats))
+
+    print(f"\nBlock data saved to: {os.path.join(outputPath, 'Block Data', f'Year={targetYear}', f'Month={targetMonth}')}")
+    return writtenFiles
+
+
+def write_Daily_Rollup_Sheet(writer, blockRollups: dict, blockList: list):
+    """
+    Write the Daily Block Totals (RT Sum, RT Max and RTH Consumption) as a 'Daily' sheet.
+    
+    Args:
+        writer: Open pandas ExcelWriter (openpyxl engine)
+        blockRollups: Dictionary of Block Rollups (rollup_data.build_Block_Rollups)
+        blockList: List of block numbers
+    """
+    
+    daily_df = excel_package.build_Daily_DataFrame(blockRollups, blockList)
+
+    if daily_df is None:
+        return
+
+    daily_df.to_excel(writer, sheet_name='Daily', index=False)
+
+    # Customize Sheet Header and Column Widths (Same Design as the Block Sheets)
+    worksheet = writer.sheets['Daily']
+    header_fill = PatternFill(start_color="00153E", end_color="00153E", fill_type="solid")
+    header_font = Font(bold=True, color="FFFFFF")
+    alignment = Alignment(horizontal="center", vertical="center")
+
+    for cell in worksheet[1]:
+        cell.fill = header_fill
+        cell.font = header_font
+        cell.alignment = alignment
+
+    for i in range(1, worksheet.max_column + 1):
+        worksheet.column_dimensions[openpyxl.utils.get_column_letter(i)].width = 22.5
+
+
+def write_Year_To_Date_Summary(yearToDate: pd.DataFrame, outputPath: str, targetMonth: str, targetYear: str):
+    """
+    Write the Year-To-Date Summary (rollup_data.summarize_Year_To_Date) to a text file.
+    
+    Args:
+        yearToDate: Year-To-Date Summary DataFrame
+        outputPath: Path to output folder
+        targetMonth: Last month included in the Summary
+        targetYear: Target year
+    """
+    
+    output_filename = f"Year_To_Date_Summary_{targetMonth}_{targetYear}.txt"
+    full_output_path = os.path.join(outputPath, "Reports", output_filename)
+    os.makedirs(os.path.join(outputPath, "Reports"), exist_ok=True)
+    
+    with open(full_output_path, 'w') as report_file:
+        report_file.write("="*80 + "\n")
+        report_file.write(f"YEAR-TO-DATE SUMMARY\n")
+        report_file.write(f"Period: 01/{targetYear} - {targetMonth}/{targetYear}\n")
+        report_file.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        report_file.write("="*80 + "\n\n")
+        
+        for row in yearToDate.itertuples(index=False):
+            report_file.write(f"{row.Meter}:\n")
+            report_file.write(f"  Months Included:        {row.Months:>15}\n")
+            report_file.write(f"  RT Totalized Value:     {row.RT_Sum:>15,.4f}\n")
+            report_file.write(f"  RT Healthy Data Points: {row.RT_Healthy_Count:>15,}\n")
+            report_file.write(f"  RTH Consumption:        {row.RTH_Delta:>15,.4f}  (BILLING)\n\n")
+    
+    print(f"\nYear-to-date summary saved to: {full_output_path}")
+    return full_output_path
+
+
+def write_Billing_Report(blockCharges: dict, outputPath: str, targetMonth: str, targetYear: str):
+    """
+    Write the Time-of-Use Charges (billing_data.compute_Block_Charges) to an Excel file - one Sheet per Block and a District Sheet.
+    
+    Args:
+        blockCharges: Dictionary of Block Number to Charges DataFrame
+        outputPath: Path to output folder
+        targetMonth: Target month
+        targetYear: Target year
+    """
+    
+    output_filename = f"Billing_Report_{targetMonth}_{targetYear}.xlsx"
+    full_output_path = os.path.join(outputPath, "Reports", output_filename)
+    os.makedirs(os.path.join(outputPath, "Reports"), exist_ok=True)
+    
+    with pd.ExcelWriter(full_output_path, engine='openpyxl') as writer:
+        districtCharges = pd.concat([charges.assign(Block=block) for block, charges in blockCharges.items()], ignore_index=True)
+        districtCharges.insert(0, 'Block', districtCharges.pop('Block'))
+        districtCharges.to_excel(writer, sheet_name='District', index=False)
+        
+        for block, charges in blockCharges.items():
+            charges.to_excel(writer, sheet_name=f'Block {block}', index=False)
+        
+        # Column Width for Easy Readability
+        for worksheet in writer.sheets.values():
+            for column_cells in worksheet.columns:
+                worksheet.column_dimensions[column_cells[0].column_letter].width = max(14, len(str(column_cells[0].value)) + 2)
+                column_cells[0].font = Font(bold=True)
+    
+    print(f"\nBilling report saved to: {full_output_path}")
+    return full_output_path
+
+
+def write_Quality_Heatmap_Image(completeness: pd.DataFrame, filePath: str) -> str:
+    """
+    Render a Completeness Matrix as a Heatmap Image (Meters x Periods, Red 0% - Green 100%).
+    
+    Args:
+        completeness: Completeness Matrix (quality_data.build_District_Completeness)
+        filePath: Path of the Image (.png)
+    Returns:
+        File Path, or None when matplotlib is not installed
+    """
+    
+    if Figure is None:
+        print("Warning: matplotlib is not installed - Data-Quality Heatmap Image skipped (The Report Sheets hold the same Matrix)")
+        return None
+    
+    figure = Figure(figsize=(max(6.0, 0.3 * completeness.shape[1] + 3.0), max(3.0, 0.25 * completeness.shape[0] + 1.5)))
+    axes = figure.add_subplot()
+    image = axes.imshow(completeness.to_numpy() * 100, aspect='auto', cmap='RdYlGn', vmin=0, vmax=100, interpolation='nearest')
+    axes.set_xticks(range(completeness.shape[1]), [str(label) for label in completeness.columns], fontsize=7, rotation=90)
+    axes.set_yticks(range(completeness.shape[0]), list(completeness.index), fontsize=7)
+    figure.colorbar(image, ax=axes, label='Completeness %')
+    figure.savefig(filePath, dpi=120, bbox_inches='tight')
+    
+    return filePath
+
+
+def write_Data_Quality_Report(qualityReport: dict, outputPath: str, targetMonth: str, targetYear: str, heatmapImage: bool = True):
+    """
+    Write the Data-Quality Report (quality_data.build_Quality_Report) to an Excel file - Meter Summary, Correlated Outages
+    and one Colour-scaled Completeness Sheet per Resolution, with an optional Heatmap Image of the Daily Matrix.
+    
+    Args:
+        qualityReport: Data-Quality Report Dictionary
+        outputPath: Path to output folder
+        targetMonth: Target month
+        targetYear: Target year
+        heatmapImage: Also write the Heatmap as a .png (Needs matplotlib)
+    """
+    
+    output_filename = f"Data_Quality_Report_{targetMonth}_{targetYear}.xlsx"
+    full_output_path = os.path.join(outputPath, "Reports", output_filename)
+    os.makedirs(os.path.join(outputPath, "Reports"), exist_ok=True)
+    
+    header_font = Font(bold=True)
+    
+    with pd.ExcelWriter(full_output_path, engine='openpyxl') as writer:
+        qualityReport['Meter_Summary'].to_excel(writer, sheet_name='Summary', index=False)
+        qualityReport['Correlated_Outages'].to_excel(writer, sheet_name='Correlated Outages', index=False)
+        
+        # Column Width for Easy Readability
+        for worksheet in writer.sheets.values():
+            for column_cells in worksheet.columns:
+                worksheet.column_dimensions[column_cells[0].column_letter].width = max(14, len(str(column_cells[0].value)) + 2)
+                column_cells[0].font = header_font
+        
+        # Completeness Matrices in % - the Colour Scale turns each Sheet into a Heatmap (Narrow Columns, vertical Period Labels)
+        for resolution, completeness in qualityReport['Completeness'].items():
+            sheet_name = f"{resolution.capitalize()} Completeness"
+            (completeness * 100).round(1).to_excel(writer, sheet_name=sheet_name)
+            
+            worksheet = writer.sheets[sheet_name]
+            worksheet.freeze_panes = 'B2'
+            worksheet.column_dimensions['A'].width = 18
+            for column_index in range(2, worksheet.max_column + 1):
+                worksheet.column_dimensions[openpyxl.utils.get_column_letter(column_index)].width = 5
+                worksheet.cell(row=1, column=column_index).alignment = Alignment(text_rotation=90, horizontal="center")
+            
+            if completeness.size:
+                worksheet.conditional_formatting.add(f"B2:{openpyxl.utils.get_column_letter(worksheet.max_column)}{worksheet.max_row}",
+                                                     QUALITY_COLOR_SCALE)
+    
+    print(f"\nData-quality report saved to: {full_output_path}")
+    
+    if heatmapImage and qualityReport['Completeness']:
+        image_resolution = 'daily' if 'daily' in qualityReport['Completeness'] else next(iter(qualityReport['Completeness']))
+        image_path = os.path.join(outputPath, "Reports", f"Data_Quality_Heatmap_{targetMonth}_{targetYear}.png")
+        if write_Quality_Heatmap_Image(qualityReport['Completeness'][image_resolution], image_path):
+            print(f"Data-quality heatmap saved to: {image_path}")
+    
+    return full_output_path
+
+
+def write_Batch_Summary(batchSummary: pd.DataFrame, outputPath: str, startMonth: str, endMonth: str):
+    """
+    Write the consolidated Multi-Month Summary of a Batch Run (batch_metering_data_parser) to an Excel file.
+    
+    Args:
+        batchSummary: DataFrame with one row per Month and Block
+        outputPath: Path to output folder
+        startMonth: First Month of the Batch ('2025-01')
+        endMonth: Last Month of the Batch ('2025-12')
+    """
+    
+    output_filename = f"Batch_Summary_{startMonth}_{endMonth}.xlsx"
+    full_output_path = os.path.join(outputPath, "Reports", output_filename)
+    os.makedirs(os.path.join(outputPath, "Reports"), exist_ok=True)
+    
+    sumColumns = ['RT_Totalized', 'RTH_Consumption', 'RTH_Boundary_Consumption', 'RTH_Reset_Events', 'Total_Charge']
+    monthTotals = batchSummary.groupby('Period', as_index=False)[sumColumns].sum()
+    blockTotals = batchSummary.groupby('Block', as_index=False)[sumColumns].sum()
+    
+    with pd.ExcelWriter(full_output_path, engine='openpyxl') as writer:
+        monthTotals.to_excel(writer, sheet_name='District by Month', index=False)
+        blockTotals.to_excel(writer, sheet_name='Block Totals', index=False)
+        batchSummary.to_excel(writer, sheet_name='Block by Month', index=False)
+        
+        # Column Width for Easy Readability
+        for worksheet in writer.sheets.values():
+            for column_cells in worksheet.columns:
+                worksheet.column_dimensions[column_cells[0].column_letter].width = max(14, len(str(column_cells[0].value)) + 2)
+                column_cells[0].font = Font(bold=True)
+    
+    print(f"\nBatch summary saved to: {full_output_path}")
+    return full_output_path
+
+
 def write_Diagnostic_Log(diagnosticsList: list, outputPath: str, targetMonth: str, targetYear: str, runtime: float):
     """
     Write diagnostic statistics to a text file in raw format.
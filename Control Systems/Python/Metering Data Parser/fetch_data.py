@@ -7,16 +7,255 @@
 
 # Aurthor: Tristan Sim
 # Date: 8/11/2025
-# Version: 1.01
+# Version: 1.10
 # Changelog: 
+# - Directory Index - One Scan of every Meter Folder, Files grouped by Channel and Date
+# - Fast Array Parser - All Six BTU Channels parsed into numpy Arrays (Vectorized Timestamp Conversion)
+# - Byte-Range Parallel Parser for large Files - #start/#stop Health State reconciled across Range Boundaries
+# - Compressed Archives (.gz / .zip) are listed, indexed and parsed as Streams (No Decompression to Disk)
+# - Content Fingerprint - Byte-identical Files (SCADA Re-Exports) reuse the parsed Arrays and are reported as Duplicates
+# - pandas / numpy are imported by the Parsing Functions only - Folder and File Listing starts without them (metering_cli)
+# - Async Prefetch - File Contents are read concurrently (asyncio, bounded) while the previous Files are parsed (Network Shares)
+# - Memory-mapped Parser - Newline Offsets and fixed-width Fields decoded with numpy (No per-Line Strings), Day Offset Index
+# - Duplicate Files are returned in the Diagnostics of each Read (No Module-level Record kept across Months / Runs)
+# - Fast Array Parser accepts non-padded Date / Time Fields again (Memory-mapped Parser hands such Files to parse_Raw_Lines)
+# - Lines with an invalid Timestamp take no Part in the Health State (Negative Values, #start Recovery, #stop Failure) as in read_Raw_Text_Data
+# - Day Range Reader - Only the Byte Range of the requested Days is parsed (Health State before the Range from its last Health Event)
 
 # Input Dependencies: Execution Month & Year (Variable) - Default (System Clock subtracted to Previous Months)
-import pandas as pd
-import numpy as np
 import os
+import io
+import queue
+import asyncio
+import hashlib
+import threading
+import mmap
+import gzip
+import zipfile
+import multiprocessing
+from contextlib import contextmanager
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from typing import List, Tuple
 import datetime
 
+# File Name Postfix of each Channel (Raw Text Files)
+CHANNEL_POSTFIX = {
+    'RT': 'BTUREADINGS11MIN.txt',
+    'RTH': 'ACCBTUReadingS11MIN.txt',
+    'FLOW': 'FLOWS11MIN.txt',
+    'TSUPPLY': 'TEMPS1SUPPLY1MIN.txt',
+    'TRETURN': 'TEMPS1RETURN1MIN.txt',
+    'TDELTA': 'TEMPDeltaS11MIN.txt'
+}
+
+DATETIME_START_INDEX = 7 # Datetime starts from the 7th Character in the File Name ("X01_01_20251001_...")
+
+# Compressed Archives - "X01_01_20251001_70_01_BTUREADINGS11MIN.txt.gz" is matched as its uncompressed Name
+COMPRESSION_SUFFIXES = ('.gz', '.zip')
+
+# Content Fingerprint of raw Files (Re-Exports with a new Modified Time or File Name are recognized)
+# - full: Hash of every Byte (Block Hash - far faster than parsing, safe against in-place Corrections)
+# - sample: Hash of the File Size, the first and the last FINGERPRINT_SAMPLE_BYTES (Constant Cost for huge Archives)
+FINGERPRINT_MODE = 'full'
+FINGERPRINT_BLOCK_BYTES = 1024 * 1024
+FINGERPRINT_SAMPLE_BYTES = 64 * 1024
+
+# Parsed File Cache (Default Encoding and Health Check): Fingerprint -> (timestamps, values, health, diagnosticStatistics, File Path parsed first)
+PARSED_FILE_CACHE_SIZE = 512
+parsedFileCache = OrderedDict()
+
+# Byte-Range Parallel Parsing of large Files (Yearly Archives, High-Rate Meters)
+PARALLEL_PARSE_MIN_BYTES = 32 * 1024 * 1024    # Smaller Files are parsed by one Process
+PARALLEL_PARSE_RANGE_BYTES = 8 * 1024 * 1024   # Minimum Size of one Byte Range
+
+# Async Prefetch of raw Files (Latency-bound Network Shares) - Files are read ahead while the previous Files are parsed
+PREFETCH_CONCURRENT_READS = 16  # Files read at the same Time (0 disables the Prefetch)
+PREFETCH_BUFFER_FILES = 64      # Files read ahead of the Parser (Bounds the Memory of the Prefetch)
+PREFETCH_KEEP_CONSUMED = 4      # Consumed Files kept for a second Read (Fingerprint, then Parse)
+activePrefetch = None           # State of the running prefetch_Raw_Files (Main Process only)
+
+# Memory-mapped Parser (parse_Raw_Buffer) - Files in other Encodings or with irregular Lines use the Text Parser
+MMAP_PARSER = True
+MMAP_ENCODINGS = ('utf-8', 'ascii', 'latin-1', 'cp1252', 'iso-8859-1')  # ASCII-compatible - Bytes below 0x80 are the Characters
+MMAP_VALUE_WIDTH = 24   # Widest Value Field decoded as a Matrix (Wider Fields are decoded by float())
+NEWLINE_BYTE = ord('\n')
+CARRIAGE_RETURN_BYTE = ord('\r')
+WHITESPACE_BYTES = b' \t\n\x0b\x0c\r\x1c\x1d\x1e\x1f'  # ASCII Whitespace of str.split() / str.strip()
+LINE_BOUNDARY_BYTES = b'\x0b\x0c\x1c\x1d\x1e'  # Line Breaks of str.splitlines() only - left to the Text Parser
+TIMESTAMP_DIGIT_POSITIONS = [0, 1, 3, 4, 6, 7, 8, 9, 11, 12, 14, 15, 17, 18]  # "DD.MM.YYYY HH:MM:SS"
+
+
+def strip_Compression_Suffix(fileName: str) -> str:
+    """
+    File Name without its Compression Suffix ("...BTUREADINGS11MIN.txt.gz" -> "...BTUREADINGS11MIN.txt").
+    Args:
+        fileName: File name
+    Returns:
+        Uncompressed File name
+    """
+    for suffix in COMPRESSION_SUFFIXES:
+        if fileName.endswith(suffix):
+            return fileName[:-len(suffix)]
+    return fileName
+
+
+def is_Compressed(filePath: str) -> bool:
+    """Check whether a raw file is a Compressed Archive (.gz / .zip)."""
+    return filePath.endswith(COMPRESSION_SUFFIXES)
+
+
+def select_Raw_Files(fileNames: List[str]) -> List[str]:
+    """
+    Drop Compressed Copies of Files that also exist uncompressed (A Month being archived holds both).
+    Args:
+        fileNames: List of File names in one Folder
+    Returns:
+        List of File names - one per uncompressed Name
+    """
+    selectedFiles = {}
+    for fileName in sorted(fileNames, key=is_Compressed, reverse=True):
+        selectedFiles[strip_Compression_Suffix(fileName)] = fileName  # Uncompressed File is written last and wins
+    return list(selectedFiles.values())
+
+
+@contextmanager
+def open_Raw_File(filePath: str, encoding: str = 'utf-8'):
+    """
+    Open a raw file as a Text Stream - .gz and .zip Archives are decompressed on the fly.
+    A .zip Archive is read from its Member named like the Archive (Default: its first Member).
+    Files read ahead by prefetch_Raw_Files are served from Memory.
+    Args:
+        filePath: Full path to the raw file
+        encoding: File encoding (Default: 'utf-8')
+    Yields:
+        Text Stream of the raw Lines
+    """
+    rawBytes = lookup_Prefetched_File(filePath)
+    rawSource = io.BytesIO(rawBytes) if rawBytes is not None else filePath
+
+    if filePath.endswith('.gz'):
+        with gzip.open(rawSource, 'rt', encoding=encoding) as textFile:
+            yield textFile
+    elif filePath.endswith('.zip'):
+        with zipfile.ZipFile(rawSource) as archive:
+            memberNames = archive.namelist()
+            memberName = os.path.basename(strip_Compression_Suffix(filePath))
+            with archive.open(memberName if memberName in memberNames else memberNames[0]) as member:
+                yield io.TextIOWrapper(member, encoding=encoding)
+    elif rawBytes is not None:
+        yield io.TextIOWrapper(rawSource, encoding=encoding)
+    else:
+        with open(filePath, 'r', encoding=encoding) as textFile:
+            yield textFile
+
+
+def read_Raw_Bytes(filePath: str) -> bytes:
+    """
+    Read the Bytes of a raw file for the Prefetch - Files parsed in Byte Ranges are left to the Range Workers.
+    Args:
+        filePath: Full path to the raw file
+    Returns:
+        File Bytes, or None when the File is large enough for the Byte-Range Parser
+    """
+    with open(filePath, 'rb') as rawFile:
+        if os.fstat(rawFile.fileno()).st_size >= PARALLEL_PARSE_MIN_BYTES and not is_Compressed(filePath):
+            return None
+        return rawFile.read()
+
+
+async def prefetch_Files_Async(filePaths: List[str], readyQueue: queue.Queue, concurrentReads: int, stopEvent: threading.Event):
+    """
+    Read Files concurrently in Path Order - at most concurrentReads Reads (and Queue Puts) are in flight.
+    Args:
+        filePaths: Files in the Order the Parser reads them
+        readyQueue: Bounded Queue of (File Path, Bytes or None) to the Parser
+        concurrentReads: Semaphore Size
+        stopEvent: Set when the Parser leaves the Prefetch (Remaining Files are not read)
+    """
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=concurrentReads, thread_name_prefix='prefetch'))
+    readSemaphore = asyncio.Semaphore(concurrentReads)
+
+    async def prefetch_File(filePath: str):
+        async with readSemaphore:
+            rawBytes = None
+            if not stopEvent.is_set():
+                try:
+                    rawBytes = await asyncio.to_thread(read_Raw_Bytes, filePath)
+                except OSError:
+                    rawBytes = None  # Read again by the Parser - the Error is raised there
+            await asyncio.to_thread(readyQueue.put, (filePath, rawBytes))
+
+    await asyncio.gather(*(prefetch_File(filePath) for filePath in filePaths))
+
+
+@contextmanager
+def prefetch_Raw_Files(filePaths: List[str], concurrentReads: int = PREFETCH_CONCURRENT_READS, bufferFiles: int = PREFETCH_BUFFER_FILES):
+    """
+    Read raw Files ahead of the Parser - an asyncio Reader in a Background Thread reads up to concurrentReads Files at once
+    and hands them to the Parser through a bounded Queue, so Parsing overlaps the I/O Wait of the next Files.
+    Readers inside the Block (read_Raw_Text_Data, read_Raw_Text_Arrays, fingerprint_Raw_File) are served from Memory.
+    Args:
+        filePaths: Files in the Order the Parser reads them
+        concurrentReads: Files read at the same Time (0 disables the Prefetch)
+        bufferFiles: Files read ahead of the Parser
+    """
+    global activePrefetch
+
+    if concurrentReads <= 0 or not filePaths or activePrefetch is not None:
+        yield
+        return
+
+    readyQueue = queue.Queue(maxsize=bufferFiles)
+    stopEvent = threading.Event()
+    prefetchThread = threading.Thread(target=asyncio.run, name='prefetch_Raw_Files', daemon=True,
+                                      args=(prefetch_Files_Async(list(filePaths), readyQueue, concurrentReads, stopEvent),))
+    activePrefetch = {'Process': os.getpid(), 'Queue': readyQueue, 'Pending': set(filePaths), 'Ready': {}, 'Consumed': OrderedDict()}
+    prefetchThread.start()
+
+    try:
+        yield
+    finally:
+        # Unblock the Reader (Files not consumed are discarded) and wait for it to finish
+        stopEvent.set()
+        activePrefetch = None
+        while prefetchThread.is_alive():
+            try:
+                readyQueue.get(timeout=0.1)
+            except queue.Empty:
+                pass
+
+
+def lookup_Prefetched_File(filePath: str) -> bytes:
+    """
+    Bytes of a File read by the running Prefetch - waits for the Reader when the File is still pending.
+    Args:
+        filePath: Full path to the raw file
+    Returns:
+        File Bytes, or None when the File is not prefetched (Read from Disk)
+    """
+    prefetch = activePrefetch
+    if prefetch is None or prefetch['Process'] != os.getpid():
+        return None
+
+    if filePath in prefetch['Consumed']:
+        prefetch['Consumed'].move_to_end(filePath)
+        return prefetch['Consumed'][filePath]
+    if filePath not in prefetch['Pending']:
+        return None
+
+    while filePath not in prefetch['Ready']:
+        readyPath, rawBytes = prefetch['Queue'].get()
+        prefetch['Ready'][readyPath] = rawBytes
+
+    prefetch['Pending'].discard(filePath)
+    prefetch['Consumed'][filePath] = prefetch['Ready'].pop(filePath)
+    if len(prefetch['Consumed']) > PREFETCH_KEEP_CONSUMED:
+        prefetch['Consumed'].popitem(last=False)
+
+    return prefetch['Consumed'][filePath]
+
+
 # Function: List Folder Names
 # Fetch All Folder Name of Each BTU Meter matching the given prefixes  and Store it in List 
 def list_Folder_Names(folderPath: str, namePrefix: List[str], debugFlag: bool) -> List[str]:
@@ -71,14 +310,50 @@ def list_File_Names(parentFolderPath: str, childFolderNames: List[str], prefix:
         # Iterate through to retrieve the File Names and store them in a List for easy referencing
         if os.path.exists(concatBTUFolderPath): 
 
-            for file in os.listdir(concatBTUFolderPath): 
+            for file in select_Raw_Files(os.listdir(concatBTUFolderPath)): 
                 # Check if the Date of the File Meets the Target Data and Classify based on File Post Fix Text
-                if file.startswith(prefix) and file.endswith(postfix):
+                if file.startswith(prefix) and strip_Compression_Suffix(file).endswith(postfix):
                     fileNames.append(folderName + delimiter + file)
 
     return sorted(fileNames)
                
 
+def build_Directory_Index(folderPath: str, namePrefix: List[str], filePrefix: str, channelPostfix: dict = None) -> dict:
+    """
+    Scan every Meter Folder once and index its Files by Channel and File Date.
+    Args:
+        folderPath: Path to the Parent data folder
+        namePrefix: List of valid Meter Folder Name Prefixes
+        filePrefix: File name prefix to match ("X01_01_" for every Month or "X01_01_202510" for one Month)
+        channelPostfix: Dictionary of Channel to File Postfix (Default: CHANNEL_POSTFIX)
+    Returns:
+        Dictionary of Meter Name to {Channel: Sorted List of (File Date 'YYYYMMDD', File Name)}
+    """
+    if channelPostfix is None:
+        channelPostfix = CHANNEL_POSTFIX
+
+    directoryIndex = {}
+
+    for meterName in list_Folder_Names(folderPath, namePrefix, debugFlag=False):
+        meterIndex = {channel: [] for channel in channelPostfix}
+
+        with os.scandir(os.path.join(folderPath, meterName)) as entries:
+            folderFiles = select_Raw_Files([entry.name for entry in entries if entry.name.startswith(filePrefix)])
+
+        for fileName in folderFiles:
+            for channel, postfix in channelPostfix.items():
+                if strip_Compression_Suffix(fileName).endswith(postfix):
+                    fileDate = fileName[DATETIME_START_INDEX:DATETIME_START_INDEX + 8]
+                    meterIndex[channel].append((fileDate, fileName))
+                    break
+
+        for channel in meterIndex:
+            meterIndex[channel].sort()
+        directoryIndex[meterName] = meterIndex
+
+    return directoryIndex
+
+
 def read_Raw_Text_Data(filePath: str, encoding: str = 'utf-8', healthCheck: bool = True, debugFlag: bool = False) -> tuple:
     """
     Read raw BTU meter text data and parse into list of dictionaries.
@@ -93,6 +368,8 @@ def read_Raw_Text_Data(filePath: str, encoding: str = 'utf-8', healthCheck: bool
         - rawData: List of dictionaries with keys: Timestamp, Value, Health
         - diagnosticStatistics: Dictionary with parsing statistics
     """
+    import pandas as pd
+
     rawData = []
     lineCount = 0
     sensorHealth = True # Default as healthy (assume data starts healthy unless we see #stop first)
@@ -105,7 +382,7 @@ def read_Raw_Text_Data(filePath: str, encoding: str = 'utf-8', healthCheck: bool
     meterName = os.path.basename(os.path.dirname(filePath)) if os.path.dirname(filePath) else "Unknown"
     fileName = os.path.basename(filePath)
     
-    with open(filePath, 'r', encoding=encoding) as textFile:
+    with open_Raw_File(filePath, encoding) as textFile:
         
         for line in textFile:
 
@@ -213,6 +490,866 @@ def read_Raw_Text_Data(filePath: str, encoding: str = 'utf-8', healthCheck: bool
     return rawData, diagnosticStatistics
 
 
+def is_Valid_Timestamp_String(timestampString: str) -> bool:
+    """
+    Check a "01.10.2025 00:00:00" String with the Format of read_Raw_Text_Data (Used for the few Lines that change the Health State).
+    Args:
+        timestampString: Timestamp String
+    Returns:
+        True when the String is a valid Date and Time
+    """
+    try:
+        datetime.datetime.strptime(timestampString, "%d.%m.%Y %H:%M:%S")
+        return True
+    except ValueError:
+        return False
+
+
+def parse_Raw_Lines(lines, healthCheck: bool = True, sensorHealth: bool = True) -> dict:
+    """
+    Parse raw BTU meter lines into column lists (Same Rules as read_Raw_Text_Data, without per-line Timestamp Conversion).
+    Args:
+        lines: Iterable of raw text lines
+        healthCheck: Whether to check for #start/#stop health markers (default: True)
+        sensorHealth: Health State at the first line (default: True - Healthy)
+    Returns:
+        Dictionary containing:
+        - timestamp_strings: List of "01.10.2025 00:00:00" strings
+        - values: List of process values (0.0 when Unhealthy)
+        - health: List of Health flags
+        - failure_index: Index of the last healthy datapoint before each #stop
+        - recovery_index: Index of the first healthy datapoint after each #start
+        - line_count, corrupted_data_lines: Line statistics
+        - end_health: Health State after the last line
+        - end_pending_start: A #start Marker is still waiting for its first Healthy datapoint
+        - first_event_row, leading_stops: Used to reconcile the Health State between Byte Ranges (parse_Raw_Byte_Range)
+    """
+    timestampStrings = []
+    values = []
+    health = []
+    failureIndex = []
+    recoveryIndex = []
+    lineCount = 0
+    corruptedDataLines = 0
+    pendingStartMarker = False
+    firstEventRow = None  # Rows parsed before the first Health Event (#start / #stop / Negative Value)
+    leadingStops = 0      # #stop Markers before the first Data Row
+
+    for line in lines:
+
+        line = line.strip()
+        lineCount += 1
+
+        if healthCheck:
+            if line == '#stop':
+                # Failure at the last Row with a valid Timestamp (Rows with invalid Timestamps are dropped by build_Raw_Arrays)
+                lastValidRow = len(health) - 1
+                while lastValidRow >= 0 and not is_Valid_Timestamp_String(timestampStrings[lastValidRow]):
+                    lastValidRow -= 1
+                if lastValidRow >= 0 and health[lastValidRow]:
+                    failureIndex.append(lastValidRow)
+                elif lastValidRow < 0:
+                    leadingStops += 1
+                if firstEventRow is None:
+                    firstEventRow = len(health)
+                sensorHealth = False
+                continue
+            elif line == '#start':
+                if firstEventRow is None:
+                    firstEventRow = len(health)
+                sensorHealth = True
+                pendingStartMarker = True
+                continue
+
+        # Skip empty lines or other comments
+        if not line or line.startswith('#'):
+            continue
+
+        # Raw Data Line: "01.10.2025 00:00:00 9006.741" - Non-padded Fields ("1.10.2025 0:00:00") are accepted as by read_Raw_Text_Data
+        dataSegment = line.split()
+        if len(dataSegment) < 2:
+            corruptedDataLines += 1
+            continue
+
+        try:
+            processValue = float(dataSegment[2]) if len(dataSegment) == 3 else 0.0
+        except ValueError:
+            corruptedDataLines += 1
+            continue
+
+        if not sensorHealth:
+            processValue = 0.0
+
+        # Lines that change the Health State (Negative Value, first Line after #start) need a valid Timestamp -
+        # read_Raw_Text_Data skips the whole Line otherwise (Other Lines are checked by the vectorized Conversion)
+        timestampString = dataSegment[0] + ' ' + dataSegment[1]
+        if (processValue < 0.0 or (pendingStartMarker and sensorHealth)) and not is_Valid_Timestamp_String(timestampString):
+            corruptedDataLines += 1
+            continue
+
+        # Filter out Negative Values
+        if processValue < 0.0:
+            processValue = 0.0
+            sensorHealth = False
+            if firstEventRow is None:
+                firstEventRow = len(health)
+
+        if pendingStartMarker and sensorHealth:
+            recoveryIndex.append(len(health))
+            pendingStartMarker = False
+
+        timestampStrings.append(timestampString)
+        values.append(processValue)
+        health.append(sensorHealth)
+
+    return {
+        'timestamp_strings': timestampStrings,
+        'values': values,
+        'health': health,
+        'failure_index': failureIndex,
+        'recovery_index': recoveryIndex,
+        'line_count': lineCount,
+        'corrupted_data_lines': corruptedDataLines,
+        'end_health': sensorHealth,
+        'end_pending_start': pendingStartMarker,
+        'first_event_row': firstEventRow,
+        'leading_stops': leadingStops
+    }
+
+
+def convert_Timestamp_Strings(timestampStrings) -> 'np.ndarray':
+    """
+    Convert "01.10.2025 00:00:00" Strings into a datetime64[s] Array (Invalid Dates become NaT).
+    Args:
+        timestampStrings: List of Timestamp Strings
+    Returns:
+        datetime64[s] Array
+    """
+    import pandas as pd
+
+    timestamps = pd.to_datetime(pd.Series(timestampStrings, dtype=object), format="%d.%m.%Y %H:%M:%S", errors='coerce')
+    return timestamps.to_numpy(dtype='datetime64[s]')
+
+
+def build_Raw_Arrays(parsedLines: dict, meterName: str, fileName: str) -> tuple:
+    """
+    Convert parsed column lists into numpy Arrays and Diagnostic Statistics.
+    Args:
+        parsedLines: Output of parse_Raw_Lines
+        meterName: Meter name for Diagnostics
+        fileName: File name for Diagnostics
+    Returns:
+        Tuple of (timestamps datetime64[s] Array, values float64 Array, health bool Array, diagnosticStatistics)
+    """
+    import numpy as np
+
+    # Vectorized Timestamp Conversion - Invalid Dates (e.g. "32.10.2025") become NaT and are counted as Corrupted
+    if 'timestamps' in parsedLines:
+        timestampArray = parsedLines['timestamps']  # Already converted (Byte Ranges are converted in the Worker)
+    else:
+        timestampArray = convert_Timestamp_Strings(parsedLines['timestamp_strings'])
+    values = np.asarray(parsedLines['values'], dtype='float64')
+    health = np.asarray(parsedLines['health'], dtype=bool)
+
+    validTimestamps = ~np.isnat(timestampArray)
+
+    # A #stop right after Rows with invalid Timestamps refers to the last valid Row (Same Health - invalid Rows hold no Health Event)
+    lastValidRow = np.maximum.accumulate(np.where(validTimestamps, np.arange(len(validTimestamps)), -1)) if len(validTimestamps) else validTimestamps
+    failureTimestamps = [str(timestampArray[lastValidRow[i]]).replace('T', ' ') for i in parsedLines['failure_index'] if lastValidRow[i] >= 0]
+    recoveryTimestamps = [str(timestampArray[i]).replace('T', ' ') for i in parsedLines['recovery_index'] if validTimestamps[i]]
+
+    timestampArray, values, health = timestampArray[validTimestamps], values[validTimestamps], health[validTimestamps]
+
+    totalData = len(values)
+    totalHealthyData = int(np.count_nonzero(health))
+    totalFaultyData = totalData - totalHealthyData
+    faultyDataPercentage = round((totalFaultyData/totalData * 100), 2) if totalData > 0 else 0.0
+
+    diagnosticStatistics = {
+        'meter': meterName,
+        'file_name': fileName,
+        'total_data': totalData,
+        'raw_line_count': parsedLines['line_count'],
+        'healthy_data': totalHealthyData,
+        'faulty_data': totalFaultyData,
+        'faulty_data_percentage': faultyDataPercentage,
+        'failure_timestamps': failureTimestamps,
+        'recovery_timestamps': recoveryTimestamps,
+        'corrupted_data_lines': parsedLines['corrupted_data_lines'] + int(np.count_nonzero(~validTimestamps))
+    }
+
+    return timestampArray, values, health, diagnosticStatistics
+
+
+@contextmanager
+def map_Raw_File(filePath: str):
+    """
+    Memory-map a raw file as a read-only uint8 Array (Zero Copy - Pages are read by the OS on first Access).
+    Files read ahead by prefetch_Raw_Files are served from Memory.
+    Args:
+        filePath: Full path to the raw file (Uncompressed)
+    Yields:
+        uint8 Array over the File Bytes
+    """
+    import numpy as np
+
+    rawBytes = lookup_Prefetched_File(filePath)
+    if rawBytes is not None:
+        yield np.frombuffer(rawBytes, dtype=np.uint8)
+        return
+
+    with open(filePath, 'rb') as rawFile:
+        if os.fstat(rawFile.fileno()).st_size == 0:
+            yield np.zeros(0, dtype=np.uint8)
+            return
+
+        rawMap = mmap.mmap(rawFile.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            yield np.frombuffer(rawMap, dtype=np.uint8)
+        finally:
+            try:
+                rawMap.close()
+            except BufferError:
+                pass  # A View is still referenced - the Map is closed when it is released
+
+
+def scan_Line_Offsets(rawBuffer) -> tuple:
+    """
+    Start and End Offsets of every Line of a Buffer from one vectorized Newline Scan (No per-Line Objects).
+    A Trailing '\\r' (Windows Line End) is excluded from the Line.
+    Args:
+        rawBuffer: uint8 Array (map_Raw_File)
+    Returns:
+        Tuple of (Line Starts int64 Array, Line Ends int64 Array - exclusive), or None when the Buffer holds a lone '\\r'
+        (Old Mac Line End - left to the Text Parser)
+    """
+    import numpy as np
+
+    newlines = np.flatnonzero(rawBuffer == NEWLINE_BYTE)
+    lineStarts = np.concatenate(([0], newlines + 1))
+    lineEnds = np.concatenate((newlines, [len(rawBuffer)]))
+    if len(rawBuffer) == 0 or rawBuffer[-1] == NEWLINE_BYTE:
+        lineStarts, lineEnds = lineStarts[:-1], lineEnds[:-1]
+
+    carriageReturns = np.flatnonzero(rawBuffer == CARRIAGE_RETURN_BYTE)
+    if not (carriageReturns + 1 < len(rawBuffer)).all() or not (rawBuffer[carriageReturns + 1] == NEWLINE_BYTE).all():
+        return None
+
+    lineEnds = lineEnds - ((lineEnds > lineStarts) & (rawBuffer[np.maximum(lineEnds - 1, 0)] == CARRIAGE_RETURN_BYTE))
+    return lineStarts.astype(np.int64), lineEnds.astype(np.int64)
+
+
+def gather_Field_Bytes(rawBuffer, fieldStarts, width: int):
+    """
+    Fixed-width Field Slices of many Lines as one (Lines x Width) uint8 Matrix (Bytes past the Buffer End are 0).
+    Args:
+        rawBuffer: uint8 Array
+        fieldStarts: Offset of the Field in each Line
+        width: Field Width in Bytes
+    Returns:
+        uint8 Matrix
+    """
+    import numpy as np
+
+    fieldBytes = np.zeros((len(fieldStarts), width), dtype=np.uint8)
+    if width == 0 or len(rawBuffer) < width:
+        for row, fieldStart in enumerate(fieldStarts):
+            fieldSlice = rawBuffer[fieldStart:fieldStart + width]
+            fieldBytes[row, :len(fieldSlice)] = fieldSlice
+        return fieldBytes
+
+    # Windows over the Buffer (View - no Offset Matrix), the last Fields of the Buffer are copied one by one
+    inBuffer = fieldStarts + width <= len(rawBuffer)
+    fieldBytes[inBuffer] = np.lib.stride_tricks.sliding_window_view(rawBuffer, width)[fieldStarts[inBuffer]]
+    for row in np.flatnonzero(~inBuffer):
+        fieldSlice = rawBuffer[fieldStarts[row]:]
+        fieldBytes[row, :len(fieldSlice)] = fieldSlice
+    return fieldBytes
+
+
+def decode_Timestamp_Fields(rawBuffer, lineStarts) -> 'np.ndarray':
+    """
+    Decode "01.10.2025 00:00:00" Fields straight from the Buffer into datetime64[s] (Integer Arithmetic on the Digit Bytes).
+    Fields that are not plain valid Dates are converted by convert_Timestamp_Strings (Same Result and NaT Rules).
+    Args:
+        rawBuffer: uint8 Array
+        lineStarts: Offset of each Data Line
+    Returns:
+        datetime64[s] Array
+    """
+    import numpy as np
+
+    fieldBytes = gather_Field_Bytes(rawBuffer, lineStarts, 19)
+    digits = fieldBytes[:, TIMESTAMP_DIGIT_POSITIONS].astype(np.int32) - ord('0')
+    validFields = ((digits >= 0) & (digits <= 9)).all(axis=1)
+
+    day = digits[:, 0] * 10 + digits[:, 1]
+    month = digits[:, 2] * 10 + digits[:, 3]
+    year = digits[:, 4] * 1000 + digits[:, 5] * 100 + digits[:, 6] * 10 + digits[:, 7]
+    hour = digits[:, 8] * 10 + digits[:, 9]
+    minute = digits[:, 10] * 10 + digits[:, 11]
+    second = digits[:, 12] * 10 + digits[:, 13]
+
+    validFields &= (year >= 1900) & (year <= 2200) & (month >= 1) & (month <= 12) & (day >= 1)
+    validFields &= (hour < 24) & (minute < 60) & (second < 60)
+
+    monthStart = np.where(validFields, (year - 1970) * 12 + month - 1, 0).astype('datetime64[M]')
+    dates = monthStart.astype('datetime64[D]') + np.where(validFields, day - 1, 0)
+    validFields &= dates.astype('datetime64[M]') == monthStart  # Day within the Month (31.11. is not a Date)
+
+    timestamps = dates.astype('datetime64[s]') + (hour * 3600 + minute * 60 + second)
+    invalidRows = np.flatnonzero(~validFields)
+    if len(invalidRows):
+        timestamps[invalidRows] = convert_Timestamp_Strings([bytes(fieldBytes[row]).decode('latin-1') for row in invalidRows])
+
+    return timestamps
+
+
+def decode_Value_Fields(rawBuffer, valueStarts, valueEnds) -> tuple:
+    """
+    Decode Process Value Fields ("9006.741", "-1.5") straight from the Buffer.
+    Plain Decimals (Sign, up to 15 Digits, one Point) are decoded as Integer Mantissa / Power of Ten - exactly
+    the correctly rounded Value of float(); any other Field is decoded by float() on its Slice.
+    Args:
+        rawBuffer: uint8 Array
+        valueStarts: Offset of each Value Field
+        valueEnds: End of each Value Field (exclusive) - Empty Fields decode as 0.0
+    Returns:
+        Tuple of (values float64 Array, valid bool Array - False where float() rejects the Field)
+    """
+    import numpy as np
+
+    widths = valueEnds - valueStarts
+    valueWidth = int(min(widths.max(initial=0), MMAP_VALUE_WIDTH))
+    fieldBytes = gather_Field_Bytes(rawBuffer, valueStarts, valueWidth)
+    inField = np.arange(valueWidth) < widths[:, None]
+
+    isDigit = inField & (fieldBytes >= ord('0')) & (fieldBytes <= ord('9'))
+    isPoint = inField & (fieldBytes == ord('.'))
+    isMinus = inField & (fieldBytes == ord('-')) & (np.arange(valueWidth) == 0)
+    digitCount = isDigit.sum(axis=1)
+
+    plainFields = ((isDigit | isPoint | isMinus) == inField).all(axis=1) & (isPoint.sum(axis=1) <= 1)
+    plainFields &= (digitCount >= 1) & (digitCount <= 15) & (widths <= valueWidth)
+
+    mantissa = np.zeros(len(valueStarts), dtype=np.int64)
+    for column in range(valueWidth):
+        mantissa = np.where(isDigit[:, column], mantissa * 10 + (fieldBytes[:, column].astype(np.int64) - ord('0')), mantissa)
+    fractionDigits = (isDigit & np.logical_or.accumulate(isPoint, axis=1)).sum(axis=1)
+
+    values = mantissa / np.power(10.0, fractionDigits)
+    values = np.where(isMinus[:, 0] if valueWidth else False, -values, values)
+    values = np.where(widths == 0, 0.0, values)
+    valid = np.ones(len(valueStarts), dtype=bool)
+
+    for row in np.flatnonzero(~plainFields & (widths > 0)):
+        try:
+            values[row] = float(bytes(rawBuffer[valueStarts[row]:valueEnds[row]]).decode('latin-1'))
+        except ValueError:
+            valid[row] = False
+
+    return values, valid
+
+
+def parse_Raw_Buffer(rawBuffer, healthCheck: bool = True, sensorHealth: bool = True) -> dict:
+    """
+    Vectorized parse_Raw_Lines over a memory-mapped Buffer - Newline Offsets, Field Slices and the #start/#stop Health State
+    are computed with numpy, no per-Line String is created. Same Result as parse_Raw_Lines followed by the Timestamp Conversion.
+    Args:
+        rawBuffer: uint8 Array (map_Raw_File)
+        healthCheck: Whether to check for #start/#stop health markers (default: True)
+        sensorHealth: Health State at the first line (default: True - Healthy)
+    Returns:
+        parse_Raw_Lines Dictionary with 'timestamps' (datetime64[s]) and numpy values / health,
+        or None when a Line is irregular (Non-ASCII or Control Bytes, extra Whitespace, lone '\\r') - parse with parse_Raw_Lines instead
+    """
+    import numpy as np
+
+    irregularTable = np.zeros(256, dtype=bool)
+    irregularTable[0x80:] = True
+    irregularTable[list(LINE_BOUNDARY_BYTES)] = True
+    if irregularTable[rawBuffer].any():
+        return None
+    lineOffsets = scan_Line_Offsets(rawBuffer)
+    if lineOffsets is None:
+        return None
+    lineStarts, lineEnds = lineOffsets
+    lineLengths = lineEnds - lineStarts
+    lineCount = len(lineStarts)
+
+    # Whitespace Bytes per Line (Offsets of the Whitespace Bytes) - a Data Line holds exactly the Separators at Position 10 and 19
+    whitespaceTable = np.zeros(256, dtype=bool)
+    whitespaceTable[list(WHITESPACE_BYTES)] = True
+    isWhitespace = whitespaceTable[rawBuffer]
+    whitespaceOffsets = np.flatnonzero(isWhitespace)
+    lineWhitespace = np.searchsorted(whitespaceOffsets, lineEnds) - np.searchsorted(whitespaceOffsets, lineStarts)
+
+    headBytes = gather_Field_Bytes(rawBuffer, lineStarts, 20) * (np.arange(20) < lineLengths[:, None])
+    isComment = (lineLengths > 0) & (headBytes[:, 0] == ord('#'))
+    isStop = isComment & (lineLengths == 5) & (headBytes[:, :5] == np.frombuffer(b'#stop', dtype=np.uint8)).all(axis=1)
+    isStart = isComment & (lineLengths == 6) & (headBytes[:, :6] == np.frombuffer(b'#start', dtype=np.uint8)).all(axis=1)
+    if not healthCheck:
+        isStop = isStart = np.zeros(lineCount, dtype=bool)
+
+    isDataShape = (~isComment & (lineLengths > 0) & (headBytes[:, 10] == ord(' '))
+                   & (((lineLengths == 19) & (lineWhitespace == 1))
+                      | ((lineLengths > 20) & (headBytes[:, 19] == ord(' ')) & (lineWhitespace == 2))))
+    trailingWhitespace = (lineLengths > 0) & isWhitespace[np.maximum(lineEnds - 1, 0)]  # '#stop ' strips to a Marker
+    isSkipped = (lineLengths == 0) | (isComment & ~isStop & ~isStart & ~trailingWhitespace)
+    if not (isDataShape | isSkipped | isStop | isStart).all():
+        return None
+
+    # Process Values and Timestamps - Lines whose Value float() rejects or whose Timestamp is invalid are Corrupted
+    # and do not take Part in the Health State
+    dataLines = np.flatnonzero(isDataShape)
+    rawValues, validValues = decode_Value_Fields(rawBuffer, np.minimum(lineStarts[dataLines] + 20, lineEnds[dataLines]), lineEnds[dataLines])
+    dataLines, rawValues = dataLines[validValues], rawValues[validValues]
+    timestamps = decode_Timestamp_Fields(rawBuffer, lineStarts[dataLines])
+    validTimestamps = ~np.isnat(timestamps)
+    corruptedDataLines = int(np.count_nonzero(~validValues)) + int(np.count_nonzero(~validTimestamps))
+    dataLines, rawValues, timestamps = dataLines[validTimestamps], rawValues[validTimestamps], timestamps[validTimestamps]
+    isData = np.zeros(lineCount, dtype=bool)
+    isData[dataLines] = True
+
+    # Health State: the last Event (#stop / Negative Value -> Unhealthy, #start -> Healthy) at or before each Line wins
+    isNegative = np.zeros(lineCount, dtype=bool)
+    isNegative[dataLines] = rawValues < 0.0
+    isEvent = isStop | isStart | isNegative
+    lastEvent = np.maximum.accumulate(np.where(isEvent, np.arange(lineCount), -1)) if lineCount else np.zeros(0, dtype=np.int64)
+    stateAfter = np.where(lastEvent >= 0, isStart[np.maximum(lastEvent, 0)], sensorHealth)
+    stateBefore = np.concatenate(([sensorHealth], stateAfter[:-1])) if lineCount else stateAfter
+
+    health = stateAfter[dataLines].astype(bool)
+    values = np.where(health, rawValues, 0.0)
+    rowsBefore = np.cumsum(isData) - isData  # Data Rows before each Line
+
+    # Failure Index: last Data Row before each #stop (when Healthy), Recovery Index: first Healthy Row after a #start
+    stopRows = rowsBefore[isStop] - 1
+    failureIndex = [int(row) for row in stopRows if row >= 0 and health[row]]
+    leadingStops = int(np.count_nonzero(stopRows < 0))
+
+    lastStart = np.maximum.accumulate(np.where(isStart, np.arange(lineCount), -1)) if lineCount else np.zeros(0, dtype=np.int64)
+    healthyRows = np.flatnonzero(health)
+    healthyLines = dataLines[healthyRows]
+    previousHealthyLines = np.concatenate(([-1], healthyLines[:-1]))
+    recoveryIndex = [int(row) for row in healthyRows[lastStart[healthyLines] > previousHealthyLines]]
+    lastHealthyLine = healthyLines[-1] if len(healthyLines) else -1
+    endPendingStart = bool(lineCount and lastStart[-1] > lastHealthyLine)
+
+    countedNegative = isNegative & stateBefore.astype(bool)
+    eventLines = np.flatnonzero(isStop | isStart | countedNegative)
+    firstEventRow = int(rowsBefore[eventLines[0]]) if len(eventLines) else None
+
+    return {
+        'timestamps': timestamps,
+        'values': values,
+        'health': health,
+        'failure_index': failureIndex,
+        'recovery_index': recoveryIndex,
+        'line_count': lineCount,
+        'corrupted_data_lines': corruptedDataLines,
+        'end_health': bool(stateAfter[-1]) if lineCount else sensorHealth,
+        'end_pending_start': endPendingStart,
+        'first_event_row': firstEventRow,
+        'leading_stops': leadingStops
+    }
+
+
+def index_Day_Offsets(filePath: str) -> dict:
+    """
+    Byte Range of every Day in a raw file from the Newline Scan of the memory-mapped File (Only the Date Field is decoded).
+    A Day Range covers every Data Line of that Day - Lines of other Days inside the Range (unsorted Files) must be filtered.
+    Args:
+        filePath: Full path to the raw file (Uncompressed)
+    Returns:
+        Dictionary of Date 'YYYY-MM-DD' to (Start Byte, End Byte - exclusive), or None when the File has a lone '\\r'
+        or a Line that is neither empty, a Comment nor starts with a 'DD.MM.YYYY' Date - scan the whole File instead
+    """
+    import numpy as np
+
+    with map_Raw_File(filePath) as rawBuffer:
+        lineOffsets = scan_Line_Offsets(rawBuffer)
+        if lineOffsets is None:
+            return None
+        lineStarts, lineEnds = lineOffsets
+        lineLengths = lineEnds - lineStarts
+
+        dateBytes = gather_Field_Bytes(rawBuffer, lineStarts, 10) * (lineLengths >= 10)[:, None]
+        digits = dateBytes[:, [0, 1, 3, 4, 6, 7, 8, 9]].astype(np.int32) - ord('0')
+        isDataLine = ((digits >= 0) & (digits <= 9)).all(axis=1) & (dateBytes[:, 2] == ord('.')) & (dateBytes[:, 5] == ord('.'))
+        isComment = (lineLengths > 0) & (rawBuffer[np.minimum(lineStarts, max(len(rawBuffer) - 1, 0))] == ord('#'))
+        if not (isDataLine | isComment | (lineLengths == 0)).all():
+            return None
+
+        dayKeys = (digits[:, 4] * 1000 + digits[:, 5] * 100 + digits[:, 6] * 10 + digits[:, 7]) * 10000 \
+                  + (digits[:, 2] * 10 + digits[:, 3]) * 100 + digits[:, 0] * 10 + digits[:, 1]
+        dataLines = np.flatnonzero(isDataLine)
+        lineEndsWithNewline = np.concatenate((lineStarts[1:], [len(rawBuffer)]))
+
+        dayOffsets = {}
+        for dayKey in np.unique(dayKeys[dataLines]):
+            dayLines = dataLines[dayKeys[dataLines] == dayKey]
+            dayOffsets[f"{dayKey // 10000:04d}-{dayKey // 100 % 100:02d}-{dayKey % 100:02d}"] = (int(lineStarts[dayLines[0]]),
+                                                                                                  int(lineEndsWithNewline[dayLines[-1]]))
+    return dayOffsets
+
+
+def read_Raw_Text_Arrays(filePath: str, encoding: str = 'utf-8', healthCheck: bool = True) -> tuple:
+    """
+    Read raw BTU meter text data into numpy Arrays (Fast Parser for every Channel).
+    Args:
+        filePath: Full path to the text file
+        encoding: File encoding (Default: 'utf-8')
+        healthCheck: Whether to check for #start/#stop health markers (default: True)
+    Returns:
+        Tuple of (timestamps datetime64[s] Array, values float64 Array, health bool Array, diagnosticStatistics)
+    """
+    meterName = os.path.basename(os.path.dirname(filePath)) if os.path.dirname(filePath) else "Unknown"
+    fileName = os.path.basename(filePath)
+
+    # Memory-mapped Parser (No per-Line Strings) - Compressed Files and irregular Lines fall back to the Text Parser
+    parsedLines = None
+    if MMAP_PARSER and encoding in MMAP_ENCODINGS and not is_Compressed(filePath):
+        with map_Raw_File(filePath) as rawBuffer:
+            parsedLines = parse_Raw_Buffer(rawBuffer, healthCheck)
+
+    if parsedLines is None:
+        with open_Raw_File(filePath, encoding) as textFile:
+            parsedLines = parse_Raw_Lines(textFile, healthCheck)
+
+    return build_Raw_Arrays(parsedLines, meterName, fileName)
+
+
+def scan_Health_State(rawBytes: bytes, healthCheck: bool = True) -> bool:
+    """
+    Health State after the last Line of a raw file Section - found from its last Health Event (#stop / #start / Negative Value),
+    searched backwards from the End, so a Section without Events is not parsed.
+    Args:
+        rawBytes: Bytes of the Section (Start of the File up to the Start of a Line)
+        healthCheck: Whether to check for #start/#stop health markers
+    Returns:
+        Health State at the Line after the Section (True: Healthy)
+    """
+    searchEnd = len(rawBytes)
+
+    while searchEnd > 0:
+        # Candidate Event Lines hold a '#st' Marker or a '-' Sign - each Candidate is checked by parse_Raw_Lines
+        candidate = max(rawBytes.rfind(b'#st', 0, searchEnd), rawBytes.rfind(b'-', 0, searchEnd))
+        if candidate < 0:
+            break
+
+        lineStart = rawBytes.rfind(b'\n', 0, candidate) + 1
+        lineEnd = rawBytes.find(b'\n', candidate)
+        lineEnd = len(rawBytes) if lineEnd < 0 else lineEnd
+        parsedLine = parse_Raw_Lines([rawBytes[lineStart:lineEnd].decode('latin-1')], healthCheck)
+        if parsedLine['first_event_row'] is not None:
+            return parsedLine['end_health']
+
+        searchEnd = lineStart
+
+    return True  # No Health Event - Healthy as at the Start of a File
+
+
+def read_Raw_Text_Arrays_Days(filePath: str, days: list, encoding: str = 'utf-8', healthCheck: bool = True) -> tuple:
+    """
+    Read the Lines of the given Days of a raw file into numpy Arrays - only their Byte Range (index_Day_Offsets) is parsed.
+    The Health State at the Range Start is taken from the Section before it (scan_Health_State).
+    Compressed Files and Files that cannot be indexed are read whole (read_Raw_Text_Arrays).
+    Args:
+        filePath: Full path to the text file
+        days: List of Dates 'YYYY-MM-DD' (The Range from the first to the last listed Day present in the File is read)
+        encoding: File encoding (Default: 'utf-8')
+        healthCheck: Whether to check for #start/#stop health markers (default: True)
+    Returns:
+        Tuple of (timestamps datetime64[s] Array, values float64 Array, health bool Array, diagnosticStatistics) -
+        Rows of other Days inside the Range (unsorted Files) are included
+    """
+    import numpy as np
+
+    dayOffsets = None
+    if MMAP_PARSER and encoding in MMAP_ENCODINGS and not is_Compressed(filePath):
+        dayOffsets = index_Day_Offsets(filePath)
+    if dayOffsets is None:
+        return read_Raw_Text_Arrays(filePath, encoding, healthCheck)
+
+    meterName = os.path.basename(os.path.dirname(filePath)) if os.path.dirname(filePath) else "Unknown"
+    fileName = os.path.basename(filePath)
+
+    dayRanges = [dayOffsets[day] for day in days if day in dayOffsets]
+    start = min((dayRange[0] for dayRange in dayRanges), default=0)
+    end = max((dayRange[1] for dayRange in dayRanges), default=0)
+
+    with map_Raw_File(filePath) as rawBuffer:
+        sensorHealth = scan_Health_State(rawBuffer[:start].tobytes(), healthCheck)
+        parsedLines = parse_Raw_Buffer(rawBuffer[start:end], healthCheck, sensorHealth)
+        if parsedLines is None:
+            parsedLines = parse_Raw_Lines(rawBuffer[start:end].tobytes().decode(encoding).splitlines(), healthCheck, sensorHealth)
+
+    return build_Raw_Arrays(parsedLines, meterName, fileName)
+
+
+def list_Byte_Ranges(filePath: str, numberOfRanges: int) -> List[Tuple[int, int]]:
+    """
+    Split a File into Byte Ranges that start and end on a Line Boundary.
+    Args:
+        filePath: Full path to the text file
+        numberOfRanges: Number of Ranges to split into
+    Returns:
+        List of (Start Byte, End Byte) - End exclusive
+    """
+    fileSize = os.path.getsize(filePath)
+    boundaries = [0]
+
+    with open(filePath, 'rb') as rawFile:
+        for i in range(1, numberOfRanges):
+            rawFile.seek(max(fileSize * i // numberOfRanges, boundaries[-1]))
+            rawFile.readline()  # Move to the Start of the next Line
+            boundaries.append(min(rawFile.tell(), fileSize))
+
+    boundaries.append(fileSize)
+    return [(start, end) for start, end in zip(boundaries[:-1], boundaries[1:]) if end > start]
+
+
+def parse_Raw_Byte_Range(filePath: str, start: int, end: int, encoding: str = 'utf-8', healthCheck: bool = True) -> dict:
+    """
+    Parse one Byte Range of a raw file (Worker Process) - assumes the Sensor is Healthy at the first Line.
+    The Health State is reconciled afterwards by merge_Parsed_Ranges.
+    Args:
+        filePath: Full path to the text file
+        start: Start Byte (Start of a Line)
+        end: End Byte (exclusive - End of a Line)
+        encoding: File encoding
+        healthCheck: Whether to check for #start/#stop health markers
+    Returns:
+        parse_Raw_Lines Dictionary with 'timestamps' (datetime64[s]) instead of 'timestamp_strings' and numpy values / health
+    """
+    import numpy as np
+
+    if MMAP_PARSER and encoding in MMAP_ENCODINGS:
+        with map_Raw_File(filePath) as rawBuffer:
+            parsedRange = parse_Raw_Buffer(rawBuffer[start:end], healthCheck)
+        if parsedRange is not None:
+            return parsedRange
+
+    with open(filePath, 'rb') as rawFile:
+        rawFile.seek(start)
+        lines = rawFile.read(end - start).decode(encoding).splitlines()
+
+    parsedRange = parse_Raw_Lines(lines, healthCheck)
+    parsedRange['timestamps'] = convert_Timestamp_Strings(parsedRange.pop('timestamp_strings'))
+    parsedRange['values'] = np.asarray(parsedRange['values'], dtype='float64')
+    parsedRange['health'] = np.asarray(parsedRange['health'], dtype=bool)
+    return parsedRange
+
+
+def merge_Parsed_Ranges(parsedRanges: list) -> dict:
+    """
+    Merge the parsed Byte Ranges of a File in Order and carry the Health State across the Range Boundaries.
+    Each Range was parsed as if the Sensor were Healthy at its first Line - only the Rows before its first
+    Health Event depend on the real State, so they are corrected from the End State of the previous Range.
+    Args:
+        parsedRanges: List of parse_Raw_Byte_Range Dictionaries (File Order)
+    Returns:
+        parse_Raw_Lines Dictionary of the whole File (with 'timestamps')
+    """
+    import numpy as np
+
+    sensorHealth = True
+    pendingStartMarker = False
+    lastRowHealthy = None  # Health of the last Row merged so far (None: No Row yet)
+    rowOffset = 0
+    failureIndex, recoveryIndex = [], []
+
+    for parsedRange in parsedRanges:
+        rowCount = len(parsedRange['health'])
+        prefixRows = rowCount if parsedRange['first_event_row'] is None else parsedRange['first_event_row']
+        rangeFailures = parsedRange['failure_index']
+        rangeRecoveries = parsedRange['recovery_index']
+
+        # #stop Markers before the first Row refer to the last Row of the previous Range
+        if lastRowHealthy:
+            failureIndex.extend([rowOffset - 1] * parsedRange['leading_stops'])
+
+        if not sensorHealth and prefixRows > 0:
+            # Rows before the first Event were Unhealthy - a #stop right after them is not a Failure
+            parsedRange['health'][:prefixRows] = False
+            parsedRange['values'][:prefixRows] = 0.0
+            rangeFailures = [index for index in rangeFailures if index != prefixRows - 1]
+        elif sensorHealth and pendingStartMarker and prefixRows > 0:
+            # A #start at the End of the previous Range recovers at the first Row of this Range
+            rangeRecoveries = [0] + rangeRecoveries
+            pendingStartMarker = False
+
+        failureIndex.extend(index + rowOffset for index in rangeFailures)
+        recoveryIndex.extend(index + rowOffset for index in rangeRecoveries)
+
+        if parsedRange['first_event_row'] is not None:
+            sensorHealth = parsedRange['end_health']
+        if parsedRange['recovery_index'] or parsedRange['end_pending_start']:
+            pendingStartMarker = parsedRange['end_pending_start']  # A #start inside the Range replaces the carried Marker
+        if rowCount > 0:
+            lastRowHealthy = bool(parsedRange['health'][-1])
+        rowOffset += rowCount
+
+    return {
+        'timestamps': np.concatenate([parsedRange['timestamps'] for parsedRange in parsedRanges]) if parsedRanges else np.array([], dtype='datetime64[s]'),
+        'values': np.concatenate([parsedRange['values'] for parsedRange in parsedRanges]) if parsedRanges else np.array([]),
+        'health': np.concatenate([parsedRange['health'] for parsedRange in parsedRanges]) if parsedRanges else np.array([], dtype=bool),
+        'failure_index': failureIndex,
+        'recovery_index': recoveryIndex,
+        'line_count': sum(parsedRange['line_count'] for parsedRange in parsedRanges),
+        'corrupted_data_lines': sum(parsedRange['corrupted_data_lines'] for parsedRange in parsedRanges),
+        'end_health': sensorHealth,
+        'end_pending_start': pendingStartMarker
+    }
+
+
+def read_Raw_Text_Arrays_Parallel(filePath: str, numberOfWorkers: int = None, encoding: str = 'utf-8', healthCheck: bool = True) -> tuple:
+    """
+    Read one large raw file with several Processes (Newline-aligned Byte Ranges) - Same Result as read_Raw_Text_Arrays.
+    Files smaller than PARALLEL_PARSE_MIN_BYTES, Compressed Files and Calls from inside a Worker Process are read sequentially.
+    Args:
+        filePath: Full path to the text file
+        numberOfWorkers: Number of Processes (Default: CPU Count)
+        encoding: File encoding (Default: 'utf-8')
+        healthCheck: Whether to check for #start/#stop health markers (default: True)
+    Returns:
+        Tuple of (timestamps datetime64[s] Array, values float64 Array, health bool Array, diagnosticStatistics)
+    """
+    if numberOfWorkers is None:
+        numberOfWorkers = os.cpu_count() or 1
+    fileSize = os.path.getsize(filePath)
+    numberOfRanges = min(numberOfWorkers, max(1, fileSize // PARALLEL_PARSE_RANGE_BYTES))
+
+    if (fileSize < PARALLEL_PARSE_MIN_BYTES or numberOfRanges < 2 or is_Compressed(filePath)
+            or multiprocessing.current_process().daemon):
+        return read_Raw_Text_Arrays(filePath, encoding, healthCheck)
+
+    byteRanges = list_Byte_Ranges(filePath, numberOfRanges)
+    with ProcessPoolExecutor(max_workers=len(byteRanges)) as executor:
+        parsedRanges = list(executor.map(parse_Raw_Byte_Range, [filePath] * len(byteRanges),
+                                         [start for start, _ in byteRanges], [end for _, end in byteRanges],
+                                         [encoding] * len(byteRanges), [healthCheck] * len(byteRanges)))
+
+    meterName = os.path.basename(os.path.dirname(filePath)) if os.path.dirname(filePath) else "Unknown"
+    return build_Raw_Arrays(merge_Parsed_Ranges(parsedRanges), meterName, os.path.basename(filePath))
+
+
+def fingerprint_Raw_File(filePath: str, mode: str = FINGERPRINT_MODE) -> str:
+    """
+    Content Fingerprint of a raw file (Independent of File Name and Modified Time).
+    Args:
+        filePath: Full path to the raw file
+        mode: 'full' (Block Hash of every Byte) or 'sample' (Size + Head + Tail)
+    Returns:
+        Hex Digest prefixed with the Mode ('full:...')
+    """
+    rawBytes = lookup_Prefetched_File(filePath)
+    if rawBytes is not None:
+        return fingerprint_Raw_Bytes(rawBytes, mode)
+
+    fileSize = os.path.getsize(filePath)
+    contentHash = hashlib.blake2b(str(fileSize).encode(), digest_size=20)
+
+    with open(filePath, 'rb') as rawFile:
+        if mode == 'sample' and fileSize > 2 * FINGERPRINT_SAMPLE_BYTES:
+            contentHash.update(rawFile.read(FINGERPRINT_SAMPLE_BYTES))
+            rawFile.seek(-FINGERPRINT_SAMPLE_BYTES, os.SEEK_END)
+            contentHash.update(rawFile.read(FINGERPRINT_SAMPLE_BYTES))
+        elif mode in ('full', 'sample'):
+            for block in iter(lambda: rawFile.read(FINGERPRINT_BLOCK_BYTES), b''):
+                contentHash.update(block)
+        else:
+            raise ValueError(f"Unknown fingerprint mode: {mode}")
+
+    return f"{mode}:{contentHash.hexdigest()}"
+
+
+def fingerprint_Raw_Bytes(rawBytes: bytes, mode: str = FINGERPRINT_MODE) -> str:
+    """
+    Content Fingerprint of a prefetched raw file (Same Digest as fingerprint_Raw_File of the File on Disk).
+    Args:
+        rawBytes: File Bytes
+        mode: 'full' or 'sample'
+    Returns:
+        Hex Digest prefixed with the Mode ('full:...')
+    """
+    contentHash = hashlib.blake2b(str(len(rawBytes)).encode(), digest_size=20)
+
+    if mode == 'sample' and len(rawBytes) > 2 * FINGERPRINT_SAMPLE_BYTES:
+        contentHash.update(rawBytes[:FINGERPRINT_SAMPLE_BYTES])
+        contentHash.update(rawBytes[-FINGERPRINT_SAMPLE_BYTES:])
+    elif mode in ('full', 'sample'):
+        contentHash.update(rawBytes)
+    else:
+        raise ValueError(f"Unknown fingerprint mode: {mode}")
+
+    return f"{mode}:{contentHash.hexdigest()}"
+
+
+def lookup_Parsed_File(fingerprint: str, filePath: str):
+    """
+    Parsed Arrays of a File with the same Content (Parsed File Cache) - a different File Path is reported as a Duplicate
+    in the Diagnostics of this Read ('duplicate_file', 'duplicate_of').
+    Args:
+        fingerprint: Content Fingerprint (fingerprint_Raw_File)
+        filePath: Full path of the File being read
+    Returns:
+        Tuple of (timestamps, values, health, diagnosticStatistics) or None when the Content was not parsed before
+    """
+    if fingerprint not in parsedFileCache:
+        return None
+
+    parsedFileCache.move_to_end(fingerprint)
+    timestamps, values, health, diagnosticStatistics, originalPath = parsedFileCache[fingerprint]
+
+    # Diagnostics are updated in place by the Merge - every Reader gets its own Copy
+    diagnosticStatistics = dict(diagnosticStatistics, meter=os.path.basename(os.path.dirname(filePath)), file_name=os.path.basename(filePath))
+    if originalPath != filePath:
+        diagnosticStatistics['duplicate_file'] = filePath
+        diagnosticStatistics['duplicate_of'] = originalPath
+
+    return timestamps, values, health, diagnosticStatistics
+
+
+def store_Parsed_File(fingerprint: str, filePath: str, parsedArrays: tuple):
+    """
+    Keep the parsed Arrays of a File in the Parsed File Cache.
+    Args:
+        fingerprint: Content Fingerprint (fingerprint_Raw_File)
+        filePath: Full path of the parsed File
+        parsedArrays: Tuple of (timestamps, values, health, diagnosticStatistics)
+    """
+    timestamps, values, health, diagnosticStatistics = parsedArrays
+    parsedFileCache[fingerprint] = (timestamps, values, health, dict(diagnosticStatistics), filePath)
+    parsedFileCache.move_to_end(fingerprint)
+    if len(parsedFileCache) > PARSED_FILE_CACHE_SIZE:
+        parsedFileCache.popitem(last=False)
+
+
+def read_Raw_Text_Arrays_Deduplicated(filePath: str, encoding: str = 'utf-8', healthCheck: bool = True) -> tuple:
+    """
+    Read a raw file into numpy Arrays - Content already parsed (under any Name or Modified Time) is served from the Cache.
+    Args:
+        filePath: Full path to the raw file
+        encoding: File encoding (Default: 'utf-8')
+        healthCheck: Whether to check for #start/#stop health markers (default: True)
+    Returns:
+        Tuple of (timestamps datetime64[s] Array, values float64 Array, health bool Array, diagnosticStatistics)
+    """
+    # The Cache holds Files parsed with the Default Settings only
+    if encoding != 'utf-8' or not healthCheck:
+        return read_Raw_Text_Arrays_Parallel(filePath, encoding=encoding, healthCheck=healthCheck)
+
+    fingerprint = fingerprint_Raw_File(filePath)
+    parsedArrays = lookup_Parsed_File(fingerprint, filePath)
+    if parsedArrays is None:
+        parsedArrays = read_Raw_Text_Arrays_Parallel(filePath, encoding=encoding, healthCheck=healthCheck)
+        store_Parsed_File(fingerprint, filePath, parsedArrays)
+
+    return parsedArrays
+
+
 # List the Blocks that the Meters exist in (Use Set - Unqiue)
 # Extract block names from meter names ("J_B_82_10_27" to "J_B_82")
 def list_Meter_Blocks(nameList): 
@@ -0,0 +1,179 @@
+# Project: Metering Data Parser
+# Description:
+# Command Line Entry Point of the Metering Tools - Subcommands list, parse, analyze, export and convert-day
+# Run Parameters (Month, Year, Paths, Filter) are Arguments instead of Constants edited in the Source
+# pandas / numpy / openpyxl are imported by the Subcommands that use them - 'list' starts without them
+
+# Aurthor: Tristan Sim
+# Date: 19/10/2026
+# Version: 1.01
+# Changelog:
+# - 'list --status' shows the Data-Quality Report
+
+# Usage:
+# python metering_cli.py list --status
+# python metering_cli.py parse --month 10 --year 2025
+# python metering_cli.py export --month 10 --year 2025 --no-excel --columnar csv.gz
+# python metering_cli.py convert-day --day 07 --month 10 --year 2025
+
+import os
+import sys
+import argparse
+import datetime
+
+# Import Custom Library (Light Modules only - the Parser Modules are imported by their Subcommands)
+import fetch_data
+import pipeline_runner
+
+# Default Configuration (Same Folders as metering_data_parser / raw_data_parser)
+pathDataFolder = r'C:\Repository\ControlSystems\Control Systems\Python\Metering Data Parser\data\PDD_BTUmeter'
+pathOutputFolder = r'C:\Repository\ControlSystems\Control Systems\Python\Metering Data Parser\data\Metering Summary Report'
+pathMeterFilterFile = r'C:\Repository\ControlSystems\Control Systems\Python\Metering Data Parser\filter\FilterList_CWSA.xlsx'
+pathRawDataFolder = r'C:\Repository\ControlSystems\Control Systems\Python\Metering Data Parser\data\Raw Data Files'
+pathConvertOutputFolder = r'C:\Repository\ControlSystems\Control Systems\Python\Metering Data Parser\Output'
+
+btuNamePrefix = ["J_B_"]
+dataFilePrefix = "X01_01_"
+COLUMNAR_FORMATS = ['parquet', 'feather', 'csv.gz']
+
+# Last Stage run by each Pipeline Subcommand ('export' runs the whole Pipeline, including the optional SQLite Store)
+COMMAND_LAST_STAGE = {'parse': 'parse', 'analyze': 'analyze', 'export': None}
+
+
+def previous_Month_Default() -> tuple:
+    """
+    Default Target Month - the Month before the System Clock (Month-End Billing Run).
+    Returns:
+        Tuple of (Month, Year) - ('09', '2025')
+    """
+    lastMonth = datetime.date.today().replace(day=1) - datetime.timedelta(days=1)
+    return lastMonth.strftime('%m'), lastMonth.strftime('%Y')
+
+
+def run_List_Command(arguments: argparse.Namespace) -> int:
+    """
+    List the Meters and Blocks of the Data Folder - with --files the Raw Files of the Month per Channel,
+    with --status the Pipeline Stages cached for the Month.
+    """
+    directoryIndex = fetch_data.build_Directory_Index(arguments.data_folder, btuNamePrefix, dataFilePrefix + arguments.year + arguments.month)
+    btuNameList = sorted(directoryIndex)
+    btuBlockList = fetch_data.list_Meter_Blocks(nameList = btuNameList)
+
+    print(f"\nFound {len(btuNameList)} Meters in {len(btuBlockList)} Blocks ({arguments.data_folder})")
+    for block in btuBlockList:
+        meters_in_block = [meter for meter in btuNameList if meter.split('_')[2] == block]
+        print(f"- Block {block}: {len(meters_in_block)} Meters")
+        if arguments.meters:
+            for meter in meters_in_block: print(f"    {meter}")
+
+    if arguments.files:
+        print(f"\nRaw Files for {arguments.month}/{arguments.year}:")
+        for meterName in btuNameList:
+            channelCounts = ', '.join(f"{channel} {len(files)}" for channel, files in directoryIndex[meterName].items() if files)
+            print(f"- {meterName}: {channelCounts or 'No Files'}")
+
+    if arguments.status:
+        cacheFolder = os.path.join(arguments.output_folder, pipeline_runner.PIPELINE_CACHE_FOLDER, f"{arguments.year}_{arguments.month}")
+        manifest = pipeline_runner.read_Pipeline_Manifest(cacheFolder)
+        print(f"\nPipeline Status for {arguments.month}/{arguments.year} ({cacheFolder}):")
+        if not manifest['Stages']:
+            print("- No Stage has run for this Month")
+        for stageName in manifest['Stages']:
+            print(f"- {stageName}: cached")
+        for reportName in (f"Metering_Report_{arguments.month}_{arguments.year}.xlsx", f"Billing_Report_{arguments.month}_{arguments.year}.xlsx",
+                           f"Data_Quality_Report_{arguments.month}_{arguments.year}.xlsx"):
+            reportPath = os.path.join(arguments.output_folder, "Reports", reportName)
+            print(f"- {reportName}: {'present' if os.path.exists(reportPath) else 'missing'}")
+
+    return 0
+
+
+def run_Pipeline_Command(arguments: argparse.Namespace) -> int:
+    """
+    Run the metering_data_parser Task Graph up to the Stage of the Subcommand (Up-to-date Stages are skipped).
+    """
+    import metering_data_parser
+
+    metering_data_parser.configure_Run(month = arguments.month, year = arguments.year, dataFolder = arguments.data_folder,
+                                       outputFolder = arguments.output_folder, meterFilterFile = arguments.filter,
+                                       sqliteStore = arguments.sqlite_store, debugFlag = arguments.debug,
+                                       exportExcel = False if getattr(arguments, 'no_excel', False) else None,
+                                       columnarFormats = getattr(arguments, 'columnar', None))
+    metering_data_parser.run_Metering_Pipeline(runStage = arguments.stage, stopAfterStage = COMMAND_LAST_STAGE[arguments.command],
+                                               forceRun = arguments.force)
+    return 0
+
+
+def run_Convert_Day_Command(arguments: argparse.Namespace) -> int:
+    """
+    Convert the monthly .dat Files of every Meter into .txt Files of one Day (raw_data_parser).
+    """
+    import raw_data_parser
+
+    conversion = raw_data_parser.convert_day(arguments.raw_folder, arguments.convert_output, arguments.year, arguments.month,
+                                             f"{int(arguments.day):02d}", debug = arguments.debug)
+    return 0 if conversion['files_success'] == conversion['files_processed'] else 1
+
+
+def build_Argument_Parser() -> argparse.ArgumentParser:
+    """
+    Argument Parser of the Subcommands.
+    Returns:
+        ArgumentParser
+    """
+    defaultMonth, defaultYear = previous_Month_Default()
+
+    periodArguments = argparse.ArgumentParser(add_help = False)
+    periodArguments.add_argument('--month', default = defaultMonth, type = lambda month: f"{int(month):02d}",
+                                 help = f"Target Month (Default: {defaultMonth})")
+    periodArguments.add_argument('--year', default = defaultYear, help = f"Target Year (Default: {defaultYear})")
+    periodArguments.add_argument('--debug', action = 'store_true', help = "Debug Output")
+
+    folderArguments = argparse.ArgumentParser(add_help = False)
+    folderArguments.add_argument('--data-folder', default = pathDataFolder, help = "Raw Data Folder (Meter Folders)")
+    folderArguments.add_argument('--output-folder', default = pathOutputFolder, help = "Output Folder (Reports, Rollups, Pipeline Cache)")
+
+    pipelineArguments = argparse.ArgumentParser(add_help = False)
+    pipelineArguments.add_argument('--filter', default = pathMeterFilterFile, help = "Meter Filter Workbook (CWSA 'Device Name' Column)")
+    pipelineArguments.add_argument('--sqlite-store', default = None, help = "SQLite Metering Store (Adds the 'store' Stage to export)")
+    pipelineArguments.add_argument('--stage', default = None, help = "Run only this Stage from the Cache of an earlier Run")
+    pipelineArguments.add_argument('--force', action = 'store_true', help = "Run every Stage even when it is up to date")
+
+    parser = argparse.ArgumentParser(prog = 'metering_cli', description = "Metering Data Parser - Command Line Tools")
+    subparsers = parser.add_subparsers(dest = 'command', required = True)
+
+    listParser = subparsers.add_parser('list', parents = [periodArguments, folderArguments], help = "List Meters, Blocks, Files and Pipeline Status")
+    listParser.add_argument('--meters', action = 'store_true', help = "List the Meters of every Block")
+    listParser.add_argument('--files', action = 'store_true', help = "Count the Raw Files of the Month per Meter and Channel")
+    listParser.add_argument('--status', action = 'store_true', help = "Show the cached Pipeline Stages and Reports of the Month")
+    listParser.set_defaults(handler = run_List_Command)
+
+    subparsers.add_parser('parse', parents = [periodArguments, folderArguments, pipelineArguments],
+                          help = "Fetch and parse the Raw Files of the Month (Block DataFrames and Rollups)").set_defaults(handler = run_Pipeline_Command)
+    subparsers.add_parser('analyze', parents = [periodArguments, folderArguments, pipelineArguments],
+                          help = "Parse, categorize and analyze the Month (Statistics, Charges, Month-End State)").set_defaults(handler = run_Pipeline_Command)
+
+    exportParser = subparsers.add_parser('export', parents = [periodArguments, folderArguments, pipelineArguments],
+                                         help = "Run the whole Pipeline and write the Reports")
+    exportParser.add_argument('--no-excel', action = 'store_true', help = "Skip the Block Sheets Workbook")
+    exportParser.add_argument('--columnar', nargs = '*', choices = COLUMNAR_FORMATS, default = None,
+                              help = "Formats of the Columnar Block Data (No Format disables it)")
+    exportParser.set_defaults(handler = run_Pipeline_Command)
+
+    convertParser = subparsers.add_parser('convert-day', parents = [periodArguments], help = "Extract one Day of the monthly .dat Files")
+    convertParser.add_argument('--day', required = True, help = "Target Day ('07')")
+    convertParser.add_argument('--raw-folder', default = pathRawDataFolder, help = "Raw Data Files Folder (.dat)")
+    convertParser.add_argument('--convert-output', default = pathConvertOutputFolder, help = "Output Folder of the Day Files")
+    convertParser.set_defaults(handler = run_Convert_Day_Command)
+
+    return parser
+
+
+def main(argv: list = None) -> int:
+    """Main execution function - Parses the Command Line and runs the Subcommand"""
+    arguments = build_Argument_Parser().parse_args(argv)
+    return arguments.handler(arguments)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
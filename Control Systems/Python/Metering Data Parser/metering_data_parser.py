@@ -11,19 +11,44 @@
 # - 24/11/2025 - Introduce a Metering Filter to seperate the summation of different Meter Readings
 #              - Step 2.5 - Calcuate the per minute sum of the RT for each Meter Category
 #              - Format the Excel for Easy Readability
+# - Precision Policy - RT stored as float32 and Health as a Bitmask (Category Sums computed in float64)
+# - Rollup Pyramid (Hourly, Daily, Monthly) built during Step 2 - Daily Sheet & Year-To-Date Summary use the Rollups
+# - Optional SQLite Store - Minute Data & Rollups of every Month kept in one Database for Multi-Month Reports
+# - Step 2 loads every configured Channel in one Pass per Meter Folder (Fast Array Parser)
+# - Step 3 checks RT vs RTH Consistency for every Meter (Divergent Intervals written to the Diagnostic Log)
+# - Step 3 reports RTH Register Resets / Rollovers (Billing uses the Segment-aware Monthly Consumption)
+# - Month-End State (Last Healthy RTH, Open Outage) carried forward - Boundary Consumption without re-reading the previous Month
+# - Step 2.5 builds a Category Mask per Block - reused by the Time-of-Use Billing Engine (Billing Report in Step 4)
+# - Step 2 reports Duplicate Raw Files (Same Content under another Name - parsed once)
+# - Steps run as a Task Graph (pipeline_runner) - Stages with unchanged Inputs are skipped, a single Stage can be run from the Cache
+# - Module Progress is logged through metering_log (Debug Records only with DEBUG_FLAG)
+# - Step 4 renders the Excel Sheets in parallel Worker Processes (excel_package) - Pipeline runs under a __main__ Guard
+# - Step 4 writes the Block Data as compressed Columnar Files (Parquet / Feather / CSV.gz) - Excel Workbook optional
+# - Run Parameters can be set from the Command Line (metering_cli) - Export / Store Modules imported by their Stages only
+# - Step 2.1 builds the Data-Quality Matrix (Meter x Day / Hour Completeness, Correlated Outages) - Heatmap Report in Step 4
+# - Step 2 rejects Spikes, Stuck Values and impossible Step Changes of every parsed File (anomaly_data Rules per Channel)
+# - Anomalies are flagged in the Health Bitmask by Default (Values kept) - parse_data.ANOMALY_REJECTION rejects them
+# - Tariff Rates and Public Holidays read from the Billing Configuration next to the Meter Filter - Billing skipped when incomplete
+# - Export Stage re-runs when a previous Month's Monthly Rollup changes (Year-To-Date Summary) - Stage Argument read under __main__
+# - Boundary Consumption written to the Analysis Report and the Billing Report (Boundary_RTH per Meter)
 
 
 # Input Dependencies: Execution Month & Year (Variable) - Default (System Clock subtracted to Previous Months)
 import pandas as pd
-import numpy as np
-import openpyxl
 import time
+import os
+import sys
 
-# Import Custom Library
+# Import Custom Library (export_data and sqlite_store are imported by their Stages - Excel / SQLite Libraries load only for Step 4)
 import fetch_data
 import parse_data
 import analyze_data
-import export_data
+import rollup_data
+import month_state
+import billing_data
+import quality_data
+import pipeline_runner
+import metering_log
 
 # Initial: Initialize Data
 targetMonth = '10'
@@ -31,186 +56,456 @@ targetYear = '2025'
 pathDataFolder = r'C:\Repository\ControlSystems\Control Systems\Python\Metering Data Parser\data\PDD_BTUmeter' # Absolute Path to Working Directory
 pathOutputFolder = r'C:\Repository\ControlSystems\Control Systems\Python\Metering Data Parser\data\Metering Summary Report'
 pathMeterFilterFile = r'C:\Repository\ControlSystems\Control Systems\Python\Metering Data Parser\filter\FilterList_CWSA.xlsx' # List of Meters to Filter
+pathSQLiteStore = None # Optional: Path to the SQLite Metering Store (e.g. r'...\data\Metering Store.db') - None disables the Store
 
 MONTHS = ['01', '02', '03', '04', '05', '06', '07', '08', '09', '10', '11', '12']
 DEBUG_FLAG = True
 DELIMITER = ';'
 DATETIME_START_INDEX = 7 # Datetime starts from the 7th Character in the File Name
 
-# Dynamically Populated - Can also be Statically Assigned herein these Array
-btuNameList = []          # BTU Name List         J_B_82_10_27
-btuBlockList = []         # BTU Blocks            J_B_82 = Block 82
-btuFileList_RT = []       # RT File Name List     J_B_82_10_27/X01_01_20250801_70_01_BTUREADINGS11MIN.txt
-btuFileList_RTH = []      # RTH File Name List    J_B_82_10_27/X01_01_20250801_70_01_ACCBTUReadingS11MIN.txt
+# Pipeline: Stages with unchanged Inputs are skipped (Cache per Month in the Output Folder)
+# Run a single Stage from the Cache with 'python metering_data_parser.py export' (fetch, parse, quality, categorize, analyze, export, store)
+PIPELINE_FORCE_RUN = False  # Run every Stage even when it is up to date
+
+PARALLEL_EXCEL_EXPORT = True  # Render every Excel Sheet in its own Process (Same Workbook as the sequential Export)
+EXCEL_EXPORT_WORKERS = None   # Worker Processes for the Excel Export (None: CPU Count)
+EXPORT_EXCEL = True           # Block Sheets Workbook (Slowest Output - Disable when Tools read the Columnar Block Data)
+COLUMNAR_EXPORT_FORMATS = ['csv.gz']  # Block Data/Year=/Month=/Block= Files: 'csv.gz', 'parquet' / 'feather' (Need pyarrow) ([] disables)
+QUALITY_RESOLUTIONS = ['daily', 'hourly']  # Completeness Matrices of the Data-Quality Report (Outages found at the finest)
+QUALITY_HEATMAP_IMAGE = True           # Data-Quality Heatmap as .png (Needs matplotlib - the Report Sheets are Colour-scaled either way)
 
 targetTimestamp = targetYear + targetMonth
 btuNamePrefix = ["J_B_"]
 dataFilePrefix = ["X01_01_"]
 dataFilePostfix = ["BTUREADINGS11MIN.txt", "ACCBTUReadingS11MIN.txt"]
 meterCategory = ["Total RT Sum", "CWSA RT", "Retail RT"]
+meterChannels = ['RT', 'RTH']  # Add 'FLOW', 'TSUPPLY', 'TRETURN', 'TDELTA' to load the Diagnostic Channels
 
-# For Step 2: Converting Raw Data into Data Frame
-diagnoseStatsRegisters = []
-blockDataFrames  = {}  # Dictionary (Key-Value Pair: Key - Block 22: Data Frame)
+# Specify the Search Criteria for Prefix that matches "X01_01_202508"
+prefixSearchCriteria = dataFilePrefix[0] + targetTimestamp 
 
 # Track Python Runtime
 start_time = time.time()
 
 
+def configure_Run(month: str = None, year: str = None, dataFolder: str = None, outputFolder: str = None,
+                  meterFilterFile: str = None, sqliteStore: str = None, debugFlag: bool = None,
+                  exportExcel: bool = None, columnarFormats: list = None):
+    """
+    Override the Run Parameters of this Module (Command Line - metering_cli). Parameters left as None keep their Default.
+    Args:
+        month: Target Month ('10')
+        year: Target Year ('2025')
+        dataFolder: Path to the Raw Data Folder
+        outputFolder: Path to the Output Folder
+        meterFilterFile: Path to the Meter Filter Workbook
+        sqliteStore: Path to the SQLite Metering Store
+        debugFlag: Debug Output
+        exportExcel: Write the Block Sheets Workbook in Step 4
+        columnarFormats: Formats of the Columnar Block Data ('parquet', 'feather', 'csv.gz' - [] disables)
+    """
+    global targetMonth, targetYear, pathDataFolder, pathOutputFolder, pathMeterFilterFile, pathSQLiteStore, DEBUG_FLAG
+    global EXPORT_EXCEL, COLUMNAR_EXPORT_FORMATS
+    global targetTimestamp, prefixSearchCriteria
+
+    targetMonth = month if month is not None else targetMonth
+    targetYear = year if year is not None else targetYear
+    pathDataFolder = dataFolder if dataFolder is not None else pathDataFolder
+    pathOutputFolder = outputFolder if outputFolder is not None else pathOutputFolder
+    pathMeterFilterFile = meterFilterFile if meterFilterFile is not None else pathMeterFilterFile
+    pathSQLiteStore = sqliteStore if sqliteStore is not None else pathSQLiteStore
+    DEBUG_FLAG = debugFlag if debugFlag is not None else DEBUG_FLAG
+    EXPORT_EXCEL = exportExcel if exportExcel is not None else EXPORT_EXCEL
+    COLUMNAR_EXPORT_FORMATS = columnarFormats if columnarFormats is not None else COLUMNAR_EXPORT_FORMATS
+
+    targetTimestamp = targetYear + targetMonth
+    prefixSearchCriteria = dataFilePrefix[0] + targetTimestamp
 
-# Step 1: Fetch all the File and Folder Information -------------------------------------------------------------------------------------- Step 1
-print("\nStep 1: Fetch all the File and Folder Information")
 
-# Fetch All Folder Name of Each BTU Meter and Store it in List
-btuNameList = fetch_data.list_Folder_Names(folderPath = pathDataFolder, namePrefix = btuNamePrefix, debugFlag = DEBUG_FLAG)
 
-# List the Blocks that the Meters exist in (Use Set - Unqiue)
-# Extract block names from meter names ("J_B_82_10_27" to "J_B_82")
-btuBlockList = fetch_data.list_Meter_Blocks(nameList = btuNameList)
-
-# Specify the Search Criteria for Prefix that matches "X01_01_202508"
-prefixSearchCriteria = dataFilePrefix[0] + targetTimestamp 
-
-# Fetch All File Names (With Parent Folder Name Information) and Store it in List:
-btuFileList_RT = fetch_data.list_File_Names(parentFolderPath = pathDataFolder,
-                                            childFolderNames = btuNameList,
-                                            prefix = prefixSearchCriteria,
-                                            postfix = (dataFilePostfix[0]),
-                                            delimiter = DELIMITER,
-                                            debugFlag = DEBUG_FLAG)
-
-btuFileList_RTH = fetch_data.list_File_Names(parentFolderPath = pathDataFolder,
-                                            childFolderNames = btuNameList,
-                                            prefix = prefixSearchCriteria,
-                                            postfix = (dataFilePostfix[1]),
-                                            delimiter = DELIMITER,
-                                            debugFlag = DEBUG_FLAG)
-               
-# Print the Files Retrieved based on Search Criteria     
-if DEBUG_FLAG == True: 
-   print(f"\nFound {len(btuBlockList)} Unique Blocks:")
-   for block in btuBlockList: print(f"- {block}")
-   print("\nFiles Retrieve for RT Data (Month: " + targetMonth + " and Year: " + targetYear + "):")
-   for file in btuFileList_RT: print("- " + file)
-   print("\nFiles Retrieve for RTH Data (Month: " + targetMonth + " and Year: " + targetYear + "):")
-   for file in btuFileList_RTH: print("- " + file)
-   
-print("\nStep 1: Completed...\n")
+# Step 1: Fetch all the File and Folder Information -------------------------------------------------------------------------------------- Step 1
+def run_Fetch_Stage(stageInputs: dict) -> dict:
+    """
+    Step 1: Fetch all the File and Folder Information.
+    Returns:
+        {'file_index': Meter Names, Blocks, RT / RTH File Lists and the Size / Modified Time Fingerprint of the Month's Raw Files}
+    """
+    print("\nStep 1: Fetch all the File and Folder Information")
+
+    # Fetch All Folder Name of Each BTU Meter and Store it in List
+    btuNameList = fetch_data.list_Folder_Names(folderPath = pathDataFolder, namePrefix = btuNamePrefix, debugFlag = DEBUG_FLAG)
+
+    # List the Blocks that the Meters exist in (Use Set - Unqiue)
+    # Extract block names from meter names ("J_B_82_10_27" to "J_B_82")
+    btuBlockList = fetch_data.list_Meter_Blocks(nameList = btuNameList)
+
+    # Fetch All File Names (With Parent Folder Name Information) and Store it in List:
+    btuFileList_RT = fetch_data.list_File_Names(parentFolderPath = pathDataFolder,
+                                                childFolderNames = btuNameList,
+                                                prefix = prefixSearchCriteria,
+                                                postfix = (dataFilePostfix[0]),
+                                                delimiter = DELIMITER,
+                                                debugFlag = DEBUG_FLAG)
+
+    btuFileList_RTH = fetch_data.list_File_Names(parentFolderPath = pathDataFolder,
+                                                childFolderNames = btuNameList,
+                                                prefix = prefixSearchCriteria,
+                                                postfix = (dataFilePostfix[1]),
+                                                delimiter = DELIMITER,
+                                                debugFlag = DEBUG_FLAG)
+
+    # Raw Files of every loaded Channel - a new or re-exported File changes the Fingerprint and re-runs the 'parse' Stage
+    directoryIndex = fetch_data.build_Directory_Index(pathDataFolder, btuNamePrefix, prefixSearchCriteria,
+                                                      {channel: fetch_data.CHANNEL_POSTFIX[channel] for channel in meterChannels})
+    rawFilePaths = [os.path.join(pathDataFolder, meterName, fileName)
+                    for meterName, meterIndex in directoryIndex.items() for channelFiles in meterIndex.values() for _, fileName in channelFiles]
+
+    # Print the Files Retrieved based on Search Criteria     
+    if DEBUG_FLAG == True: 
+       print(f"\nFound {len(btuBlockList)} Unique Blocks:")
+       for block in btuBlockList: print(f"- {block}")
+       print("\nFiles Retrieve for RT Data (Month: " + targetMonth + " and Year: " + targetYear + "):")
+       for file in btuFileList_RT: print("- " + file)
+       print("\nFiles Retrieve for RTH Data (Month: " + targetMonth + " and Year: " + targetYear + "):")
+       for file in btuFileList_RTH: print("- " + file)
+
+    print("\nStep 1: Completed...\n")
+    return {'file_index': {'btuNameList': btuNameList, 'btuBlockList': btuBlockList, 'btuFileList_RT': btuFileList_RT,
+                           'btuFileList_RTH': btuFileList_RTH, 'rawFileFingerprint': pipeline_runner.fingerprint_Files(rawFilePaths)}}
 
 
 
 # Step 2: Load Data from Text File to a Raw Data into a Dataframe ------------------------------------------------------------------------------ Step 2
-print("\nStep 2: Load Data from Text File to a Raw Data into a Dataframe ")
-
-# Initialize the Data Frame with Timestamps & Default Values for Missing Data(Filter Data)
-for block in btuBlockList: 
-   blockDataFrames[block] = parse_data.initialize_Block_DataFrame(month=targetMonth, year=targetYear, blockNumber=block, meterList=btuNameList) 
-
-# Populate RT data
-parse_data.populate_Meter_DataFrame(btuFileList_RT, blockDataFrames, diagnoseStatsRegisters, pathDataFolder, DELIMITER, 'RT')
-
-# Populate RTH data
-parse_data.populate_Meter_DataFrame(btuFileList_RTH, blockDataFrames, diagnoseStatsRegisters, pathDataFolder, DELIMITER, 'RTH')
-
-# Print results
-if DEBUG_FLAG:
-    for block, df in blockDataFrames.items():
-        print(f"\nBlock {block}:")
-        print(f"Shape: {df.shape}")
-        print(f"Columns: {list(df.columns)}")
-        print(df.head())
-
-print("\nStep 2: Completed...\n")
+def run_Parse_Stage(stageInputs: dict) -> dict:
+    """
+    Step 2: Load Data from Text File to a Raw Data into a Dataframe.
+    Returns:
+        {'block_frames': Block DataFrames, 'block_rollups': Hourly / Daily / Monthly Rollups, 'parse_diagnostics': Diagnostic Statistics}
+    """
+    print("\nStep 2: Load Data from Text File to a Raw Data into a Dataframe ")
+
+    btuNameList = stageInputs['file_index']['btuNameList']
+    btuBlockList = stageInputs['file_index']['btuBlockList']
+    diagnoseStatsRegisters = []
+    blockDataFrames  = {}  # Dictionary (Key-Value Pair: Key - Block 22: Data Frame)
+    blockRollups = {}      # Dictionary (Key-Value Pair: Key - Block 22: Hourly / Daily / Monthly Rollups)
+
+    # Initialize the Data Frame with Timestamps & Default Values for Missing Data(Filter Data)
+    for block in btuBlockList: 
+       blockDataFrames[block] = parse_data.initialize_Block_DataFrame(month=targetMonth, year=targetYear, blockNumber=block, meterList=btuNameList, channels=meterChannels) 
+
+    # Populate every Channel of each Meter (One Pass per Meter Folder)
+    parse_data.populate_Block_DataFrames(btuNameList, blockDataFrames, diagnoseStatsRegisters, pathDataFolder, prefixSearchCriteria, meterChannels)
+
+    # Report Files whose Content was already parsed under another Name (SCADA Re-Exports)
+    for diagnosticStatistics in diagnoseStatsRegisters:
+       if 'duplicate_of' in diagnosticStatistics:
+          print(f"Duplicate File: {diagnosticStatistics['duplicate_file']} (Same Content as {diagnosticStatistics['duplicate_of']})")
+
+    # Report the Samples flagged (or rejected) by the Anomaly Detection (Spikes, Stuck Values, Step Changes)
+    for diagnosticStatistics in diagnoseStatsRegisters:
+       if diagnosticStatistics.get('anomaly_data'):
+          ruleCounts = ', '.join(f"{key[len('anomaly_'):]} {count}" for key, count in diagnosticStatistics.items()
+                                 if key.startswith('anomaly_') and key not in ('anomaly_data', 'anomaly_timestamps', 'anomaly_action'))
+          print(f"Anomalies: {diagnosticStatistics['meter']} {diagnosticStatistics.get('channel', '')} - {diagnosticStatistics['anomaly_data']} Samples {diagnosticStatistics['anomaly_action']} ({ruleCounts})")
+
+    # Build the Rollup Pyramid (Hourly, Daily, Monthly) per Meter and per Block
+    for block in btuBlockList:
+       blockRollups[block] = rollup_data.build_Block_Rollups(blockDataFrames[block], btuNameList, block)
+
+    # Print results
+    if DEBUG_FLAG:
+        for block, df in blockDataFrames.items():
+            print(f"\nBlock {block}:")
+            print(f"Shape: {df.shape}")
+            print(f"Columns: {list(df.columns)}")
+            print(df.head())
+
+    print("\nStep 2: Completed...\n")
+    return {'block_frames': blockDataFrames, 'block_rollups': blockRollups, 'parse_diagnostics': diagnoseStatsRegisters}
+
+
+# Step 2.1: Data-Quality Matrix from the Health Bitmask of the Block DataFrames ------------------------------------------------------------ Step 2.1
+def run_Quality_Stage(stageInputs: dict) -> dict:
+    """
+    Step 2.1: Build the Data-Quality Matrix (Meter x Period Completeness) and find the Correlated Outages.
+    Returns:
+        {'quality_report': Completeness Matrices, Meter Summary and Correlated Outages}
+    """
+    print("\nStep 2.1: Build the Data-Quality Matrix (Completeness and Correlated Outages)...")
+
+    qualityReport = quality_data.build_Quality_Report(stageInputs['block_frames'], stageInputs['file_index']['btuNameList'],
+                                                      stageInputs['file_index']['btuBlockList'], QUALITY_RESOLUTIONS)
+
+    correlatedOutages = qualityReport['Correlated_Outages']
+    print(f"  {len(correlatedOutages)} Correlated Outage(s) ({qualityReport['Outage_Resolution']} Periods)")
+    for outage in correlatedOutages.itertuples(index=False):
+        print(f"  - {outage.Scope}: {outage.Start} to {outage.End} ({outage.Meters_Out} of {outage.Meters_Total} Meters out)")
+
+    print("Step 2.1: Completed...\n")
+    return {'quality_report': qualityReport}
 
 
 # Step 2.5: Calculate the Sum for Each Meter based on the Type of Meter ------------------------------------------------------------------------- Step 2.5
+def run_Categorize_Stage(stageInputs: dict) -> dict:
+    """
+    Step 2.5: Add Aggregated Columns by Meter Category.
+    Returns:
+        {'category_frames': Block DataFrames with the Category Sums, 'category_masks': One-hot Category Mask per Block,
+         'meter_filter': List of CWSA Meter Names}
+    """
+    # Insert new column after time based on the length of the list 'meterCategory' and name it after each item
+    print("\nStep 2.5: Add Aggregated Columns by Meter Category...")
 
-# Insert new column after time based on the length of the list 'meterCategory' and name it after each item
-
-print("\nStep 2.5: Add Aggregated Columns by Meter Category...")
-
-# List all the CWSA Meter Names
-meterClassification = pd.read_excel(pathMeterFilterFile)
-meterList_CWSA_Filter = meterClassification['Device Name'].dropna().tolist() 
-
-for block in btuBlockList:
-    
-    # List and Store all the Meters in the Current Process Block 
-    metersInBlock = [] # Initialize with every new Block Processed
-    for meter in btuNameList:   
-        if meter.split('_')[2] == block: 
-            metersInBlock.append(meter)
-
-    # Sum all the RT of Values for the Current Process Block
-    dataColumns_Total_RT = [] # Intialize a List to Store all the RT Names
-    for meter in metersInBlock:
-        dataColumns_Total_RT.append(f'{meter}_RT')
-
-    # Segregate & Classify 
-    dataColumns_CWSA_RT = []
-    dataColumns_Retail_RT = []
-    for meter in metersInBlock: 
-        if meter in meterList_CWSA_Filter:
-            dataColumns_CWSA_RT.append(f'{meter}_RT')
-        else:
-            dataColumns_Retail_RT.append(f'{meter}_RT')
+    btuNameList = stageInputs['file_index']['btuNameList']
+    blockDataFrames = {}
+    blockCategoryMasks = {}  # Dictionary (Key-Value Pair: Key - Block 22: One-hot Category Mask - Meters x CWSA / Retail)
 
-    # Calculate Sum of RT for each Category
-    sum_Total_RT = blockDataFrames[block][dataColumns_Total_RT].sum(axis=1)
-    sum_CWSA_RT = blockDataFrames[block][dataColumns_CWSA_RT].sum(axis=1) if dataColumns_CWSA_RT else 0.0
-    sum_Retail_RT = blockDataFrames[block][dataColumns_Retail_RT].sum(axis=1) if dataColumns_Retail_RT else 0.0
+    # List all the CWSA Meter Names
+    meterClassification = pd.read_excel(pathMeterFilterFile)
+    meterList_CWSA_Filter = meterClassification['Device Name'].dropna().tolist() 
 
-    # Insert Columns after the Time column (Index 3)
-    blockDataFrames[block].insert(3, f'Block {block} Total RT Sum', round(sum_Total_RT, 3))
-    blockDataFrames[block].insert(4, f'Block {block} CWSA RT Sum', round(sum_CWSA_RT,3))
-    blockDataFrames[block].insert(5, f'Block {block} Retail RT Sum', round(sum_Retail_RT,3))
-    blockDataFrames[block].insert(6, f'Block {block} Total Meters', len(metersInBlock))
-    blockDataFrames[block].insert(7, f'Block {block} CWSA Meters', len(dataColumns_CWSA_RT))
+    for block in stageInputs['file_index']['btuBlockList']:
+        # Insert the Category Sums (Total / CWSA / Retail RT) on a Copy - the cached 'block_frames' Artifact stays as parsed
+        # The Category Mask is reused by the Billing Engine in Step 3
+        blockDataFrames[block], blockCategoryMasks[block] = parse_data.insert_Category_Sum_Columns(stageInputs['block_frames'][block].copy(),
+                                                                                                   btuNameList, block, meterList_CWSA_Filter)
 
-print("Step 2.5: Completed...\n")
+    print("Step 2.5: Completed...\n")
+    return {'category_frames': blockDataFrames, 'category_masks': blockCategoryMasks, 'meter_filter': meterList_CWSA_Filter}
 
 
 
 # Step 3: Analyze and Process the Data into Required Output ------------------------------------------------------------------------------------- Step 3
-
-print("\nStep 3: Analyze and Process the Data into Required Output...")
-
-# Process all blocks and meters
-for block in btuBlockList:
-    
-    # Find all meters in this block
-    meters_in_block = [meter for meter in btuNameList if meter.split('_')[2] == block]
-    
-    # Analyze block-level statistics
-    block_rt_stats = analyze_data.analyze_Block_RT_Data(blockDataFrames[block], btuNameList, block, includeFaultyData = True)
-    block_rth_stats = analyze_data.analyze_Block_RTH_Data(blockDataFrames[block], btuNameList, block)
-    
-    # Print block summary
-    analyze_data.print_Block_Statistics(block, block_rt_stats, block_rth_stats)
-    
-    # Print individual meter statistics for this block
-    for meter in meters_in_block:
-        rt_stats = analyze_data.analyze_Meter_RT_Data(blockDataFrames[block], meter, includeFaultyData = True)
-        rth_stats = analyze_data.analyze_Meter_RTH_Data(blockDataFrames[block], meter)
-        # analyze_data.print_Meter_Statistics(meter, rt_stats, rth_stats)
+def run_Analyze_Stage(stageInputs: dict) -> dict:
+    """
+    Step 3: Analyze and Process the Data into Required Output.
+    Returns:
+        {'block_charges': Time-of-Use Charges per Block (Empty when the Billing Configuration is incomplete),
+         'month_end_state': Month-End State per Meter, 'month_boundary': Boundary Consumption per Block and Meter,
+         'analysis_diagnostics': Diagnostic Statistics}
+    """
+    print("\nStep 3: Analyze and Process the Data into Required Output...")
+
+    btuNameList = stageInputs['file_index']['btuNameList']
+    blockDataFrames = stageInputs['category_frames']
+    blockCategoryMasks = stageInputs['category_masks']
+    diagnoseStatsRegisters = []
+    monthEndState = {}     # Dictionary (Key-Value Pair: Key - Meter Name: Last Healthy RTH / Open Outage at Month-End)
+    blockCharges = {}      # Dictionary (Key-Value Pair: Key - Block 22: Time-of-Use Charges per Meter)
+    monthBoundary = {}     # Dictionary (Key-Value Pair: Key - Block 22: Boundary Statistics per Meter)
+
+    # Month-End State of the previous Month (Empty when that Month has not been processed)
+    previousMonthState = month_state.read_Month_End_State(pathOutputFolder, *month_state.previous_Month(targetMonth, targetYear))
+
+    # Billing Configuration (Rates and Public Holidays) - Billing is skipped rather than charged at missing Rates
+    billingConfig = billing_data.load_Billing_Config(billing_data.billing_Config_Path(pathMeterFilterFile))
+    billingProblems = billing_data.check_Billing_Config(billingConfig, targetYear)
+    if billingProblems:
+        print(f"\nWARNING: Time-of-Use Billing skipped - {'; '.join(billingProblems)} ({billing_data.billing_Config_Path(pathMeterFilterFile)})")
+
+    # Process all blocks and meters
+    for block in stageInputs['file_index']['btuBlockList']:
+        
+        # Analyze block-level statistics
+        block_rt_stats = analyze_data.analyze_Block_RT_Data(blockDataFrames[block], btuNameList, block, includeFaultyData = True)
+        block_rth_stats = analyze_data.analyze_Block_RTH_Data(blockDataFrames[block], btuNameList, block)
+        
+        # Print block summary
+        analyze_data.print_Block_Statistics(block, block_rt_stats, block_rth_stats)
+        
+        # RTH Register Resets / Rollovers (Consumption is summed per Segment)
+        for meter, meter_rth_stats in block_rth_stats['Individual_Meters'].items():
+            if meter_rth_stats['Reset_Events']:
+                print(f"  {meter}: {len(meter_rth_stats['Reset_Events'])} RTH Register Reset(s) - Billed {meter_rth_stats['Monthly_Consumption']:,.3f} (Last - First {meter_rth_stats['Monthly_Consumption_Raw']:,.3f})")
+                diagnoseStatsRegisters.append({'meter': meter, 'rth_reset_events': meter_rth_stats['Reset_Events']})
+        
+        # Month Boundary (Consumption between the previous Month-End and the first Healthy RTH of this Month)
+        block_boundary = month_state.analyze_Month_Boundary(blockDataFrames[block], btuNameList, block, previousMonthState)
+        monthBoundary[block] = block_boundary
+        if block_boundary:
+            print(f"\n  Boundary Consumption:   {sum(stats['Boundary_Consumption'] for stats in block_boundary.values()):,.3f}  ({len(block_boundary)} Meters with previous Month State)")
+            for meter, stats in block_boundary.items():
+                if stats['Boundary_Reset'] or stats['Outage_Continued']:
+                    diagnoseStatsRegisters.append({'meter': meter, 'month_boundary': stats})
+        monthEndState.update(month_state.build_Month_End_State(blockDataFrames[block], btuNameList, block, previousMonthState))
+
+        # Time-of-Use Charges (Tariff Bands x Category Rates)
+        if not billingProblems:
+            blockCharges[block] = billing_data.compute_Block_Charges(blockDataFrames[block], btuNameList, block, blockCategoryMasks[block],
+                                                                     billingConfig, targetYear, block_boundary)
+            print(f"\n  Time-of-Use Charges:    {blockCharges[block]['Total_Charge'].sum():,.2f}  ({blockCharges[block]['Total_RTH'].sum():,.3f} RTh)")
+
+        # RT vs RTH Consistency (Integrated RT compared with the RTH Register over Sliding Windows)
+        block_consistency = analyze_data.analyze_Block_RT_RTH_Consistency(blockDataFrames[block], btuNameList, block)
+        divergent_meters = [meter for meter, stats in block_consistency.items() if stats['Is_Divergent']]
+        print(f"\n  RT vs RTH Consistency:  {len(divergent_meters)} of {len(block_consistency)} Meters Divergent")
+        for meter in divergent_meters:
+            diagnoseStatsRegisters.append({'meter': meter, 'rt_rth_consistency': block_consistency[meter]})
+
+        # Channel Diagnostics (Flow / Temperatures) - Only when the Diagnostic Channels are loaded
+        if any(channel not in parse_data.BILLING_CHANNELS for channel in meterChannels):
+            block_channel_stats = analyze_data.analyze_Block_Channel_Data(blockDataFrames[block], btuNameList, block, meterChannels)
+            for meter, channel_stats in block_channel_stats.items():
+                diagnoseStatsRegisters.append({'meter': meter, 'channel_statistics': channel_stats})
+                if DEBUG_FLAG and 'Hydraulics' in channel_stats:
+                    print(f"{meter} Hydraulics: {channel_stats['Hydraulics']}")
+
+    return {'block_charges': blockCharges, 'month_end_state': monthEndState, 'month_boundary': monthBoundary,
+            'analysis_diagnostics': diagnoseStatsRegisters}
 
 
 
 # Step 4: Save a Data into an Excel File (Named by Month) - Alternative Exports are .txt file or csv
-print("\nStep 4: Save a Data into an Excel File (Named by Month)...")
-
-# Export to text file
-export_data.write_Analysis_Report(blockDataFrames, btuBlockList, btuNameList, pathOutputFolder, targetMonth, targetYear, analyze_data)
-
-# Export DataFrames to Excel
-export_data.write_DataFrames_to_Excel(blockDataFrames, btuBlockList, pathOutputFolder, targetMonth, targetYear)
-
-# Record the Python Script Runtime
-end_time = time.time()
-runtime = end_time - start_time
-
-# Export diagnostic log
-export_data.write_Diagnostic_Log(diagnoseStatsRegisters, pathOutputFolder, targetMonth, targetYear, runtime)
-
-print("\nStep 4: Completed...\n")
-print(f"\nTotal Runtime: {runtime:.2f} seconds ({runtime/60:.2f} minutes)\n")
\ No newline at end of file
+def run_Export_Stage(stageInputs: dict) -> dict:
+    """
+    Step 4: Save a Data into an Excel File (Named by Month), the Rollups, the Billing Report and the Month-End State.
+    """
+    import export_data
+    print("\nStep 4: Save a Data into an Excel File (Named by Month)...")
+
+    btuNameList = stageInputs['file_index']['btuNameList']
+    btuBlockList = stageInputs['file_index']['btuBlockList']
+    blockDataFrames = stageInputs['category_frames']
+    blockRollups = stageInputs['block_rollups']
+
+    # Export to text file
+    export_data.write_Analysis_Report(blockDataFrames, btuBlockList, btuNameList, pathOutputFolder, targetMonth, targetYear, analyze_data,
+                                      stageInputs['month_boundary'])
+
+    # Export DataFrames to Excel
+    if EXPORT_EXCEL and PARALLEL_EXCEL_EXPORT:
+        export_data.write_DataFrames_to_Excel_Parallel(blockDataFrames, btuBlockList, pathOutputFolder, targetMonth, targetYear,
+                                                       blockRollups, EXCEL_EXPORT_WORKERS)
+    elif EXPORT_EXCEL:
+        export_data.write_DataFrames_to_Excel(blockDataFrames, btuBlockList, pathOutputFolder, targetMonth, targetYear, blockRollups)
+
+    # Export DataFrames to Columnar Files (Partitioned by Block and Month)
+    if COLUMNAR_EXPORT_FORMATS:
+        export_data.write_DataFrames_to_Columnar(blockDataFrames, btuBlockList, pathOutputFolder, targetMonth, targetYear,
+                                                 COLUMNAR_EXPORT_FORMATS)
+
+    # Store the Rollups (Hourly / Daily / Monthly CSV) and Summarize the Year-To-Date from the Monthly Rollups
+    for block in btuBlockList:
+       rollup_data.write_Block_Rollups(blockRollups[block], pathOutputFolder, block, targetMonth, targetYear)
+    export_data.write_Year_To_Date_Summary(rollup_data.summarize_Year_To_Date(pathOutputFolder, targetMonth, targetYear), pathOutputFolder, targetMonth, targetYear)
+
+    # Export the Time-of-Use Charges (Not billed when the Billing Configuration is incomplete)
+    if stageInputs['block_charges']:
+        export_data.write_Billing_Report(stageInputs['block_charges'], pathOutputFolder, targetMonth, targetYear)
+
+    # Export the Data-Quality Heatmap (Completeness Matrices and Correlated Outages)
+    export_data.write_Data_Quality_Report(stageInputs['quality_report'], pathOutputFolder, targetMonth, targetYear, QUALITY_HEATMAP_IMAGE)
+
+    # Save the Month-End State for the next Month's Boundary Consumption
+    month_state.write_Month_End_State(stageInputs['month_end_state'], pathOutputFolder, targetMonth, targetYear)
+
+    # Export diagnostic log (Runtime of this Run - Skipped Stages are not re-timed)
+    export_data.write_Diagnostic_Log(stageInputs['parse_diagnostics'] + stageInputs['analysis_diagnostics'], pathOutputFolder,
+                                     targetMonth, targetYear, time.time() - start_time)
+
+    print("\nStep 4: Completed...\n")
+    return {}
+
+
+def run_Store_Stage(stageInputs: dict) -> dict:
+    """
+    Load the Minute Data and Rollups into the SQLite Store (Optional Backend).
+    """
+    import sqlite_store
+    btuNameList = stageInputs['file_index']['btuNameList']
+
+    storeConnection = sqlite_store.open_Metering_Store(pathSQLiteStore)
+    sqlite_store.write_Meter_Registry(storeConnection, btuNameList, stageInputs['meter_filter'])
+    for block in stageInputs['file_index']['btuBlockList']:
+       sqlite_store.write_Block_Minute_Data(storeConnection, stageInputs['category_frames'][block], btuNameList, block)
+       sqlite_store.write_Block_Rollups(storeConnection, stageInputs['block_rollups'][block])
+    storeConnection.close()
+    print(f"\nSQLite store updated: {pathSQLiteStore}")
+    return {}
+
+
+
+# Task Graph: Stages in Dependency Order (Inputs / Outputs are the cached Artifacts) -------------------------------------------------- Pipeline
+def build_Pipeline_Stages() -> list:
+    """
+    Task Graph of the current Run Parameters (configure_Run).
+    Returns:
+        List of Stage Dictionaries in Dependency Order
+    """
+    billingConfigFile = billing_data.billing_Config_Path(pathMeterFilterFile)
+    billingEnabled = not billing_data.check_Billing_Config(billing_data.load_Billing_Config(billingConfigFile), targetYear)
+
+    pipelineStages = [
+        pipeline_runner.define_Stage('fetch', run_Fetch_Stage, outputs=['file_index'], alwaysRun=True),
+        pipeline_runner.define_Stage('parse', run_Parse_Stage, inputs=['file_index'],
+                                     outputs=['block_frames', 'block_rollups', 'parse_diagnostics'],
+                                     parameters={'month': targetMonth, 'year': targetYear, 'channels': meterChannels},
+                                     modules=['fetch_data', 'parse_data', 'anomaly_data', 'analyze_data', 'rollup_data']),
+        pipeline_runner.define_Stage('quality', run_Quality_Stage, inputs=['file_index', 'block_frames'], outputs=['quality_report'],
+                                     parameters={'resolutions': QUALITY_RESOLUTIONS}, modules=['quality_data', 'rollup_data']),
+        pipeline_runner.define_Stage('categorize', run_Categorize_Stage, inputs=['file_index', 'block_frames'],
+                                     outputs=['category_frames', 'category_masks', 'meter_filter'],
+                                     sourceFiles=[pathMeterFilterFile], modules=['parse_data']),
+        pipeline_runner.define_Stage('analyze', run_Analyze_Stage, inputs=['file_index', 'category_frames', 'category_masks'],
+                                     outputs=['block_charges', 'month_end_state', 'month_boundary', 'analysis_diagnostics'],
+                                     parameters={'channels': meterChannels},
+                                     sourceFiles=[month_state.month_State_Path(pathOutputFolder, *month_state.previous_Month(targetMonth, targetYear)),
+                                                  billingConfigFile],
+                                     modules=['analyze_data', 'month_state', 'billing_data']),
+        pipeline_runner.define_Stage('export', run_Export_Stage,
+                                     inputs=['file_index', 'category_frames', 'block_rollups', 'block_charges', 'month_end_state', 'month_boundary',
+                                             'quality_report', 'parse_diagnostics', 'analysis_diagnostics'],
+                                     parameters={'excel': EXPORT_EXCEL, 'parallel_excel': PARALLEL_EXCEL_EXPORT, 'columnar': COLUMNAR_EXPORT_FORMATS,
+                                                 'quality_image': QUALITY_HEATMAP_IMAGE},
+                                     modules=['export_data', 'excel_package', 'rollup_data'],
+                                     sourceFiles=rollup_data.list_Rollup_Files(pathOutputFolder, targetYear,
+                                                                               MONTHS[:MONTHS.index(targetMonth)], 'monthly'),
+                                     targetFiles=[os.path.join(pathOutputFolder, "Reports", f"Data_Quality_Report_{targetMonth}_{targetYear}.xlsx"),
+                                                  month_state.month_State_Path(pathOutputFolder, targetMonth, targetYear)]
+                                                 + ([os.path.join(pathOutputFolder, "Reports", f"Billing_Report_{targetMonth}_{targetYear}.xlsx")]
+                                                    if billingEnabled else [])
+                                                 + ([os.path.join(pathOutputFolder, "Reports", f"Metering_Report_{targetMonth}_{targetYear}.xlsx")]
+                                                    if EXPORT_EXCEL else []))
+    ]
+    if pathSQLiteStore:
+        pipelineStages.append(pipeline_runner.define_Stage('store', run_Store_Stage,
+                                                           inputs=['file_index', 'meter_filter', 'category_frames', 'block_rollups'],
+                                                           parameters={'store': pathSQLiteStore}, modules=['sqlite_store'],
+                                                           targetFiles=[pathSQLiteStore]))
+    return pipelineStages
+
+
+def run_Metering_Pipeline(runStage: str = None, stopAfterStage: str = None, forceRun: bool = False) -> dict:
+    """
+    Run the Task Graph of the current Run Parameters (Stages with unchanged Inputs are skipped).
+    Args:
+        runStage: Run only this Stage from the Cache ('export') - None runs the Pipeline
+        stopAfterStage: Last Stage to run ('parse', 'analyze') - None runs every Stage
+        forceRun: Run every selected Stage even when it is up to date
+    Returns:
+        Dictionary of Stage Name to 'ran' or 'skipped'
+    """
+    global start_time
+    start_time = time.time()
+
+    # Module Progress (Processing Meter / File) goes through the Log - Per-File Records only with DEBUG_FLAG
+    metering_log.configure_Console_Logging(debugFlag = DEBUG_FLAG)
+
+    pipelineCacheFolder = os.path.join(pathOutputFolder, pipeline_runner.PIPELINE_CACHE_FOLDER, f"{targetYear}_{targetMonth}")
+    stageStatus = pipeline_runner.run_Pipeline(build_Pipeline_Stages(), pipelineCacheFolder, runStage=runStage,
+                                               forceRun=forceRun, stopAfterStage=stopAfterStage)
+
+    # Record the Python Script Runtime
+    end_time = time.time()
+    runtime = end_time - start_time
+
+    print(f"\nStages Run: {', '.join(stage for stage, status in stageStatus.items() if status == 'ran') or 'None'}")
+    print(f"\nTotal Runtime: {runtime:.2f} seconds ({runtime/60:.2f} minutes)\n")
+    return stageStatus
+
+
+# Worker Processes (Excel Sheets, Byte Ranges) re-import this Script on Windows - the Pipeline only runs in the Main Process
+if __name__ == '__main__':
+    PIPELINE_RUN_STAGE = sys.argv[1] if len(sys.argv) > 1 else None  # Read here - Importers (metering_cli, Workers) have their own Arguments
+    run_Metering_Pipeline(runStage=PIPELINE_RUN_STAGE, forceRun=PIPELINE_FORCE_RUN)
@@ -0,0 +1,108 @@
+# Project: Metering Data Parser
+# File Type: Function File
+
+# Description: Metering Log
+# Contains the Logging Layer of the Parser - Modules log through named Loggers (Levels instead of print), Pool Workers
+# send their Records through a multiprocessing Queue to one Listener in the Main Process that writes them in Batches
+
+# Aurthor: Tristan Sim
+# Date: 19/10/2026
+# Version: 1.00
+# Changelog:
+
+import sys
+import logging
+import logging.handlers
+import multiprocessing
+
+LOGGER_NAME = 'metering'
+LOG_FORMAT = '%(asctime)s %(processName)s %(levelname)s: %(message)s'
+LOG_BUFFER_RECORDS = 200  # Console Records written per Batch by the Listener of a Pool Run (Warnings and Errors are written at once)
+
+
+def get_Logger(moduleName: str) -> logging.Logger:
+    """
+    Logger of a Module (Child of the 'metering' Logger).
+    Args:
+        moduleName: Module Name ('parse_data')
+    Returns:
+        Logger - Records are only formatted when its Level is enabled
+    """
+    return logging.getLogger(f"{LOGGER_NAME}.{moduleName}")
+
+
+def build_Log_Handlers(logFilePath: str = None, bufferRecords: int = 0) -> list:
+    """
+    Output Handlers of the Log - a Console Handler and an optional Log File.
+    Args:
+        logFilePath: Path of the Log File (None: Console only)
+        bufferRecords: Console Records written per Batch (0: every Record at once)
+    Returns:
+        List of Handlers
+    """
+    consoleHandler = logging.StreamHandler(sys.stdout)
+    consoleHandler.setFormatter(logging.Formatter(LOG_FORMAT))
+    handlers = [consoleHandler]
+    if bufferRecords > 0:
+        handlers = [logging.handlers.MemoryHandler(bufferRecords, flushLevel=logging.WARNING, target=consoleHandler)]
+
+    if logFilePath:
+        fileHandler = logging.FileHandler(logFilePath, encoding='utf-8')
+        fileHandler.setFormatter(logging.Formatter(LOG_FORMAT))
+        handlers.append(fileHandler)
+
+    return handlers
+
+
+def configure_Console_Logging(debugFlag: bool = False, logFilePath: str = None):
+    """
+    Single-Process Logging - Records of every Module go straight to the Handlers.
+    Args:
+        debugFlag: Enable Debug Records (Debug-only Computations run only when enabled)
+        logFilePath: Path of the Log File (None: Console only)
+    """
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.handlers = build_Log_Handlers(logFilePath)
+    logger.setLevel(logging.DEBUG if debugFlag else logging.INFO)
+    logger.propagate = False
+
+
+def start_Log_Listener(debugFlag: bool = False, logFilePath: str = None) -> tuple:
+    """
+    Start the Log Listener of a Multiprocessing Run - the Main Process logs through the same Queue as the Workers.
+    Args:
+        debugFlag: Enable Debug Records
+        logFilePath: Path of the Log File (None: Console only)
+    Returns:
+        Tuple of (Log Queue - pass to configure_Worker_Logging as Pool initializer, QueueListener)
+    """
+    logQueue = multiprocessing.Queue(-1)
+    logListener = logging.handlers.QueueListener(logQueue, *build_Log_Handlers(logFilePath, LOG_BUFFER_RECORDS))
+    logListener.start()
+
+    configure_Worker_Logging(logQueue, debugFlag)
+    return logQueue, logListener
+
+
+def configure_Worker_Logging(logQueue, debugFlag: bool = False):
+    """
+    Route the Records of a Process into the Log Queue (Pool initializer - initargs=(logQueue, debugFlag)).
+    Args:
+        logQueue: Log Queue of start_Log_Listener
+        debugFlag: Enable Debug Records
+    """
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.handlers = [logging.handlers.QueueHandler(logQueue)]
+    logger.setLevel(logging.DEBUG if debugFlag else logging.INFO)
+    logger.propagate = False
+
+
+def stop_Log_Listener(logListener: logging.handlers.QueueListener):
+    """
+    Write the remaining Records and stop the Listener (Call after the Pool is closed).
+    Args:
+        logListener: QueueListener of start_Log_Listener
+    """
+    logListener.stop()
+    for handler in logListener.handlers:
+        handler.flush()
@@ -0,0 +1,216 @@
+# Project: Metering Data Parser
+# File Type: Function File
+
+# Description: Month State
+# Contains Functions that save the Month-End State of every Meter (Last Healthy RTH, Health, Open Outage) to a small JSON File,
+# so the next Month can compute Boundary Consumption and continue Outages without re-reading the previous Month's Files
+
+# Aurthor: Tristan Sim
+# Date: 19/10/2026
+# Version: 1.02
+# Changelog:
+# - month_State_Path - Path of a Month's State File (Declared as a Source File of the Pipeline 'analyze' Stage)
+# - Month-End State carries the Last Healthy RTH and the Open Outage Start of the previous State forward through Months without them
+
+import os
+import json
+import numpy as np
+import pandas as pd
+import parse_data
+import analyze_data
+
+MONTH_STATE_FOLDER = "Month State"
+
+# Health Bits that must be set for a Minute to count as Healthy (Outage Tracking)
+OUTAGE_HEALTH_BITS = parse_data.HEALTH_BITS['RT'] | parse_data.HEALTH_BITS['RTH']
+
+
+def previous_Month(targetMonth: str, targetYear: str) -> tuple:
+    """
+    Month before the Target Month.
+    Args:
+        targetMonth: Target month ('01')
+        targetYear: Target year ('2025')
+    Returns:
+        Tuple of (Month, Year) - ('12', '2024')
+    """
+    if targetMonth == '01':
+        return '12', str(int(targetYear) - 1)
+    return f"{int(targetMonth) - 1:02d}", targetYear
+
+
+def month_State_Path(outputPath: str, targetMonth: str, targetYear: str) -> str:
+    """
+    Path of the Month-End State File of a Month.
+    Args:
+        outputPath: Path to output folder
+        targetMonth: Target month
+        targetYear: Target year
+    Returns:
+        Path of the State File
+    """
+    return os.path.join(outputPath, MONTH_STATE_FOLDER, f"Month_State_{targetMonth}_{targetYear}.json")
+
+
+def build_Month_End_State(blockDataFrame: pd.DataFrame, meterList: list, blockNumber: str, previousState: dict = None) -> dict:
+    """
+    Month-End State of every Meter in a Block.
+    A Meter without a Healthy RTH this Month keeps the Last Healthy RTH (and its Timestamp) of the previous State,
+    and an Outage spanning the whole Month keeps the Open Outage Start of the previous State,
+    so Consumption and Outages of a multi-Month Outage are counted at the Boundary where the Meter recovers.
+    Args:
+        blockDataFrame: DataFrame containing all meter data for the block
+        meterList: List of all meter names
+        blockNumber: Block number ('82')
+        previousState: Month-End State of the previous Month (read_Month_End_State) - Default: No previous State
+    Returns:
+        Dictionary of Meter Name to {'Last_Healthy_RTH', 'Last_Healthy_RTH_Timestamp', 'Last_Health', 'Open_Outage_Start'}
+    """
+    meters_in_block = [meter for meter in meterList if meter.split('_')[2] == blockNumber]
+    if not meters_in_block:
+        return {}
+
+    rthMatrix = blockDataFrame[[f'{meter}_RTH' for meter in meters_in_block]].to_numpy(dtype='float64')
+    healthMatrix = blockDataFrame[[f'{meter}_Health' for meter in meters_in_block]].to_numpy()
+    timestamps = blockDataFrame['timestamp'].to_numpy()
+    numberOfMinutes = len(timestamps)
+
+    # Last Healthy RTH Row and last fully Healthy Minute of every Meter (-1: None this Month)
+    lastHealthyRTH = numberOfMinutes - 1 - np.argmax((rthMatrix > 0)[::-1], axis=0)
+    lastHealthyRTH[~(rthMatrix > 0).any(axis=0)] = -1
+    healthyMinutes = (healthMatrix & OUTAGE_HEALTH_BITS) == OUTAGE_HEALTH_BITS
+    lastHealthyMinute = numberOfMinutes - 1 - np.argmax(healthyMinutes[::-1], axis=0)
+    lastHealthyMinute[~healthyMinutes.any(axis=0)] = -1
+
+    if previousState is None:
+        previousState = {}
+
+    monthState = {}
+    for column, meter in enumerate(meters_in_block):
+        rthRow = lastHealthyRTH[column]
+        outageRow = lastHealthyMinute[column] + 1  # First Minute of the trailing Outage
+        meterState = previousState.get(meter, {})
+
+        if rthRow >= 0:
+            lastRTH, lastRTHTimestamp = float(rthMatrix[rthRow, column]), str(timestamps[rthRow])
+        else:
+            lastRTH, lastRTHTimestamp = meterState.get('Last_Healthy_RTH'), meterState.get('Last_Healthy_RTH_Timestamp')
+
+        if outageRow >= numberOfMinutes:
+            openOutageStart = None
+        elif outageRow == 0 and meterState.get('Open_Outage_Start') is not None:
+            openOutageStart = meterState['Open_Outage_Start']  # Outage spans the whole Month
+        else:
+            openOutageStart = str(timestamps[outageRow])
+
+        monthState[meter] = {
+            'Last_Healthy_RTH': lastRTH,
+            'Last_Healthy_RTH_Timestamp': lastRTHTimestamp,
+            'Last_Health': int(healthMatrix[-1, column]),
+            'Open_Outage_Start': openOutageStart
+        }
+
+    return monthState
+
+
+def write_Month_End_State(monthState: dict, outputPath: str, targetMonth: str, targetYear: str) -> str:
+    """
+    Save the Month-End State of all Meters.
+    Args:
+        monthState: Dictionary of Meter Name to Month-End State (build_Month_End_State of every Block)
+        outputPath: Path to output folder
+        targetMonth: Target month
+        targetYear: Target year
+    Returns:
+        Path of the State File
+    """
+    statePath = month_State_Path(outputPath, targetMonth, targetYear)
+    os.makedirs(os.path.dirname(statePath), exist_ok=True)
+
+    # Write to a temporary File first - a half-written State would break the next Month
+    with open(statePath + '.tmp', 'w') as stateFile:
+        json.dump({'Month': targetMonth, 'Year': targetYear, 'Meters': monthState}, stateFile, indent=1)
+    os.replace(statePath + '.tmp', statePath)
+
+    print(f"\nMonth-end state saved to: {statePath}")
+    return statePath
+
+
+def read_Month_End_State(outputPath: str, targetMonth: str, targetYear: str) -> dict:
+    """
+    Load the Month-End State of a Month.
+    Args:
+        outputPath: Path to output folder
+        targetMonth: Month of the State ('09')
+        targetYear: Year of the State ('2025')
+    Returns:
+        Dictionary of Meter Name to Month-End State (Empty when the Month has not been processed)
+    """
+    statePath = month_State_Path(outputPath, targetMonth, targetYear)
+    if not os.path.exists(statePath):
+        return {}
+
+    with open(statePath, 'r') as stateFile:
+        return json.load(stateFile)['Meters']
+
+
+def analyze_Month_Boundary(blockDataFrame: pd.DataFrame, meterList: list, blockNumber: str, previousState: dict) -> dict:
+    """
+    Consumption and Outages across the Boundary between the previous Month and this Month.
+    Boundary Consumption = First Healthy RTH of this Month - Last Healthy RTH of the previous Month
+    (0 with 'Boundary_Reset' when the Register dropped across the Boundary).
+    An Outage open at the previous Month-End continues when this Month starts Unhealthy.
+    Args:
+        blockDataFrame: DataFrame containing all meter data for the block
+        meterList: List of all meter names
+        blockNumber: Block number ('82')
+        previousState: Month-End State of the previous Month (read_Month_End_State)
+    Returns:
+        Dictionary of Meter Name to Boundary Statistics (Meters without a previous State are left out)
+    """
+    meters_in_block = [meter for meter in meterList if meter.split('_')[2] == blockNumber and meter in previousState]
+    if not meters_in_block:
+        return {}
+
+    rthMatrix = blockDataFrame[[f'{meter}_RTH' for meter in meters_in_block]].to_numpy(dtype='float64')
+    healthMatrix = blockDataFrame[[f'{meter}_Health' for meter in meters_in_block]].to_numpy()
+    timestamps = blockDataFrame['timestamp'].to_numpy()
+
+    # First Healthy RTH Row and first fully Healthy Minute of every Meter
+    rthHealthy = rthMatrix > 0
+    firstHealthyRTH = np.where(rthHealthy.any(axis=0), np.argmax(rthHealthy, axis=0), -1)
+    healthyMinutes = (healthMatrix & OUTAGE_HEALTH_BITS) == OUTAGE_HEALTH_BITS
+    firstHealthyMinute = np.where(healthyMinutes.any(axis=0), np.argmax(healthyMinutes, axis=0), -1)
+
+    boundaryStatistics = {}
+    for column, meter in enumerate(meters_in_block):
+        meterState = previousState[meter]
+        previousRTH = meterState['Last_Healthy_RTH']
+        rthRow = firstHealthyRTH[column]
+
+        boundaryConsumption = 0.0
+        boundaryReset = False
+        if previousRTH is not None and rthRow >= 0:
+            boundaryConsumption = float(rthMatrix[rthRow, column] - previousRTH)
+            if boundaryConsumption < -analyze_data.RTH_RESET_TOLERANCE:
+                boundaryConsumption = 0.0
+                boundaryReset = True
+
+        # Outage continued from the previous Month (ends at the first Healthy Minute of this Month)
+        outageContinued = meterState['Open_Outage_Start'] is not None and bool(firstHealthyMinute[column] != 0)
+        outageEnd = None
+        if outageContinued and firstHealthyMinute[column] > 0:
+            outageEnd = str(timestamps[firstHealthyMinute[column]])
+
+        boundaryStatistics[meter] = {
+            'Previous_Last_Healthy_RTH': previousRTH,
+            'Previous_Last_Healthy_RTH_Timestamp': meterState['Last_Healthy_RTH_Timestamp'],
+            'First_Healthy_RTH': float(rthMatrix[rthRow, column]) if rthRow >= 0 else None,
+            'Boundary_Consumption': boundaryConsumption,
+            'Boundary_Reset': boundaryReset,
+            'Outage_Continued': outageContinued,
+            'Outage_Start': meterState['Open_Outage_Start'] if outageContinued else None,
+            'Outage_End': outageEnd  # None with Outage_Continued: Outage still open at the end of this Month
+        }
+
+    return boundaryStatistics
@@ -9,8 +9,98 @@ from datetime import datetime
 
 # Import Custom Library
 import fetch_data
+import pipeline_runner
+import metering_log
 import multicore_process  # NEW: Import the worker module
 
+BLOCK_POLL_SECONDS = 1.0  # Interval between Checks of the running Blocks (Deadlines and finished Results)
+
+
+def run_blocks_with_deadlines(block_tasks: dict, num_cores: int, log_queue, debug_flag: bool, timeout_seconds: float,
+                              max_attempts: int, retry_delay_seconds: float, poll_seconds: float = BLOCK_POLL_SECONDS) -> tuple:
+    """
+    Process every Block in a Worker Pool - each Block has a Deadline measured from its Start and is retried on its own.
+    Blocks are submitted only to a free Worker, so the Deadline of a Block is not spent waiting in the Pool Queue.
+    A Block that overran keeps its Worker until only overrun Blocks are left - then the Pool is terminated and a new one
+    continues with the remaining Blocks (Blocks running within their Deadline are never interrupted).
+    An overrun Block is only submitted again to the new Pool - its first Attempt may still be writing the Block Workbook and Checkpoint.
+    Args:
+        block_tasks: Dictionary of Block Number to Arguments of multicore_process.process_block_with_checkpoint
+        num_cores: Worker Processes
+        log_queue: Log Queue of metering_log.start_Log_Listener
+        debug_flag: Debug Records of the Workers
+        timeout_seconds: Runtime of one Block before it is treated as hung
+        max_attempts: Attempts per Block (Exception or Timeout)
+        retry_delay_seconds: Pause before a failed Block is submitted again
+        poll_seconds: Interval between Checks of the running Blocks
+    Returns:
+        Tuple of (Dictionary of Block Number to Summary, Dictionary of Block Number to the Error of its last failed Attempt -
+        only Blocks that failed every Attempt)
+    """
+    logger = metering_log.get_Logger('multi_metering_data_parser')
+    queued_blocks = list(block_tasks)
+    attempts = {block_num: 0 for block_num in block_tasks}
+    submit_after = {block_num: 0.0 for block_num in block_tasks}
+    block_summaries = {}
+    block_errors = {}
+
+    def record_failure(block_num: str, error: str):
+        attempts[block_num] += 1
+        block_errors[block_num] = error
+        logger.warning("[Block %s] Attempt %d failed - %s", block_num, attempts[block_num], error)
+        if attempts[block_num] < max_attempts:
+            queued_blocks.append(block_num)
+            submit_after[block_num] = time.time() + retry_delay_seconds
+            logger.info("[Block %s] Retrying in %s seconds (Attempt %d of %d)", block_num, retry_delay_seconds, attempts[block_num] + 1, max_attempts)
+
+    while queued_blocks:
+        num_workers = min(num_cores, len(queued_blocks))
+        logger.info("Spawning %d processes for %d Blocks", num_workers, len(queued_blocks))
+        pool = Pool(processes=num_workers, initializer=metering_log.configure_Worker_Logging, initargs=(log_queue, debug_flag))
+        running_blocks = {}  # Block Number: (AsyncResult, Deadline)
+        overrun_blocks = []  # Hung Blocks still holding a Worker of this Pool
+
+        try:
+            while queued_blocks or running_blocks:
+                # Submit Blocks to the free Workers (Deadline starts now - the Block starts running at once)
+                # Blocks that overran in this Pool wait for its Termination
+                now = time.time()
+                for block_num in [block_num for block_num in queued_blocks if submit_after[block_num] <= now and block_num not in overrun_blocks]:
+                    if len(running_blocks) + len(overrun_blocks) >= num_workers:
+                        break
+                    queued_blocks.remove(block_num)
+                    running_blocks[block_num] = (pool.apply_async(multicore_process.process_block_with_checkpoint, block_tasks[block_num]),
+                                                 now + timeout_seconds)
+
+                # Collect finished Blocks, take Blocks past their Deadline out of the Run
+                for block_num, (async_result, deadline) in list(running_blocks.items()):
+                    if async_result.ready():
+                        del running_blocks[block_num]
+                        try:
+                            block_summaries[block_num] = async_result.get()
+                            block_errors.pop(block_num, None)
+                        except Exception as error:
+                            record_failure(block_num, f"{type(error).__name__}: {error}")
+                    elif time.time() > deadline:
+                        del running_blocks[block_num]
+                        overrun_blocks.append(block_num)
+                        record_failure(block_num, f"Timeout after {timeout_seconds} seconds")
+
+                # Only hung Workers left (or all Workers hung) - terminate this Pool and continue with a new one
+                if overrun_blocks and (not running_blocks or len(overrun_blocks) >= num_workers):
+                    break
+
+                if queued_blocks or running_blocks:
+                    time.sleep(poll_seconds)
+        finally:
+            pool.terminate()
+            pool.join()
+
+        # Blocks interrupted by the Termination (All Workers hung) are submitted again without counting an Attempt
+        queued_blocks.extend(running_blocks)
+
+    return block_summaries, {block_num: error for block_num, error in block_errors.items() if block_num not in block_summaries}
+
 
 def main():
     """Main execution function - must be called from if __name__ == '__main__' block"""
@@ -25,6 +115,18 @@ def main():
     DELIMITER = ';'
     NUM_CORES = 10  # Fixed: 10 blocks = 10 cores
 
+    LOG_FILE = True  # Also write the Worker Log to <MM_YYYY>/Processing_Log_MM_YYYY.txt
+
+    # Block Data Export: Columnar Files per Block and Month ('csv.gz', 'parquet' / 'feather' need pyarrow - [] disables)
+    COLUMNAR_FORMATS = ['csv.gz']
+    EXCEL_RAW_DATA_SHEET = True  # 'Raw Data' Sheet of the Block Workbook (Most of the Write Time - Disable when the Columnar Files are used)
+
+    # Checkpoint & Resume: completed Blocks are saved, a re-run only processes failed or missing Blocks
+    RESUME_FROM_CHECKPOINT = True
+    BLOCK_TIMEOUT_SECONDS = 1800  # Wait for one Block before it is treated as hung
+    MAX_ATTEMPTS = 3              # Attempts per Block (Retries on Exception or Timeout - e.g. flaky Network Storage)
+    RETRY_DELAY_SECONDS = 30      # Pause between Attempts
+
     btuNamePrefix = ["J_B_"]
     dataFilePrefix = ["X01_01_"]
     dataFilePostfix = ["BTUREADINGS11MIN.txt", "ACCBTUReadingS11MIN.txt"]
@@ -35,6 +137,9 @@ def main():
     # Track runtime
     start_time = time.time()
 
+    output_folder = os.path.join(pathOutputFolder, f"{targetMonth}_{targetYear}")
+    os.makedirs(output_folder, exist_ok=True)
+
 
     # ============================================================================
     # Step 1: Fetch all File and Folder Information (Sequential)
@@ -68,9 +173,11 @@ def main():
     print("Step 2-4: Parallel Block Processing (Using 10 Cores)")
     print("="*80)
 
+    checkpoint_folder = os.path.join(output_folder, "Checkpoints")
+
     # Prepare arguments for each block
-    block_args = [
-        (
+    block_args = {
+        block_num: (
             block_num,
             targetMonth,
             targetYear,
@@ -80,20 +187,59 @@ def main():
             dataFilePrefix,
             dataFilePostfix,
             DELIMITER,
-            False  # debug_flag per process
+            False,  # debug_flag per process
+            COLUMNAR_FORMATS,
+            EXCEL_RAW_DATA_SHEET
         )
         for block_num in BLOCK_NUMBERS
-    ]
+    }
 
-    # Execute parallel processing
-    print(f"\nSpawning {NUM_CORES} processes...\n")
+    # Input Fingerprint per Block (Size / Modified Time of its Raw Files) - New Data invalidates the Block's Checkpoint
+    block_fingerprints = {}
+    for block_num in BLOCK_NUMBERS:
+        meters_in_block = [meter for meter in btuNameList if meter.split('_')[2] == block_num]
+        block_files = [os.path.join(pathDataFolder, *file.split(DELIMITER)) for postfix in dataFilePostfix
+                       for file in fetch_data.list_File_Names(pathDataFolder, meters_in_block, dataFilePrefix[0] + targetYear + targetMonth,
+                                                              postfix, DELIMITER, False)]
+        block_fingerprints[block_num] = pipeline_runner.fingerprint_Files(block_files)
+
+    # Resume: Blocks completed by an earlier Run (Excel still present) are not processed again
+    block_summaries = {}
+    if RESUME_FROM_CHECKPOINT:
+        for block_num in BLOCK_NUMBERS:
+            summary = multicore_process.read_block_checkpoint(checkpoint_folder, block_num, block_fingerprints[block_num])
+            if summary is not None and (summary['status'] != 'success' or os.path.exists(os.path.join(output_folder, f"Block_{block_num}.xlsx"))):
+                block_summaries[block_num] = summary
+        if block_summaries:
+            print(f"\nResumed from Checkpoint: Blocks {sorted(block_summaries)}")
+
+    # Execute parallel processing - every Block has its own Deadline from its Start, only the Blocks that overran are retried
+    # Worker Output goes through one Log Listener (Debug Records and Debug-only Checks only with DEBUG_FLAG)
+    pending_blocks = [block_num for block_num in BLOCK_NUMBERS if block_num not in block_summaries]
+    log_queue, log_listener = metering_log.start_Log_Listener(
+        debugFlag=DEBUG_FLAG,
+        logFilePath=os.path.join(output_folder, f"Processing_Log_{targetMonth}_{targetYear}.txt") if LOG_FILE else None
+    )
+    try:
+        block_tasks = {block_num: (checkpoint_folder, block_fingerprints[block_num]) + block_args[block_num] for block_num in pending_blocks}
+        completed_summaries, block_errors = run_blocks_with_deadlines(block_tasks, NUM_CORES, log_queue, DEBUG_FLAG, BLOCK_TIMEOUT_SECONDS,
+                                                                      MAX_ATTEMPTS, RETRY_DELAY_SECONDS)
+        block_summaries.update(completed_summaries)
+    finally:
+        metering_log.stop_Log_Listener(log_listener)
+
+    # Blocks that failed every Attempt are reported - re-run the Program to process only these Blocks
+    pending_blocks = [block_num for block_num in pending_blocks if block_num in block_errors]
+    for block_num in pending_blocks:
+        block_summaries[block_num] = {'block_number': block_num, 'status': 'failed', 'num_meters': 0, 'error': block_errors[block_num]}
 
-    with Pool(processes=NUM_CORES) as pool:
-        # Use starmap to unpack arguments
-        block_summaries = pool.starmap(multicore_process.process_single_block, block_args)
+    block_summaries = [block_summaries[block_num] for block_num in BLOCK_NUMBERS]
 
     print("\n" + "="*80)
-    print("All Block Processing Complete ✓")
+    if pending_blocks:
+        print(f"Block Processing Incomplete ✗ - Failed Blocks: {pending_blocks} (Re-run to resume)")
+    else:
+        print("All Block Processing Complete ✓")
     print("="*80)
 
 
@@ -108,10 +254,12 @@ def main():
     successful_blocks = [s for s in block_summaries if s['status'] == 'success']
     empty_blocks = [s for s in block_summaries if s['status'] == 'empty']
     no_data_blocks = [s for s in block_summaries if s['status'] == 'no_data']
+    failed_blocks = [s for s in block_summaries if s['status'] == 'failed']
 
     print(f"\nSuccessful: {len(successful_blocks)} blocks")
     print(f"Empty: {len(empty_blocks)} blocks")
     print(f"No Data: {len(no_data_blocks)} blocks")
+    print(f"Failed: {len(failed_blocks)} blocks")
 
     # Calculate district totals
     district_summary = {
@@ -125,7 +273,6 @@ def main():
     }
 
     # Write District Summary
-    output_folder = os.path.join(pathOutputFolder, f"{targetMonth}_{targetYear}")
     os.makedirs(output_folder, exist_ok=True)
     district_summary_path = os.path.join(output_folder, "District_Summary.txt")
 
@@ -139,7 +286,12 @@ def main():
         f.write(f"Total Meters Processed: {district_summary['total_meters']}\n")
         f.write(f"Successful Blocks: {len(successful_blocks)}\n")
         f.write(f"Empty Blocks: {len(empty_blocks)}\n")
-        f.write(f"No Data Blocks: {len(no_data_blocks)}\n\n")
+        f.write(f"No Data Blocks: {len(no_data_blocks)}\n")
+        f.write(f"Failed Blocks: {len(failed_blocks)}\n\n")
+        for summary in failed_blocks:
+            f.write(f"  Block {summary['block_number']} FAILED (Not in District Totals): {summary['error']}\n")
+        if failed_blocks:
+            f.write("\n")
         
         f.write("--- RT Statistics (District) ---\n")
         f.write(f"  Total Totalized Value:        {district_summary['total_rt_totalized']:>20,.4f}\n")
@@ -169,6 +321,8 @@ def main():
     all_diagnostics = []
     for summary in successful_blocks:
         all_diagnostics.extend(summary.get('diagnostics', []))
+    for summary in failed_blocks:
+        all_diagnostics.append({'block': summary['block_number'], 'status': 'failed', 'error': summary['error']})
 
     # Write diagnostic log
     end_time = time.time()
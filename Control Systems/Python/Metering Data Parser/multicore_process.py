@@ -4,10 +4,16 @@
 
 import pandas as pd
 import os
+import pickle
+import logging
+from datetime import datetime
 import fetch_data
 import parse_data
 import analyze_data
 import export_data
+import metering_log
+
+logger = metering_log.get_Logger('multicore_process')
 
 
 def process_single_block(block_number: str, 
@@ -19,30 +25,34 @@ def process_single_block(block_number: str,
                          data_file_prefix: list,
                          data_file_postfix: list,
                          delimiter: str,
-                         debug_flag: bool = False) -> dict:
+                         debug_flag: bool = False,
+                         columnar_formats: list = None,
+                         include_raw_data: bool = True) -> dict:
     """
     Process a single block completely - from data loading to export.
     This function runs in a separate process/core.
+    columnar_formats writes the Block Data as Columnar Files ('parquet', 'feather', 'csv.gz'),
+    include_raw_data=False drops the 'Raw Data' Sheet of the Block Workbook (Slowest Sheet to write).
     
     Returns:
         Dictionary containing block summary statistics for district aggregation
     """
     
-    print(f"\n[Core Processing Block {block_number}] Starting...")
+    logger.info("[Block %s] Starting...", block_number)
     
     # Filter meters that belong to this block
     meters_in_block = [meter for meter in btu_name_list if meter.split('_')[2] == block_number]
     
     # Check if block has any meters
     if not meters_in_block:
-        print(f"[Block {block_number}] No meters found - skipping")
+        logger.info("[Block %s] No meters found - skipping", block_number)
         return {
             'block_number': block_number,
             'status': 'empty',
             'num_meters': 0
         }
     
-    print(f"[Block {block_number}] Found {len(meters_in_block)} meters")
+    logger.info("[Block %s] Found %d meters", block_number, len(meters_in_block))
     
     # Initialize diagnostics for this block
     block_diagnostics = []
@@ -71,14 +81,14 @@ def process_single_block(block_number: str,
     )
     
     if not all_rt_files and not all_rth_files:
-        print(f"[Block {block_number}] No data files found - skipping")
+        logger.info("[Block %s] No data files found - skipping", block_number)
         return {
             'block_number': block_number,
             'status': 'no_data',
             'num_meters': len(meters_in_block)
         }
     
-    print(f"[Block {block_number}] Found {len(all_rt_files)} RT files, {len(all_rth_files)} RTH files")
+    logger.info("[Block %s] Found %d RT files, %d RTH files", block_number, len(all_rt_files), len(all_rth_files))
     
     # Step 2B: Initialize DataFrame for this block
     block_dataframe = parse_data.initialize_Block_DataFrame(
@@ -90,7 +100,7 @@ def process_single_block(block_number: str,
     
     # Step 2C: Populate RT Data
     if all_rt_files:
-        print(f"[Block {block_number}] Populating RT data...")
+        logger.info("[Block %s] Populating RT data...", block_number)
         block_df_dict = {block_number: block_dataframe}
         
         parse_data.populate_Meter_DataFrame(
@@ -104,11 +114,15 @@ def process_single_block(block_number: str,
     
     # Extract the updated DataFrame back
     block_dataframe = block_df_dict[block_number]
-    print(f"[Block {block_number}] RT data populated - checking first RT column sum: {block_dataframe.filter(regex='_RT$').iloc[:, 0].sum() if len(block_dataframe.filter(regex='_RT$').columns) > 0 else 0}")
+    # Debug-only Check (Column Scan) - skipped unless Debug Logging is enabled
+    if logger.isEnabledFor(logging.DEBUG):
+        rt_columns = block_dataframe.filter(regex='_RT$')
+        logger.debug("[Block %s] RT data populated - checking first RT column sum: %s", block_number,
+                     rt_columns.iloc[:, 0].sum() if len(rt_columns.columns) > 0 else 0)
 
     # Step 2D: Populate RTH Data
     if all_rth_files:
-        print(f"[Block {block_number}] Populating RTH data...")
+        logger.info("[Block %s] Populating RTH data...", block_number)
         block_df_dict = {block_number: block_dataframe}
         
         parse_data.populate_Meter_DataFrame(
@@ -122,11 +136,14 @@ def process_single_block(block_number: str,
         
         # Extract the updated DataFrame back
         block_dataframe = block_df_dict[block_number]
-        print(f"[Block {block_number}] RTH data populated - checking first RTH column sum: {block_dataframe.filter(regex='_RTH$').iloc[:, 0].sum() if len(block_dataframe.filter(regex='_RTH$').columns) > 0 else 0}")
+        if logger.isEnabledFor(logging.DEBUG):
+            rth_columns = block_dataframe.filter(regex='_RTH$')
+            logger.debug("[Block %s] RTH data populated - checking first RTH column sum: %s", block_number,
+                         rth_columns.iloc[:, 0].sum() if len(rth_columns.columns) > 0 else 0)
 
-    print(f"[Block {block_number}] DataFrame populated - Shape: {block_dataframe.shape}")
-    print(f"[Block {block_number}] Sample data check - Row 100:")
-    print(block_dataframe.iloc[100])
+    logger.info("[Block %s] DataFrame populated - Shape: %s", block_number, block_dataframe.shape)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("[Block %s] Sample data check - Row 100:\n%s", block_number, block_dataframe.iloc[100])
     
     # Step 3: Analyze block data
     block_rt_stats = analyze_data.analyze_Block_RT_Data(
@@ -142,7 +159,7 @@ def process_single_block(block_number: str,
         blockNumber=block_number
     )
     
-    print(f"[Block {block_number}] Analysis complete")
+    logger.info("[Block %s] Analysis complete", block_number)
     
     # Step 4: Export block data
     output_folder = os.path.join(path_output_folder, f"{target_month}_{target_year}")
@@ -158,10 +175,17 @@ def process_single_block(block_number: str,
         output_folder=output_folder,
         target_month=target_month,
         target_year=target_year,
-        analyze_data_module=analyze_data
+        analyze_data_module=analyze_data,
+        include_raw_data=include_raw_data
     )
     
-    print(f"[Block {block_number}] Export complete")
+    # Export the Block Data to Columnar Files (Block Data/Year=/Month=/Block= in the Output Folder)
+    if columnar_formats:
+        columnar_files = export_data.write_Block_Columnar(block_dataframe, block_number, path_output_folder,
+                                                          target_month, target_year, columnar_formats)
+        logger.info("[Block %s] Columnar exported: %s", block_number, ', '.join(columnar_files))
+    
+    logger.info("[Block %s] Export complete", block_number)
     
     # Return lightweight summary for district aggregation
     summary = {
@@ -177,19 +201,73 @@ def process_single_block(block_number: str,
         'diagnostics': block_diagnostics
     }
     
-    print(f"[Block {block_number}] Processing complete ✓")
+    logger.info("[Block %s] Processing complete ✓", block_number)
     
     return summary
 
 
+def block_checkpoint_paths(checkpoint_folder: str, block_number: str) -> tuple:
+    """
+    Paths of the saved Block Summary and of the Completion Marker of a Block.
+    """
+    return (os.path.join(checkpoint_folder, f"Block_{block_number}_summary.pkl"),
+            os.path.join(checkpoint_folder, f"Block_{block_number}.done"))
+
+
+def read_block_checkpoint(checkpoint_folder: str, block_number: str, input_fingerprint: str):
+    """
+    Load the Summary of a Block completed by an earlier Run.
+    The Checkpoint is only valid when the Block's Raw Files are unchanged (Same Input Fingerprint).
+    
+    Returns:
+        Block Summary Dictionary, or None when the Block has to be processed
+    """
+    summary_path, marker_path = block_checkpoint_paths(checkpoint_folder, block_number)
+    if not os.path.exists(marker_path) or not os.path.exists(summary_path):
+        return None
+    
+    with open(marker_path, 'r') as f:
+        if f.readline().strip() != input_fingerprint:
+            return None
+    
+    with open(summary_path, 'rb') as f:
+        return pickle.load(f)
+
+
+def write_block_checkpoint(checkpoint_folder: str, block_number: str, input_fingerprint: str, summary: dict):
+    """
+    Save the Summary of a completed Block, then its Completion Marker (Marker last - a half-written Checkpoint is never read).
+    """
+    os.makedirs(checkpoint_folder, exist_ok=True)
+    summary_path, marker_path = block_checkpoint_paths(checkpoint_folder, block_number)
+    
+    with open(summary_path + '.tmp', 'wb') as f:
+        pickle.dump(summary, f, protocol=4)
+    os.replace(summary_path + '.tmp', summary_path)
+    
+    with open(marker_path + '.tmp', 'w') as f:
+        f.write(f"{input_fingerprint}\n{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    os.replace(marker_path + '.tmp', marker_path)
+
+
+def process_block_with_checkpoint(checkpoint_folder: str, input_fingerprint: str, *block_args) -> dict:
+    """
+    Process a single block (process_single_block) and checkpoint its Summary.
+    The Checkpoint is written by the Worker, so a completed Block survives a failure of the Main Process.
+    """
+    summary = process_single_block(*block_args)
+    write_block_checkpoint(checkpoint_folder, summary['block_number'], input_fingerprint, summary)
+    return summary
+
+
 def export_block_to_excel(block_dataframe, block_number, block_rt_stats, block_rth_stats,
                           meters_in_block, output_folder, target_month, target_year,
-                          analyze_data_module):
+                          analyze_data_module, include_raw_data=True):
     """
     Export a single block to Excel with multiple sheets:
     1. Summary - Block-level statistics
     2. Data Statistics - Per-meter statistics
-    3. Raw Data - Full DataFrame
+    3. Raw Data - Full DataFrame (Only with include_raw_data - the Columnar Export holds the same Data)
     """
     
     import pandas as pd
@@ -242,8 +320,8 @@ def export_block_to_excel(block_dataframe, block_number, block_rt_stats, block_r
         # Sheet 2: Data Statistics (per meter)
         stats_rows = []
         for meter in meters_in_block:
-            rt_stats = analyze_data_module.analyze_Meter_RT_Data(block_dataframe, meter, includeFaultyData=True)
-            rth_stats = analyze_data_module.analyze_Meter_RTH_Data(block_dataframe, meter)
+            rt_stats = block_rt_stats['Individual_Meters'][meter]    # Statistics of the Block Analysis (Segments built once per Block)
+            rth_stats = block_rth_stats['Individual_Meters'][meter]
             
             stats_rows.append({
                 'Meter_Name': meter,
@@ -261,7 +339,8 @@ def export_block_to_excel(block_dataframe, block_number, block_rt_stats, block_r
         stats_df = pd.DataFrame(stats_rows)
         stats_df.to_excel(writer, sheet_name='Data Statistics', index=False)
         
-        # Sheet 3: Raw Data
-        block_dataframe.to_excel(writer, sheet_name='Raw Data', index=False)
+        # Sheet 3: Raw Data (float32 Columns restored to the Meter Precision, without the Health Bitmask Columns)
+        if include_raw_data:
+            parse_data.restore_Float64_Precision(parse_data.drop_Health_Columns(block_dataframe)).to_excel(writer, sheet_name='Raw Data', index=False)
     
-    print(f"[Block {block_number}] Excel exported: {output_path}")
\ No newline at end of file
+    logger.info("[Block %s] Excel exported: %s", block_number, output_path)
\ No newline at end of file
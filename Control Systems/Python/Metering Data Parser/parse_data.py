@@ -7,17 +7,87 @@
 
 # Aurthor: Tristan Sim
 # Date: 11/11/2025
-# Version: 1.01
+# Version: 1.07
 # Changelog: 
+# - Precision Policy - RT stored as float32, RTH kept as float64 and Health stored as a uint8 Bitmask
+# - Minute-Grid Alignment - Samples are snapped to the Grid by Integer Bucketing (replaces the Timestamp String Merge)
+# - Six BTU Channels (RT, RTH, Flow, Supply/Return/Delta Temperature) parsed in one Pass per Meter Folder
+# - Category Mask (One-hot Meters x Categories) shared by the Category Sums and the Billing Engine
+# - Large Meter Files are parsed in parallel Byte Ranges (fetch_data.read_Raw_Text_Arrays_Parallel)
+# - Compressed Meter Files (.gz / .zip) are read as Streams
+# - Byte-identical Meter Files are parsed once (fetch_data Content Fingerprint)
+# - Progress is logged through metering_log (Per-File Records at Debug Level) instead of print
+# - Meter Files of the Month are prefetched concurrently (fetch_data.prefetch_Raw_Files) while the previous Files are parsed
+# - Spikes, Stuck Values and impossible Step Changes are rejected before the Merge (anomaly_data) - Counts in the Diagnostics
+# - Anomalies are flagged in the Anomaly Bits of a uint16 Health Bitmask (Value kept) - Rejection is opt-in (ANOMALY_REJECTION)
+# - Health Bitmask Columns are dropped from the Excel Sheets (drop_Health_Columns) - kept in the Columnar Export
 
 import pandas as pd
+import numpy as np
 from datetime import datetime
 from calendar import monthrange
 from typing import List, Tuple
 import os
 import fetch_data
+import anomaly_data
+import metering_log
 
-def initialize_Block_DataFrame(month: str, year: str, blockNumber: str, meterList: List[str]):
+logger = metering_log.get_Logger('parse_data')
+
+# Precision Policy: Storage dtype for each Column Type in the Block DataFrame
+# - RT: Instantaneous Reading (Meters only report 3 Decimal Places - float32 is sufficient)
+# - RTH: Cumulative Register (Large Magnitude - float64 required for Billing Accuracy)
+# - Health: Bitmask of Healthy Channels (Low Byte - see HEALTH_BITS) and Anomalous Channels (High Byte - see ANOMALY_BITS) per Minute
+# - FLOW / TSUPPLY / TRETURN / TDELTA: Diagnostic Channels (3 Decimal Places - float32 is sufficient)
+PRECISION_POLICY = {
+    'RT': 'float32',
+    'RTH': 'float64',
+    'FLOW': 'float32',
+    'TSUPPLY': 'float32',
+    'TRETURN': 'float32',
+    'TDELTA': 'float32',
+    'Health': 'uint16'
+}
+
+# Bit assigned to each Channel in the '{meter}_Health' Bitmask Column
+HEALTH_BITS = {
+    'RT': 1,
+    'RTH': 2,
+    'FLOW': 4,
+    'TSUPPLY': 8,
+    'TRETURN': 16,
+    'TDELTA': 32
+}
+
+# Bit set for each Channel in the '{meter}_Health' Bitmask Column where the anomaly_data Rules flagged the Minute
+ANOMALY_BITS = {channel: healthBit << 8 for channel, healthBit in HEALTH_BITS.items()}
+
+# Channels loaded into the Block DataFrame (Billing Default) and every Channel the Meters log
+BILLING_CHANNELS = ['RT', 'RTH']
+ALL_CHANNELS = ['RT', 'RTH', 'FLOW', 'TSUPPLY', 'TRETURN', 'TDELTA']
+
+# Meter Categories (The Filter Workbook lists the CWSA Meters - every other Meter is Retail)
+METER_CATEGORIES = ['CWSA', 'Retail']
+
+# Number of Decimal Places reported by the Meters (Used to restore float32 Values without Noise)
+METER_DECIMALS = 3
+
+# Minute-Grid Alignment of Raw Samples
+# - nearest: Sample is snapped to the closest Grid Point (00:00:30 rounds up to 00:01:00)
+# - floor: Sample is snapped to the Grid Point at or before it (Clock running ahead)
+# - interpolate: Grid Points are linearly interpolated between two Healthy Samples at most 2 Steps apart
+ALIGNMENT_POLICY = 'nearest'
+GRID_STEP_SECONDS = 60
+
+# Anomaly Detection of every merged File (Rules per Channel in anomaly_data.ANOMALY_RULES)
+# - Detection: Anomalous Minutes are flagged in ANOMALY_BITS - Value and Health Bit are kept (A constant Load is not a Fault)
+# - Rejection: Flagged Minutes are also Faulty Data like Negative Values (Health Bit cleared, Value zeroed) - opt-in
+ANOMALY_DETECTION = True
+ANOMALY_REJECTION = False
+
+
+def initialize_Block_DataFrame(month: str, year: str, blockNumber: str, meterList: List[str], precisionPolicy: dict = None,
+                               channels: List[str] = None):
     """
     Initialize a DataFrame for a specific block with timestamp and meter columns.
     Args:
@@ -25,11 +95,19 @@ def initialize_Block_DataFrame(month: str, year: str, blockNumber: str, meterLis
         targetYear: Year as string ('2025')
         blockNumber: Block number as string ('82')
         meterList: List of all meter names to filter meters in this block
+        precisionPolicy: Column dtypes by column type (Default: PRECISION_POLICY)
+        channels: Channels stored per meter (Default: BILLING_CHANNELS - RT and RTH)
     
     Returns:
-        DataFrame with timestamp, date, time, and meter RT/RTH columns initialized to 0.0
+        DataFrame with timestamp, date, time, and meter channel columns initialized to 0.0
+        and meter Health bitmask columns initialized to 0 (No Healthy Data)
     """
     
+    if precisionPolicy is None:
+        precisionPolicy = PRECISION_POLICY
+    if channels is None:
+        channels = BILLING_CHANNELS
+    
     month = int(month)
     year = int(year)
     
@@ -60,13 +138,95 @@ def initialize_Block_DataFrame(month: str, year: str, blockNumber: str, meterLis
         if parts[2] == blockNumber: 
             meters_In_Block.append(meter)
     
-    # Add RT and RTH columns for each meter
+    # Add Channel and Health columns for each meter (Built in one Step to avoid a Fragmented DataFrame)
+    meterColumns = {}
     for meter in meters_In_Block:
-        df[f'{meter}_RT'] = 0.0
-        df[f'{meter}_RTH'] = 0.0
+        for channel in channels:
+            meterColumns[f'{meter}_{channel}'] = np.zeros(len(df), dtype=precisionPolicy[channel])
+        meterColumns[f'{meter}_Health'] = np.zeros(len(df), dtype=precisionPolicy['Health'])
+
+    if meterColumns:
+        df = pd.concat([df, pd.DataFrame(meterColumns, index=df.index)], axis=1)
 
     return df
 
+
+def restore_Float64_Precision(dataFrame: pd.DataFrame, decimals: int = METER_DECIMALS) -> pd.DataFrame:
+    """
+    Upcast float32 columns to float64 and round to the meter precision.
+    Used before Aggregation and Export so float32 Storage Noise (12.345 -> 12.3450002670288) never reaches a Report.
+    Args:
+        dataFrame: Block DataFrame (or Subset of Columns)
+        decimals: Number of Decimal Places reported by the Meters
+    Returns:
+        Copy of the DataFrame with float32 columns restored to float64
+    """
+    float32Columns = dataFrame.select_dtypes(include=['float32']).columns
+    if len(float32Columns) == 0:
+        return dataFrame
+
+    restored = dataFrame.copy()
+    restored[float32Columns] = restored[float32Columns].astype('float64').round(decimals)
+    return restored
+
+
+def drop_Health_Columns(dataFrame: pd.DataFrame) -> pd.DataFrame:
+    """
+    Remove the '{meter}_Health' Bitmask Columns before a DataFrame is written to an Excel Sheet (Storage Columns - the Minute
+    Health is reported by the Data-Quality Report and kept in the Columnar Export).
+    Args:
+        dataFrame: Block DataFrame
+    Returns:
+        DataFrame without the Health Columns
+    """
+    return dataFrame.drop(columns=[column for column in dataFrame.columns if column.endswith('_Health')])
+
+
+def build_Category_Mask(meterNames: List[str], categoryMeters: List[str]) -> np.ndarray:
+    """
+    One-hot Category Mask of a Block (Meters x METER_CATEGORIES).
+    A (Minutes x Meters) Block Matrix multiplied by the Mask gives the per-Minute Sum of each Category.
+    Args:
+        meterNames: List of meter names (Column Order of the Block Matrix)
+        categoryMeters: List of CWSA Meter Names (Filter Workbook 'Device Name' column)
+    Returns:
+        float64 Matrix with one 1.0 per Row
+    """
+    isCWSA = np.isin(np.asarray(meterNames, dtype=object), list(categoryMeters))
+    return np.column_stack([isCWSA, ~isCWSA]).astype('float64')
+
+def insert_Category_Sum_Columns(blockDataFrame: pd.DataFrame, meterList: List[str], blockNumber: str,
+                                categoryMeters: List[str]) -> tuple:
+    """
+    Insert the per-Minute RT Sum of each Meter Category after the Time column (Index 3 - 7).
+    
+    Args:
+        blockDataFrame: Block DataFrame holding the meter columns
+        meterList: List of all meter names
+        blockNumber: Block number ('82')
+        categoryMeters: List of CWSA Meter Names (Filter Workbook 'Device Name' column)
+    Returns:
+        Tuple of (Block DataFrame, One-hot Category Mask of the Block - reused by the Billing Engine)
+    """
+    
+    metersInBlock = [meter for meter in meterList if meter.split('_')[2] == blockNumber]
+    categoryMask = build_Category_Mask(metersInBlock, categoryMeters)
+    
+    # Calculate Sum of RT for each Category (Summed in float64 - RT is stored as float32)
+    dataColumns_Total_RT = [f'{meter}_RT' for meter in metersInBlock]
+    blockRT = restore_Float64_Precision(blockDataFrame[dataColumns_Total_RT]).to_numpy(dtype='float64')
+    sum_Category_RT = blockRT @ categoryMask
+    
+    # Insert Columns after the Time column (Index 3)
+    blockDataFrame.insert(3, f'Block {blockNumber} Total RT Sum', np.round(blockRT.sum(axis=1), 3))
+    blockDataFrame.insert(4, f'Block {blockNumber} CWSA RT Sum', np.round(sum_Category_RT[:, 0], 3))
+    blockDataFrame.insert(5, f'Block {blockNumber} Retail RT Sum', np.round(sum_Category_RT[:, 1], 3))
+    blockDataFrame.insert(6, f'Block {blockNumber} Total Meters', len(metersInBlock))
+    blockDataFrame.insert(7, f'Block {blockNumber} CWSA Meters', int(categoryMask[:, 0].sum()))
+    
+    return blockDataFrame, categoryMask
+
+
 def populate_Meter_DataFrame(fileList: List[str], blockDataFrames: dict, diagnoseStatsRegisters: list, 
                              dataFolderPath: str, delimiter: str, columnSuffix: str):
     """
@@ -83,31 +243,292 @@ def populate_Meter_DataFrame(fileList: List[str], blockDataFrames: dict, diagnos
     
     for i, file in enumerate(fileList):
 
-        print(f"\nProcessing File: {file}")
+        logger.debug("Processing File: %s", file)
         
         parts = file.split(delimiter)
         meterName = parts[0]
         fileName = parts[1]
-        columnName = f'{meterName}_{columnSuffix}'
         blockNumber = meterName.split('_')[2]
         
-        # Read the raw data
+        # Read the raw data (Fast Array Parser)
         targetFilePath = os.path.join(dataFolderPath, meterName, fileName)
-        rawData, diagnosticStatistics = fetch_data.read_Raw_Text_Data(targetFilePath, debugFlag=False)
+        timestamps, values, health, diagnosticStatistics = fetch_data.read_Raw_Text_Arrays(targetFilePath)
         diagnoseStatsRegisters.append(diagnosticStatistics)
         
-        # Convert rawData to DataFrame for bulk merge
-        temp_df = pd.DataFrame(rawData)
-        temp_df['timestamp'] = temp_df['Timestamp'].dt.strftime('%Y-%m-%d %H:%M:%S')
-        temp_df['value_to_use'] = temp_df.apply(lambda row: row['Value'] if row['Health'] else 0.0, axis=1)
-        
-        # Merge with main DataFrame
-        blockDataFrames[blockNumber] = blockDataFrames[blockNumber].merge(
-            temp_df[['timestamp', 'value_to_use']], 
-            on='timestamp', 
-            how='left'
-        )
+        blockDataFrames[blockNumber] = merge_Meter_Arrays(blockDataFrames[blockNumber], timestamps, values, health,
+                                                          meterName, columnSuffix, diagnosticStatistics)
+
+
+def list_Meter_Folder_Files(meterFolderPath: str, filePrefix: str, channels: List[str]) -> List[Tuple[str, str]]:
+    """
+    Classify every File of a Meter Folder by Channel (One Directory Scan).
+    
+    Args:
+        meterFolderPath: Path to the Meter Folder
+        filePrefix: File name prefix to match ("X01_01_202510")
+        channels: Channels to load
+    Returns:
+        List of (File Name, Channel) sorted so Files are merged in Date Order - Empty when the Folder does not exist
+    """
+    
+    if not os.path.exists(meterFolderPath):
+        return []
+    
+    channelFiles = []
+    with os.scandir(meterFolderPath) as entries:
+        folderFiles = fetch_data.select_Raw_Files([entry.name for entry in entries if entry.name.startswith(filePrefix)])
+    
+    for fileName in folderFiles:
+        for channel in channels:
+            if fetch_data.strip_Compression_Suffix(fileName).endswith(fetch_data.CHANNEL_POSTFIX[channel]):
+                channelFiles.append((fileName, channel))
+                break
+    
+    return sorted(channelFiles)
+
+
+def populate_Meter_Folder(blockDataFrame: pd.DataFrame, meterName: str, diagnoseStatsRegisters: list, dataFolderPath: str,
+                          filePrefix: str, channels: List[str] = None, channelFiles: List[Tuple[str, str]] = None) -> pd.DataFrame:
+    """
+    Populate every Channel of one Meter in a single Pass over its Folder (One Directory Scan, Fast Array Parser).
+    
+    Args:
+        blockDataFrame: Block DataFrame holding the meter columns
+        meterName: Full meter name (e.g., 'J_B_82_10_27')
+        diagnoseStatsRegisters: List to append diagnostic statistics
+        dataFolderPath: Path to data folder
+        filePrefix: File name prefix to match ("X01_01_202510")
+        channels: Channels to load (Default: Channels present in the Block DataFrame)
+        channelFiles: Files of the Folder (list_Meter_Folder_Files) - Default: Scan the Folder
+    Returns:
+        Block DataFrame with the meter columns populated
+    """
+    
+    if channels is None:
+        channels = [channel for channel in ALL_CHANNELS if f'{meterName}_{channel}' in blockDataFrame.columns]
+    
+    meterFolderPath = os.path.join(dataFolderPath, meterName)
+    if channelFiles is None:
+        channelFiles = list_Meter_Folder_Files(meterFolderPath, filePrefix, channels)
+    
+    for fileName, channel in channelFiles:
+        # Re-Exported Files are served from the Parsed File Cache, large Files (Yearly Archives) are parsed in parallel Byte Ranges
+        timestamps, values, health, diagnosticStatistics = fetch_data.read_Raw_Text_Arrays_Deduplicated(os.path.join(meterFolderPath, fileName))
+        diagnosticStatistics['channel'] = channel
+        diagnoseStatsRegisters.append(diagnosticStatistics)
         
-        # Fill the column and cleanup
-        blockDataFrames[blockNumber][columnName] = blockDataFrames[blockNumber]['value_to_use'].fillna(0.0)
-        blockDataFrames[blockNumber].drop(columns=['value_to_use'], inplace=True)
\ No newline at end of file
+        blockDataFrame = merge_Meter_Arrays(blockDataFrame, timestamps, values, health, meterName, channel, diagnosticStatistics)
+    
+    return blockDataFrame
+
+
+def populate_Block_DataFrames(meterList: List[str], blockDataFrames: dict, diagnoseStatsRegisters: list, dataFolderPath: str,
+                              filePrefix: str, channels: List[str] = None):
+    """
+    Populate block DataFrames with every Channel of every Meter (One Pass per Meter Folder).
+    
+    Args:
+        meterList: List of all meter names
+        blockDataFrames: Dictionary of block DataFrames to populate
+        diagnoseStatsRegisters: List to append diagnostic statistics
+        dataFolderPath: Path to data folder
+        filePrefix: File name prefix to match ("X01_01_202510")
+        channels: Channels to load (Default: Channels present in each Block DataFrame)
+    """
+    
+    # List the Files of every Meter first - their Contents are prefetched in Parse Order while the previous Files are parsed
+    meterFiles = {}
+    for meterName in meterList:
+        blockNumber = meterName.split('_')[2]
+        meterChannels = channels if channels is not None else [channel for channel in ALL_CHANNELS
+                                                                if f'{meterName}_{channel}' in blockDataFrames[blockNumber].columns]
+        meterFiles[meterName] = list_Meter_Folder_Files(os.path.join(dataFolderPath, meterName), filePrefix, meterChannels)
+    
+    prefetchPaths = [os.path.join(dataFolderPath, meterName, fileName) for meterName in meterList for fileName, _ in meterFiles[meterName]]
+    
+    with fetch_data.prefetch_Raw_Files(prefetchPaths):
+        for meterName in meterList:
+            
+            logger.info("Processing Meter: %s", meterName)
+            
+            blockNumber = meterName.split('_')[2]
+            blockDataFrames[blockNumber] = populate_Meter_Folder(blockDataFrames[blockNumber], meterName, diagnoseStatsRegisters,
+                                                                 dataFolderPath, filePrefix, channels, meterFiles[meterName])
+
+
+def align_Samples_To_Grid(timestamps: np.ndarray, values: np.ndarray, health: np.ndarray, gridStart: np.datetime64,
+                          gridLength: int, policy: str = ALIGNMENT_POLICY, stepSeconds: int = GRID_STEP_SECONDS) -> tuple:
+    """
+    Snap raw Samples onto the Block Grid by Integer Bucketing.
+    Several Samples landing on one Grid Point are resolved deterministically - the Sample closest to the
+    Grid Point wins, and on a tie the Sample read last from the File wins.
+    Args:
+        timestamps: Sample Timestamps (datetime64)
+        values: Sample Values
+        health: Sample Health Flags
+        gridStart: Timestamp of the first Grid Row
+        gridLength: Number of Grid Rows
+        policy: 'nearest', 'floor' or 'interpolate'
+        stepSeconds: Grid Step in Seconds
+    Returns:
+        Tuple containing:
+        - rows: Grid Row Index of each aligned Sample
+        - values: Aligned Values
+        - health: Aligned Health Flags
+        - alignmentStatistics: Dictionary with snapped, dropped and duplicate Sample counts
+    """
+    seconds = (np.asarray(timestamps, dtype='datetime64[s]') - np.datetime64(gridStart, 's')).astype('int64')
+    values = np.asarray(values, dtype='float64')
+    health = np.asarray(health, dtype=bool)
+
+    if policy == 'interpolate':
+        return interpolate_Samples_To_Grid(seconds, values, health, gridLength, stepSeconds)
+
+    if policy == 'nearest':
+        buckets = np.floor_divide(seconds + stepSeconds // 2, stepSeconds)
+    elif policy == 'floor':
+        buckets = np.floor_divide(seconds, stepSeconds)
+    else:
+        raise ValueError(f"Unknown alignment policy: {policy}")
+
+    offsets = np.abs(seconds - buckets * stepSeconds)
+    inGrid = (buckets >= 0) & (buckets < gridLength)
+
+    # Order by Grid Row, then Distance to the Grid Point, then latest File Position - keep the first of each Row
+    sampleOrder = np.arange(len(seconds))
+    sortOrder = np.lexsort((-sampleOrder[inGrid], offsets[inGrid], buckets[inGrid]))
+    sortedIndex = np.flatnonzero(inGrid)[sortOrder]
+    sortedBuckets = buckets[sortedIndex]
+    firstOfRow = np.ones(len(sortedIndex), dtype=bool)
+    firstOfRow[1:] = sortedBuckets[1:] != sortedBuckets[:-1]
+    keptIndex = sortedIndex[firstOfRow]
+
+    alignmentStatistics = {
+        'snapped_samples': int(np.count_nonzero(offsets[keptIndex])),
+        'dropped_samples': int(np.count_nonzero(~inGrid)),
+        'duplicate_samples': int(np.count_nonzero(~firstOfRow))
+    }
+
+    return buckets[keptIndex], values[keptIndex], health[keptIndex], alignmentStatistics
+
+
+def interpolate_Samples_To_Grid(seconds: np.ndarray, values: np.ndarray, health: np.ndarray, gridLength: int, stepSeconds: int) -> tuple:
+    """
+    Linearly interpolate Grid Points between two Healthy Samples at most 2 Grid Steps apart
+    (Grid Points next to an Unhealthy Sample take the nearest Sample within half a Step).
+    Args:
+        seconds: Sample Offsets from the first Grid Row in Seconds
+        values: Sample Values
+        health: Sample Health Flags
+        gridLength: Number of Grid Rows
+        stepSeconds: Grid Step in Seconds
+    Returns:
+        Tuple of (rows, values, health, alignmentStatistics) - Same Layout as align_Samples_To_Grid
+    """
+    # Duplicate Timestamps keep the Sample read last from the File
+    sampleOrder = np.lexsort((np.arange(len(seconds)), seconds))
+    seconds, values, health = seconds[sampleOrder], values[sampleOrder], health[sampleOrder]
+    lastOfTimestamp = np.ones(len(seconds), dtype=bool)
+    lastOfTimestamp[:-1] = seconds[1:] != seconds[:-1]
+    duplicateSamples = int(np.count_nonzero(~lastOfTimestamp))
+    seconds, values, health = seconds[lastOfTimestamp], values[lastOfTimestamp], health[lastOfTimestamp]
+
+    emptyStatistics = {'snapped_samples': 0, 'dropped_samples': 0, 'duplicate_samples': duplicateSamples}
+    if len(seconds) == 0:
+        return np.array([], dtype='int64'), np.array([], dtype='float64'), np.array([], dtype=bool), emptyStatistics
+
+    gridSeconds = np.arange(gridLength, dtype='int64') * stepSeconds
+    right = np.clip(np.searchsorted(seconds, gridSeconds, side='left'), 0, len(seconds) - 1)
+    left = np.clip(right - 1, 0, len(seconds) - 1)
+    exact = seconds[right] == gridSeconds
+
+    # Interpolate between two Healthy Samples that bracket the Grid Point
+    bracketed = (seconds[left] < gridSeconds) & (seconds[right] > gridSeconds) & health[left] & health[right] \
+                & (seconds[right] - seconds[left] <= 2 * stepSeconds)
+    span = np.maximum(seconds[right] - seconds[left], 1)
+    weight = (gridSeconds - seconds[left]) / span
+    interpolatedValues = values[left] + weight * (values[right] - values[left])
+
+    # Otherwise take the nearest Sample within half a Step (keeps Unhealthy Samples Unhealthy)
+    nearestIndex = np.where(np.abs(seconds[left] - gridSeconds) <= np.abs(seconds[right] - gridSeconds), left, right)
+    nearestFound = np.abs(seconds[nearestIndex] - gridSeconds) <= stepSeconds // 2
+
+    filled = exact | bracketed | nearestFound
+    rows = np.flatnonzero(filled)
+    alignedValues = np.where(bracketed & ~exact, interpolatedValues, values[np.where(exact, right, nearestIndex)])[rows]
+    alignedHealth = np.where(bracketed & ~exact, True, health[np.where(exact, right, nearestIndex)])[rows]
+
+    alignmentStatistics = {
+        'snapped_samples': int(np.count_nonzero(filled & ~exact)),
+        'dropped_samples': int(np.count_nonzero((seconds < 0) | (seconds >= gridLength * stepSeconds))),
+        'duplicate_samples': duplicateSamples
+    }
+
+    return rows, alignedValues, alignedHealth, alignmentStatistics
+
+
+def merge_Meter_Arrays(blockDataFrame: pd.DataFrame, timestamps: np.ndarray, values: np.ndarray, health: np.ndarray, meterName: str,
+                       columnSuffix: str, diagnosticStatistics: dict = None, alignmentPolicy: str = ALIGNMENT_POLICY) -> pd.DataFrame:
+    """
+    Merge the parsed Column Arrays of one meter file into its block DataFrame column.
+    Samples are aligned to the Minute Grid, anomalous Samples are flagged (ANOMALY_DETECTION - rejected with ANOMALY_REJECTION)
+    and the Grid Rows spanned by the File are replaced (Missing Timestamps inside the span default to 0.0 / Unhealthy).
+    Args:
+        blockDataFrame: Block DataFrame holding the meter columns
+        timestamps: Sample Timestamps (datetime64)
+        values: Sample Values
+        health: Sample Health Flags
+        meterName: Full meter name (e.g., 'J_B_82_10_27')
+        columnSuffix: Suffix for column name ('RT', 'RTH', 'FLOW', ...)
+        diagnosticStatistics: Diagnostics of the File - Anomaly and Alignment Counts are added in place (Optional)
+        alignmentPolicy: 'nearest', 'floor' or 'interpolate'
+    Returns:
+        Block DataFrame with the meter column and Health bitmask updated
+    """
+    columnName = f'{meterName}_{columnSuffix}'
+    healthColumn = f'{meterName}_Health'
+    healthBit = HEALTH_BITS[columnSuffix]
+
+    gridStart = np.datetime64(pd.Timestamp(blockDataFrame['timestamp'].iloc[0]), 's')
+
+    rows, values, health, alignmentStatistics = align_Samples_To_Grid(
+        timestamps, values, health, gridStart, len(blockDataFrame), alignmentPolicy
+    )
+
+    if diagnosticStatistics is not None:
+        diagnosticStatistics.update(alignmentStatistics)
+
+    # Spikes, Stuck Values and impossible Step Changes are flagged (Rejected as Faulty Data only with ANOMALY_REJECTION)
+    isAnomaly = np.zeros(len(rows), dtype=bool)
+    if ANOMALY_DETECTION:
+        rowTimestamps = gridStart + rows * np.timedelta64(GRID_STEP_SECONDS, 's')
+        isAnomaly, anomalyStatistics = anomaly_data.find_Anomalies(rowTimestamps, values, health, columnSuffix)
+        anomalyStatistics['anomaly_action'] = 'rejected' if ANOMALY_REJECTION else 'flagged'
+        if ANOMALY_REJECTION:
+            health = health & ~isAnomaly
+        if diagnosticStatistics is not None:
+            diagnosticStatistics.update(anomalyStatistics)
+            if ANOMALY_REJECTION and anomalyStatistics['anomaly_data'] and diagnosticStatistics.get('total_data'):
+                diagnosticStatistics['healthy_data'] -= anomalyStatistics['anomaly_data']
+                diagnosticStatistics['faulty_data'] += anomalyStatistics['anomaly_data']
+                diagnosticStatistics['faulty_data_percentage'] = round(diagnosticStatistics['faulty_data'] / diagnosticStatistics['total_data'] * 100, 2)
+
+    # Replace the Grid Rows spanned by the File and set the Channel / Anomaly Bits in the Health Bitmask
+    channelValues = blockDataFrame[columnName].to_numpy(copy=True)
+    healthValues = blockDataFrame[healthColumn].to_numpy(copy=True)
+    bitMask = np.array(healthBit, dtype=healthValues.dtype)
+    anomalyMask = np.array(ANOMALY_BITS[columnSuffix], dtype=healthValues.dtype)
+
+    if len(rows) > 0:
+        spanStart, spanStop = rows.min(), rows.max() + 1
+        channelValues[spanStart:spanStop] = 0.0
+        healthValues[spanStart:spanStop] &= ~(bitMask | anomalyMask)
+
+        channelValues[rows] = np.where(health, values, 0.0)
+        healthValues[rows[health]] |= bitMask
+        healthValues[rows[isAnomaly]] |= anomalyMask
+
+    blockDataFrame[columnName] = channelValues
+    blockDataFrame[healthColumn] = healthValues
+
+    return blockDataFrame
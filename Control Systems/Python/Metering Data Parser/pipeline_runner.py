@@ -0,0 +1,264 @@
+# Project: Metering Data Parser
+# File Type: Function File
+
+# Description: Pipeline Runner
+# Contains a small make-style Task Graph - every Stage declares its Input and Output Artifacts, the Artifacts are
+# fingerprinted and cached on Disk, and a Stage whose Inputs, Parameters and Source Code are unchanged is skipped
+
+# Aurthor: Tristan Sim
+# Date: 19/10/2026
+# Version: 1.01
+# Changelog:
+# - Stage Modules can be given by Name (Source fingerprinted without importing the Module) - run_Pipeline can stop after a Stage
+
+import os
+import json
+import pickle
+import hashlib
+import importlib.util
+
+PIPELINE_CACHE_FOLDER = "Pipeline Cache"
+PIPELINE_MANIFEST_FILE = "Pipeline_Manifest.json"
+ARTIFACT_PICKLE_PROTOCOL = 4
+
+
+def fingerprint_Value(value) -> str:
+    """
+    Content Fingerprint of a picklable Value (Artifact or Stage Parameters).
+    Args:
+        value: Any picklable Value
+    Returns:
+        Hex Digest (blake2b)
+    """
+    return hashlib.blake2b(pickle.dumps(value, protocol=ARTIFACT_PICKLE_PROTOCOL), digest_size=16).hexdigest()
+
+
+def fingerprint_Files(filePaths: list) -> str:
+    """
+    Fingerprint of a Set of Files from their Size and Modified Time (make-style - the Contents are not read).
+    Args:
+        filePaths: List of File Paths
+    Returns:
+        Hex Digest (blake2b) - Missing Files are part of the Fingerprint
+    """
+    fileHash = hashlib.blake2b(digest_size=16)
+
+    for filePath in sorted(filePaths):
+        try:
+            fileStat = os.stat(filePath)
+            fileHash.update(f"{filePath}|{fileStat.st_size}|{fileStat.st_mtime_ns}\n".encode('utf-8'))
+        except FileNotFoundError:
+            fileHash.update(f"{filePath}|missing\n".encode('utf-8'))
+
+    return fileHash.hexdigest()
+
+
+def fingerprint_Modules(modules: list) -> str:
+    """
+    Fingerprint of the Source Code of the Modules a Stage runs (Editing a Module re-runs its Stages).
+    Args:
+        modules: List of imported Modules or Module Names (Names are located without importing the Module)
+    Returns:
+        Hex Digest (blake2b)
+    """
+    sourceHash = hashlib.blake2b(digest_size=16)
+
+    for module in modules:
+        sourcePath = importlib.util.find_spec(module).origin if isinstance(module, str) else module.__file__
+        with open(sourcePath, 'rb') as sourceFile:
+            sourceHash.update(sourceFile.read())
+
+    return sourceHash.hexdigest()
+
+
+def define_Stage(name: str, function, inputs: list = None, outputs: list = None, parameters: dict = None,
+                 sourceFiles: list = None, modules: list = None, targetFiles: list = None, alwaysRun: bool = False) -> dict:
+    """
+    Declare one Stage of the Task Graph.
+    Args:
+        name: Stage Name ('parse')
+        function: Stage Function - called with a Dictionary of its Input Artifacts, returns a Dictionary of its Output Artifacts
+        inputs: Names of the Artifacts the Stage reads
+        outputs: Names of the Artifacts the Stage produces
+        parameters: Configuration Values the Stage depends on (Target Month, Channels, ...)
+        sourceFiles: External Files the Stage reads (Filter Workbook, previous Month State)
+        modules: Modules (or Module Names) whose Source Code the Stage depends on
+        targetFiles: Files the Stage writes (The Stage re-runs when one is missing)
+        alwaysRun: Run on every Pipeline Run (Stages that scan Folders for new Files)
+    Returns:
+        Stage Dictionary
+    """
+    return {
+        'Name': name,
+        'Function': function,
+        'Inputs': inputs or [],
+        'Outputs': outputs or [],
+        'Parameters': parameters or {},
+        'Source_Files': sourceFiles or [],
+        'Modules': modules or [],
+        'Target_Files': targetFiles or [],
+        'Always_Run': alwaysRun
+    }
+
+
+def read_Pipeline_Manifest(cacheFolder: str) -> dict:
+    """
+    Load the Manifest of the last Runs (Stage and Artifact Fingerprints).
+    Args:
+        cacheFolder: Path to the Pipeline Cache Folder
+    Returns:
+        Manifest Dictionary {'Stages': {Stage: Fingerprint}, 'Artifacts': {Artifact: Fingerprint}}
+    """
+    manifestPath = os.path.join(cacheFolder, PIPELINE_MANIFEST_FILE)
+    if not os.path.exists(manifestPath):
+        return {'Stages': {}, 'Artifacts': {}}
+
+    with open(manifestPath, 'r') as manifestFile:
+        return json.load(manifestFile)
+
+
+def write_Pipeline_Manifest(manifest: dict, cacheFolder: str):
+    """
+    Save the Manifest (Written after every Stage so an interrupted Run keeps the completed Stages).
+    Args:
+        manifest: Manifest Dictionary
+        cacheFolder: Path to the Pipeline Cache Folder
+    """
+    manifestPath = os.path.join(cacheFolder, PIPELINE_MANIFEST_FILE)
+    with open(manifestPath + '.tmp', 'w') as manifestFile:
+        json.dump(manifest, manifestFile, indent=1)
+    os.replace(manifestPath + '.tmp', manifestPath)
+
+
+def save_Artifact(value, name: str, cacheFolder: str) -> str:
+    """
+    Cache an Artifact on Disk.
+    Args:
+        value: Artifact Value
+        name: Artifact Name
+        cacheFolder: Path to the Pipeline Cache Folder
+    Returns:
+        Content Fingerprint of the Artifact
+    """
+    artifactBytes = pickle.dumps(value, protocol=ARTIFACT_PICKLE_PROTOCOL)
+    artifactPath = os.path.join(cacheFolder, f"{name}.pkl")
+
+    with open(artifactPath + '.tmp', 'wb') as artifactFile:
+        artifactFile.write(artifactBytes)
+    os.replace(artifactPath + '.tmp', artifactPath)
+
+    return hashlib.blake2b(artifactBytes, digest_size=16).hexdigest()
+
+
+def load_Artifact(name: str, cacheFolder: str):
+    """
+    Load a cached Artifact.
+    Args:
+        name: Artifact Name
+        cacheFolder: Path to the Pipeline Cache Folder
+    Returns:
+        Artifact Value
+    """
+    artifactPath = os.path.join(cacheFolder, f"{name}.pkl")
+    if not os.path.exists(artifactPath):
+        raise FileNotFoundError(f"Artifact '{name}' is not cached in {cacheFolder} - run the full Pipeline once first")
+
+    with open(artifactPath, 'rb') as artifactFile:
+        return pickle.load(artifactFile)
+
+
+def fingerprint_Stage(stage: dict, manifest: dict) -> str:
+    """
+    Fingerprint of everything a Stage depends on (Input Artifacts, Parameters, Source Files and Source Code).
+    Args:
+        stage: Stage Dictionary (define_Stage)
+        manifest: Manifest Dictionary holding the current Artifact Fingerprints
+    Returns:
+        Hex Digest (blake2b)
+    """
+    return fingerprint_Value({
+        'Inputs': {name: manifest['Artifacts'].get(name) for name in stage['Inputs']},
+        'Parameters': stage['Parameters'],
+        'Source_Files': fingerprint_Files(stage['Source_Files']),
+        'Modules': fingerprint_Modules(stage['Modules'])
+    })
+
+
+def is_Stage_Up_To_Date(stage: dict, manifest: dict, cacheFolder: str) -> bool:
+    """
+    A Stage is up to date when its Fingerprint matches the last Run and all its Outputs and Target Files exist.
+    Args:
+        stage: Stage Dictionary (define_Stage)
+        manifest: Manifest Dictionary
+        cacheFolder: Path to the Pipeline Cache Folder
+    Returns:
+        True when the Stage can be skipped
+    """
+    if stage['Always_Run'] or manifest['Stages'].get(stage['Name']) != fingerprint_Stage(stage, manifest):
+        return False
+
+    outputsCached = all(name in manifest['Artifacts'] and os.path.exists(os.path.join(cacheFolder, f"{name}.pkl"))
+                        for name in stage['Outputs'])
+    return outputsCached and all(os.path.exists(filePath) for filePath in stage['Target_Files'])
+
+
+def run_Stage(stage: dict, artifacts: dict, manifest: dict, cacheFolder: str):
+    """
+    Run one Stage - missing Inputs are loaded from the Cache, Outputs are cached and fingerprinted.
+    Args:
+        stage: Stage Dictionary (define_Stage)
+        artifacts: Dictionary of Artifacts loaded in this Run (Updated in place)
+        manifest: Manifest Dictionary (Updated in place)
+        cacheFolder: Path to the Pipeline Cache Folder
+    """
+    for name in stage['Inputs']:
+        if name not in artifacts:
+            artifacts[name] = load_Artifact(name, cacheFolder)
+
+    stageOutputs = stage['Function']({name: artifacts[name] for name in stage['Inputs']})
+
+    for name in stage['Outputs']:
+        artifacts[name] = stageOutputs[name]
+        manifest['Artifacts'][name] = save_Artifact(stageOutputs[name], name, cacheFolder)
+
+    manifest['Stages'][stage['Name']] = fingerprint_Stage(stage, manifest)
+    write_Pipeline_Manifest(manifest, cacheFolder)
+
+
+def run_Pipeline(stages: list, cacheFolder: str, runStage: str = None, forceRun: bool = False, stopAfterStage: str = None) -> dict:
+    """
+    Run the Task Graph in Stage Order, skipping every Stage that is up to date.
+    Args:
+        stages: List of Stage Dictionaries in Dependency Order
+        cacheFolder: Path to the Pipeline Cache Folder
+        runStage: Run only this Stage (Inputs from the Cache of an earlier Run) - None runs the whole Pipeline
+        forceRun: Run every selected Stage even when it is up to date
+        stopAfterStage: Last Stage to run (Stages after it are left out) - None runs up to the last Stage
+    Returns:
+        Dictionary of Stage Name to 'ran' or 'skipped'
+    """
+    stageNames = [stage['Name'] for stage in stages]
+    for stageName in (runStage, stopAfterStage):
+        if stageName is not None and stageName not in stageNames:
+            raise ValueError(f"Unknown Stage: {stageName} (Stages: {', '.join(stageNames)})")
+    if stopAfterStage is not None:
+        stages = stages[:stageNames.index(stopAfterStage) + 1]
+
+    os.makedirs(cacheFolder, exist_ok=True)
+    manifest = read_Pipeline_Manifest(cacheFolder)
+    artifacts = {}
+    stageStatus = {}
+
+    for stage in stages:
+        if runStage is not None and stage['Name'] != runStage:
+            continue
+
+        if runStage is None and not forceRun and is_Stage_Up_To_Date(stage, manifest, cacheFolder):
+            print(f"\nStage '{stage['Name']}': Up to date - skipped")
+            stageStatus[stage['Name']] = 'skipped'
+            continue
+
+        run_Stage(stage, artifacts, manifest, cacheFolder)
+        stageStatus[stage['Name']] = 'ran'
+
+    return stageStatus
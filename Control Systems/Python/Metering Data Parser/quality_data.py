@@ -0,0 +1,182 @@
+# Project: Metering Data Parser
+# File Type: Function File
+
+# Description: Quality Data
+# Contains the Data-Quality Functions - a Meter x Day (or Hour) Completeness Matrix of the District built from the Health
+# Bitmask of the in-memory Block DataFrames (No File Reads), and the Outages shared by many Meters at the same Time
+
+# Aurthor: Tristan Sim
+# Date: 19/10/2026
+# Version: 1.00
+# Changelog:
+
+import numpy as np
+import pandas as pd
+import parse_data
+import rollup_data
+
+QUALITY_CHANNEL = 'RT'               # Health Bit counted as Complete Data
+QUALITY_RESOLUTIONS = ['daily', 'hourly']
+
+# Correlated Outages - a Period is an Outage of a Meter below OUTAGE_COMPLETENESS, a Period of a Scope (Block or District)
+# is a Correlated Outage when at least CORRELATED_OUTAGE_FRACTION of its Meters (and CORRELATED_OUTAGE_MIN_METERS) are out
+OUTAGE_COMPLETENESS = 0.5
+CORRELATED_OUTAGE_FRACTION = 0.5
+CORRELATED_OUTAGE_MIN_METERS = 2
+DISTRICT_SCOPE = 'District'
+
+OUTAGE_COLUMNS = ['Scope', 'Start', 'End', 'Periods', 'Meters_Out', 'Meters_Total', 'Meters']
+
+
+def build_Block_Completeness(blockDataFrame: pd.DataFrame, meterList: list, blockNumber: str, resolution: str,
+                             channel: str = QUALITY_CHANNEL) -> pd.DataFrame:
+    """
+    Completeness of every Meter in a Block per Period (Share of Minutes with the Channel's Health Bit set).
+    Args:
+        blockDataFrame: DataFrame containing all meter data for the block
+        meterList: List of all meter names
+        blockNumber: Block number ('82')
+        resolution: 'hourly', 'daily' or 'monthly'
+        channel: Channel whose Health Bit is counted (Default: QUALITY_CHANNEL)
+    Returns:
+        DataFrame (Meters x Period Labels) of Completeness between 0.0 and 1.0
+    """
+    metersInBlock = [meter for meter in meterList if meter.split('_')[2] == blockNumber]
+    periodLabels = rollup_data.list_Period_Labels(blockDataFrame, resolution)
+
+    # (Minutes x Meters) Health Matrix -> (Periods x Minutes per Period x Meters) -> Mean over the Minutes
+    healthMatrix = blockDataFrame[[f'{meter}_Health' for meter in metersInBlock]].to_numpy()
+    healthy = (healthMatrix & parse_data.HEALTH_BITS[channel]) > 0
+    completeness = healthy.reshape(len(periodLabels), -1, len(metersInBlock)).mean(axis=1)
+
+    return pd.DataFrame(completeness.T, index=pd.Index(metersInBlock, name='Meter'), columns=periodLabels)
+
+
+def build_District_Completeness(blockDataFrames: dict, meterList: list, blockList: list, resolution: str,
+                                channel: str = QUALITY_CHANNEL) -> pd.DataFrame:
+    """
+    Completeness Matrix of the District - the Block Matrices stacked in Block Order.
+    Args:
+        blockDataFrames: Dictionary of block DataFrames
+        meterList: List of all meter names
+        blockList: List of block numbers
+        resolution: 'hourly', 'daily' or 'monthly'
+        channel: Channel whose Health Bit is counted
+    Returns:
+        DataFrame (Meters x Period Labels) of Completeness between 0.0 and 1.0
+    """
+    return pd.concat([build_Block_Completeness(blockDataFrames[block], meterList, block, resolution, channel) for block in blockList])
+
+
+def build_Scope_Mask(meterNames: list, blockList: list) -> tuple:
+    """
+    One-hot Scope Mask (Meters x Blocks + District) - the Outage Matrix multiplied by the Mask counts the Meters out per Scope.
+    Args:
+        meterNames: List of meter names (Row Order of the Completeness Matrix)
+        blockList: List of block numbers
+    Returns:
+        Tuple of (Scope Names ['Block 82', ..., 'District'], float64 Mask)
+    """
+    meterBlocks = np.asarray([meter.split('_')[2] for meter in meterNames], dtype=object)
+    blockMask = meterBlocks[:, None] == np.asarray(blockList, dtype=object)[None, :]
+    scopeMask = np.column_stack([blockMask, np.ones(len(meterNames), dtype=bool)]).astype('float64')
+    return [f'Block {block}' for block in blockList] + [DISTRICT_SCOPE], scopeMask
+
+
+def find_Correlated_Outages(completeness: pd.DataFrame, blockList: list, outageCompleteness: float = OUTAGE_COMPLETENESS,
+                            minimumFraction: float = CORRELATED_OUTAGE_FRACTION,
+                            minimumMeters: int = CORRELATED_OUTAGE_MIN_METERS) -> pd.DataFrame:
+    """
+    Outages shared by many Meters of a Block (or of the District) in the same Periods - consecutive Periods form one Event.
+    Args:
+        completeness: Completeness Matrix (build_District_Completeness)
+        blockList: List of block numbers
+        outageCompleteness: A Meter is out in a Period below this Completeness
+        minimumFraction: Share of the Scope's Meters out at the same Time
+        minimumMeters: Minimum Number of Meters out at the same Time
+    Returns:
+        DataFrame of Outage Events (Scope, First / Last Period, Periods, Most Meters out at once, Meters in the Scope,
+        Meters out during the Event)
+    """
+    meterNames = list(completeness.index)
+    periodLabels = list(completeness.columns)
+    isOutage = completeness.to_numpy() < outageCompleteness
+    scopeNames, scopeMask = build_Scope_Mask(meterNames, blockList)
+
+    # Meters out per Scope and Period (Scopes x Periods)
+    metersOut = scopeMask.T @ isOutage
+    metersTotal = scopeMask.sum(axis=0)
+    isCorrelated = (metersOut >= minimumMeters) & (metersOut >= minimumFraction * metersTotal[:, None])
+
+    # Events: Runs of consecutive correlated Periods (Rising / Falling Edges of each Scope Row)
+    edges = np.diff(np.pad(isCorrelated.astype(np.int8), ((0, 0), (1, 1))), axis=1)
+    eventRows = []
+    for (scopeIndex, eventStart), eventEnd in zip(np.argwhere(edges == 1), np.argwhere(edges == -1)[:, 1]):
+        scopeMeters = scopeMask[:, scopeIndex] > 0
+        outMeters = scopeMeters & isOutage[:, eventStart:eventEnd].any(axis=1)
+        eventRows.append({
+            'Scope': scopeNames[scopeIndex],
+            'Start': periodLabels[eventStart],
+            'End': periodLabels[eventEnd - 1],
+            'Periods': int(eventEnd - eventStart),
+            'Meters_Out': int(metersOut[scopeIndex, eventStart:eventEnd].max()),
+            'Meters_Total': int(metersTotal[scopeIndex]),
+            'Meters': ', '.join(meter for meter, isOut in zip(meterNames, outMeters) if isOut)
+        })
+
+    return pd.DataFrame(eventRows, columns=OUTAGE_COLUMNS)
+
+
+def summarize_Meter_Quality(completeness: pd.DataFrame, outageCompleteness: float = OUTAGE_COMPLETENESS) -> pd.DataFrame:
+    """
+    Quality Summary of every Meter from a Completeness Matrix.
+    Args:
+        completeness: Completeness Matrix (Meters x Periods)
+        outageCompleteness: A Meter is out in a Period below this Completeness
+    Returns:
+        DataFrame with one Row per Meter (Completeness %, Periods out, longest Run of Periods out)
+    """
+    isOutage = completeness.to_numpy() < outageCompleteness
+
+    # Longest Run of Outage Periods: Position of each Period minus the Position of the last Period that was not out
+    periodIndex = np.arange(isOutage.shape[1])
+    lastAvailable = np.maximum.accumulate(np.where(isOutage, -1, periodIndex), axis=1)
+    longestOutage = (periodIndex - lastAvailable).max(axis=1, initial=0)
+
+    return pd.DataFrame({
+        'Meter': completeness.index,
+        'Block': [meter.split('_')[2] for meter in completeness.index],
+        'Completeness_Percentage': np.round(completeness.to_numpy().mean(axis=1) * 100, 2),
+        'Periods_Out': isOutage.sum(axis=1),
+        'Longest_Outage_Periods': longestOutage
+    })
+
+
+def build_Quality_Report(blockDataFrames: dict, meterList: list, blockList: list, resolutions: list = None,
+                         channel: str = QUALITY_CHANNEL) -> dict:
+    """
+    Data-Quality Report of the District - Completeness Matrices, Meter Summary and Correlated Outages.
+    Outages are found at the finest Resolution (An Hour without Data is lost in a Daily Completeness of 96%).
+    Args:
+        blockDataFrames: Dictionary of block DataFrames
+        meterList: List of all meter names
+        blockList: List of block numbers
+        resolutions: Resolutions of the Completeness Matrices (Default: QUALITY_RESOLUTIONS)
+        channel: Channel whose Health Bit is counted
+    Returns:
+        Dictionary {'Completeness': {Resolution: Matrix}, 'Meter_Summary': DataFrame, 'Correlated_Outages': DataFrame,
+                    'Outage_Resolution': Resolution of the Outages}
+    """
+    if resolutions is None:
+        resolutions = QUALITY_RESOLUTIONS
+
+    completeness = {resolution: build_District_Completeness(blockDataFrames, meterList, blockList, resolution, channel)
+                    for resolution in resolutions}
+    outageResolution = max(resolutions, key=lambda resolution: completeness[resolution].shape[1])
+
+    return {
+        'Completeness': completeness,
+        'Meter_Summary': summarize_Meter_Quality(completeness[outageResolution]),
+        'Correlated_Outages': find_Correlated_Outages(completeness[outageResolution], blockList),
+        'Outage_Resolution': outageResolution
+    }
@@ -0,0 +1,209 @@
+# Project: Metering Data Parser
+# File Type: Function File
+
+# Description: Query Data
+# Contains Functions to Query the Readings of selected Meters, Blocks or Meter Categories over a Time Range
+# Only the Files covering the Time Range are read (Directory Index) and parsed Files are kept in a Column Cache
+
+# Aurthor: Tristan Sim
+# Date: 19/10/2026
+# Version: 1.01
+# Changelog:
+# - Files are read by the Fast Array Parser - only the Days of the Time Range (fetch_data.read_Raw_Text_Arrays_Days)
+# - Unhealthy Readings are left out of the Resampling (NaN) instead of counting as 0.0
+
+import os
+from collections import OrderedDict
+from datetime import datetime, timedelta
+import numpy as np
+import pandas as pd
+import fetch_data
+
+# Search Criteria used to build the Directory Index
+btuNamePrefix = ["J_B_"]
+dataFilePrefix = "X01_01_"
+
+# Column Cache: (File Path, Size, Modified Time, Days) -> (Timestamps, Values, Health) Arrays of a parsed File
+COLUMN_CACHE_SIZE = 256
+columnCache = OrderedDict()
+
+# Resolutions supported by query() (pandas Resample Frequency)
+QUERY_RESOLUTIONS = {
+    '1min': None,
+    'hourly': 'h',
+    'daily': 'D',
+    'monthly': 'MS'
+}
+
+# Default Aggregation per Channel when Resampling (RTH is a Cumulative Register) - Unhealthy Readings are not aggregated
+CHANNEL_AGGREGATION = {
+    'RT': 'mean',
+    'RTH': 'last'
+}
+
+
+def list_Query_Days(start: datetime, end: datetime) -> tuple:
+    """
+    List the Dates touched by a Time Range.
+    Args:
+        start: Start of the Time Range (inclusive)
+        end: End of the Time Range (exclusive)
+    Returns:
+        Tuple of Dates 'YYYY-MM-DD'
+    """
+    lastDay = (end - timedelta(microseconds=1)).date()
+    numberOfDays = (lastDay - start.date()).days + 1
+    return tuple((start.date() + timedelta(days=day)).isoformat() for day in range(max(numberOfDays, 0)))
+
+
+def read_File_Columns(filePath: str, days: tuple) -> tuple:
+    """
+    Read the given Days of a raw meter file as Column Arrays (Served from the Column Cache when the File is unchanged).
+    Args:
+        filePath: Full path to the text file
+        days: Dates 'YYYY-MM-DD' to read (list_Query_Days)
+    Returns:
+        Tuple of (Timestamps datetime64 Array, Values float64 Array, Health bool Array) - may hold Rows of other Days
+    """
+    fileStat = os.stat(filePath)
+    cacheKey = (filePath, fileStat.st_size, fileStat.st_mtime_ns, days)
+
+    if cacheKey in columnCache:
+        columnCache.move_to_end(cacheKey)
+        return columnCache[cacheKey]
+
+    timestamps, values, health, _ = fetch_data.read_Raw_Text_Arrays_Days(filePath, list(days))
+    columns = (timestamps.astype('datetime64[ns]'), values, health)
+
+    columnCache[cacheKey] = columns
+    if len(columnCache) > COLUMN_CACHE_SIZE:
+        columnCache.popitem(last=False)
+
+    return columns
+
+
+def select_Files_In_Range(channelFiles: list, start: datetime, end: datetime) -> list:
+    """
+    Select the Files of one Meter Channel that can hold Readings between start and end.
+    A File covers its File Date up to the next File Date (and never past the end of its Month).
+    Args:
+        channelFiles: Sorted List of (File Date 'YYYYMMDD', File Name) from the Directory Index
+        start: Start of the Time Range (inclusive)
+        end: End of the Time Range (exclusive)
+    Returns:
+        List of File Names to read
+    """
+    selectedFiles = []
+
+    for i, (fileDate, fileName) in enumerate(channelFiles):
+        try:
+            coverageStart = datetime.strptime(fileDate, '%Y%m%d')
+        except ValueError:
+            selectedFiles.append(fileName)  # File Date unknown - File has to be read
+            continue
+
+        nextMonth = (coverageStart.replace(day=1) + timedelta(days=32)).replace(day=1)
+        coverageEnd = nextMonth
+        if i + 1 < len(channelFiles):
+            try:
+                coverageEnd = min(nextMonth, datetime.strptime(channelFiles[i + 1][0], '%Y%m%d'))
+            except ValueError:
+                pass
+
+        if coverageStart < end and coverageEnd > start:
+            selectedFiles.append(fileName)
+
+    return selectedFiles
+
+
+def resolve_Query_Meters(directoryIndex: dict, meters: list = None, blocks: list = None, category: str = None,
+                         categoryMeters: list = None) -> list:
+    """
+    Resolve the Meter Selection of a Query.
+    Args:
+        directoryIndex: Directory Index (fetch_data.build_Directory_Index)
+        meters: List of Meter Names
+        blocks: List of Block Numbers (['82', '84'])
+        category: 'CWSA' or 'Retail'
+        categoryMeters: List of CWSA Meter Names (Filter Workbook 'Device Name' column) - required for category
+    Returns:
+        Sorted List of Meter Names
+    """
+    selectedMeters = set(directoryIndex.keys())
+
+    if meters is not None:
+        selectedMeters &= set(meters)
+    if blocks is not None:
+        selectedMeters = {meter for meter in selectedMeters if meter.split('_')[2] in blocks}
+    if category is not None:
+        if categoryMeters is None:
+            raise ValueError("categoryMeters is required to query by category")
+        if category == 'CWSA':
+            selectedMeters &= set(categoryMeters)
+        elif category == 'Retail':
+            selectedMeters -= set(categoryMeters)
+        else:
+            raise ValueError(f"Unknown meter category: {category}")
+
+    return sorted(selectedMeters)
+
+
+def query(pathDataFolder: str, start, end, meters: list = None, blocks: list = None, category: str = None,
+          channel: str = 'RT', resolution: str = '1min', categoryMeters: list = None, directoryIndex: dict = None,
+          asArrays: bool = False):
+    """
+    Query the Readings of selected Meters over a Time Range.
+    Args:
+        pathDataFolder: Path to the Parent data folder (PDD_BTUmeter)
+        start: Start of the Time Range (inclusive) - datetime or '2025-10-01 00:00:00'
+        end: End of the Time Range (exclusive) - datetime or '2025-10-08 00:00:00'
+        meters: List of Meter Names (Default: All Meters)
+        blocks: List of Block Numbers
+        category: 'CWSA' or 'Retail' (Requires categoryMeters)
+        channel: 'RT' or 'RTH'
+        resolution: '1min', 'hourly', 'daily' or 'monthly'
+        categoryMeters: List of CWSA Meter Names
+        directoryIndex: Directory Index to reuse between Queries (Default: built for this Query)
+        asArrays: Return a Dictionary of numpy Arrays instead of a DataFrame
+    Returns:
+        DataFrame indexed by Timestamp with one Column per Meter (Unhealthy Readings are 0.0 at '1min' and left out of
+        the other Resolutions), or Dictionary {'timestamp': Array, Meter Name: Array} when asArrays is True
+    """
+    start = pd.Timestamp(start).to_pydatetime()
+    end = pd.Timestamp(end).to_pydatetime()
+    queryDays = list_Query_Days(start, end)
+    unhealthyValue = 0.0 if QUERY_RESOLUTIONS[resolution] is None else np.nan  # NaN is skipped by mean / last
+
+    if directoryIndex is None:
+        directoryIndex = fetch_data.build_Directory_Index(pathDataFolder, btuNamePrefix, dataFilePrefix)
+
+    meterSeries = {}
+    for meterName in resolve_Query_Meters(directoryIndex, meters, blocks, category, categoryMeters):
+        timestampParts, valueParts = [], []
+
+        for fileName in select_Files_In_Range(directoryIndex[meterName].get(channel, []), start, end):
+            timestamps, values, health = read_File_Columns(os.path.join(pathDataFolder, meterName, fileName), queryDays)
+            inRange = (timestamps >= np.datetime64(start)) & (timestamps < np.datetime64(end))
+            timestampParts.append(timestamps[inRange])
+            valueParts.append(np.where(health[inRange], values[inRange], unhealthyValue))
+
+        if timestampParts:
+            meterSeries[meterName] = pd.Series(np.concatenate(valueParts), index=pd.DatetimeIndex(np.concatenate(timestampParts)))
+        else:
+            meterSeries[meterName] = pd.Series(dtype='float64', index=pd.DatetimeIndex([]))
+
+        # Duplicate Timestamps (Overlapping Files) keep the last Reading
+        meterSeries[meterName] = meterSeries[meterName][~meterSeries[meterName].index.duplicated(keep='last')].sort_index()
+
+    result = pd.DataFrame(meterSeries)
+    result.index.name = 'timestamp'
+
+    if QUERY_RESOLUTIONS[resolution] is not None:
+        result = result.resample(QUERY_RESOLUTIONS[resolution]).agg(CHANNEL_AGGREGATION.get(channel, 'mean'))
+
+    if asArrays:
+        arrays = {'timestamp': result.index.to_numpy()}
+        arrays.update({meterName: result[meterName].to_numpy() for meterName in result.columns})
+        return arrays
+
+    return result
@@ -4,8 +4,12 @@
 # 
 # Author: Tristan Sim
 # Date: 04/12/2025
-# Version: 1.0
+# Version: 1.2
+# Changelog:
+# - Conversion runs in convert_day (Called by main() and the metering_cli 'convert-day' Command)
+# - Only the Byte Range of the Target Day is read (Day Offset Index of fetch_data) - irregular Files are scanned whole
 
+import io
 import os
 import time
 from datetime import datetime
@@ -44,13 +48,10 @@ outputFileNames = [
     "TEMPDeltaS11MIN"
 ]
 
-# Track runtime
-start_time = time.time()
-
-
 def filter_data_by_day(input_file_path: str, output_file_path: str, target_date: str, debug: bool = False) -> dict:
     """
     Read .dat file and filter data by target day, save to .txt file.
+    Only the byte range of the target day is read when the file can be indexed (fetch_data.index_Day_Offsets).
     
     Args:
         input_file_path: Path to input .dat file
@@ -95,7 +96,21 @@ def filter_data_by_day(input_file_path: str, output_file_path: str, target_date:
                 'error': 'Could not open file with any encoding'
             }
         
-        with open(input_file_path, 'r', encoding=used_encoding) as input_file:
+        # Byte Range of the Target Day from the Day Offset Index (Memory-mapped Newline Scan) - the other Days are not read
+        day_range = None
+        if fetch_data.MMAP_PARSER and not fetch_data.is_Compressed(input_file_path):
+            day_offsets = fetch_data.index_Day_Offsets(input_file_path)
+            if day_offsets is not None:
+                day_range = day_offsets.get(target_date, (0, 0))
+        
+        if day_range is not None:
+            with open(input_file_path, 'rb') as raw_file:
+                raw_file.seek(day_range[0])
+                input_file = io.TextIOWrapper(io.BytesIO(raw_file.read(day_range[1] - day_range[0])), encoding=used_encoding)
+        else:
+            input_file = open(input_file_path, 'r', encoding=used_encoding)
+        
+        with input_file:
             with open(output_file_path, 'w', encoding='utf-8') as output_file:
                 
                 first_data_line = None
@@ -151,6 +166,7 @@ def filter_data_by_day(input_file_path: str, output_file_path: str, target_date:
             'parse_errors': parse_errors,
             'date_mismatches': date_mismatches,
             'first_data_line': first_data_line,
+            'day_indexed': day_range is not None,
             'success': True
         }
         
@@ -221,7 +237,7 @@ def process_all_meters(meter_list: list, file_lists: list, file_types: list, out
                 if stats['lines_written'] > 0:
                     print(f"{meter_name}: {stats['lines_written']} lines")
                 else:
-                    print(f"{meter_name}: 0 lines (read:{stats['lines_read']}, comments:{stats['skipped_comments']}, mismatches:{stats['date_mismatches']}, first_line:{stats.get('first_data_line', 'None')[:40]}...)")
+                    print(f"{meter_name}: 0 lines (read:{stats['lines_read']}, comments:{stats['skipped_comments']}, mismatches:{stats['date_mismatches']}, first_line:{str(stats.get('first_data_line'))[:40]}...)")
             else:
                 print(f"{meter_name}: Failed")
             
@@ -234,63 +250,100 @@ def process_all_meters(meter_list: list, file_lists: list, file_types: list, out
     return total_files_processed, total_files_success, total_lines_written, conversion_stats
 
 
-# Main execution
-print(f"\nDATA TO TXT CONVERTER - {targetYear}-{targetMonth}-{targetDay}")
-print(f"Input:  {pathDataFolder}")
-print(f"Output: {pathOutputFolder}\n")
-
-# Step 1: Fetch meter folders
-print("Fetching meters...")
-btuNameList = fetch_data.list_Folder_Names(
-    folderPath=pathDataFolder, 
-    namePrefix=["J_B_"], 
-    debugFlag=False
-)
-btuBlockList = fetch_data.list_Meter_Blocks(nameList=btuNameList)
-print(f"Found {len(btuNameList)} meters in {len(btuBlockList)} blocks")
-
-# Step 2: Fetch file names
-print("\nFetching files...")
-prefixSearchCriteria = dataFilePrefix[0] + targetYear + targetMonth
-
-all_file_lists = []
-for postfix in dataFilePostfix:
-    file_list = fetch_data.list_File_Names(
-        parentFolderPath=pathDataFolder,
-        childFolderNames=btuNameList,
-        prefix=prefixSearchCriteria,
-        postfix=postfix,
-        delimiter=DELIMITER,
+def convert_day(data_folder: str, output_folder: str, year: str, month: str, day: str,
+                delimiter: str = DELIMITER, debug: bool = False) -> dict:
+    """
+    Convert the monthly .dat files of every meter into .txt files of the target day.
+    
+    Args:
+        data_folder: Path to the Raw Data Files folder
+        output_folder: Path to the output folder (Year=/Month=/Date=/Meter partitions)
+        year: Target year ('2025')
+        month: Target month ('10')
+        day: Target day ('07')
+        delimiter: Delimiter between meter folder and file name
+        debug: Enable debug output
+    
+    Returns:
+        Dictionary with the processed / successful file counts, lines written, runtime and per-file statistics
+    """
+    
+    # Track runtime
+    start_time = time.time()
+    
+    print(f"\nDATA TO TXT CONVERTER - {year}-{month}-{day}")
+    print(f"Input:  {data_folder}")
+    print(f"Output: {output_folder}\n")
+    
+    # Step 1: Fetch meter folders
+    print("Fetching meters...")
+    btuNameList = fetch_data.list_Folder_Names(
+        folderPath=data_folder, 
+        namePrefix=["J_B_"], 
         debugFlag=False
     )
-    all_file_lists.append(file_list)
-
-total_files = sum(len(fl) for fl in all_file_lists)
-print(f"Found {total_files} files to process")
+    btuBlockList = fetch_data.list_Meter_Blocks(nameList=btuNameList)
+    print(f"Found {len(btuNameList)} meters in {len(btuBlockList)} blocks")
+    
+    # Step 2: Fetch file names
+    print("\nFetching files...")
+    prefixSearchCriteria = dataFilePrefix[0] + year + month
+    
+    all_file_lists = []
+    for postfix in dataFilePostfix:
+        file_list = fetch_data.list_File_Names(
+            parentFolderPath=data_folder,
+            childFolderNames=btuNameList,
+            prefix=prefixSearchCriteria,
+            postfix=postfix,
+            delimiter=delimiter,
+            debugFlag=False
+        )
+        all_file_lists.append(file_list)
+    
+    total_files = sum(len(fl) for fl in all_file_lists)
+    print(f"Found {total_files} files to process")
+    
+    # Step 3: Convert files
+    print("\nConverting files...")
+    target_date = f"{year}-{month}-{day}"
+    
+    processed, success, lines, stats = process_all_meters(
+        meter_list=btuNameList,
+        file_lists=all_file_lists,
+        file_types=dataFilePostfix,
+        output_names=outputFileNames,
+        data_folder=data_folder,
+        output_folder=output_folder,
+        target_date=target_date,
+        year=year,
+        month=month,
+        day=day,
+        delimiter=delimiter,
+        debug=debug
+    )
+    
+    # Summary
+    end_time = time.time()
+    runtime = end_time - start_time
+    
+    print(f"Files processed: {processed}")
+    print(f"Files success:   {success}")
+    print(f"Runtime:         {runtime:.2f}s")
+    
+    return {
+        'files_processed': processed,
+        'files_success': success,
+        'lines_written': lines,
+        'runtime': runtime,
+        'conversion_stats': stats
+    }
 
-# Step 3: Convert files
-print("\nConverting files...")
-target_date = f"{targetYear}-{targetMonth}-{targetDay}"
 
-processed, success, lines, stats = process_all_meters(
-    meter_list=btuNameList,
-    file_lists=all_file_lists,
-    file_types=dataFilePostfix,
-    output_names=outputFileNames,
-    data_folder=pathDataFolder,
-    output_folder=pathOutputFolder,
-    target_date=target_date,
-    year=targetYear,
-    month=targetMonth,
-    day=targetDay,
-    delimiter=DELIMITER,
-    debug=DEBUG_FLAG
-)
+def main():
+    """Main execution function - converts the configured target day"""
+    convert_day(pathDataFolder, pathOutputFolder, targetYear, targetMonth, targetDay, DELIMITER, DEBUG_FLAG)
 
-# Summary
-end_time = time.time()
-runtime = end_time - start_time
 
-print(f"Files processed: {processed}")
-print(f"Files success:   {success}")
-print(f"Runtime:         {runtime:.2f}s")
\ No newline at end of file
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,296 @@
+# Project: Metering Data Parser
+# File Type: Function File
+
+# Description: Rollup Data
+# Contains Functions that build the Time Rollup Pyramid (Hourly, Daily, Monthly) for each Meter and Block
+# from the 1-Minute Block DataFrame, so Daily/Hourly Exports and Year-To-Date Summaries never rescan Minute Data
+
+# Aurthor: Tristan Sim
+# Date: 19/10/2026
+# Version: 1.02
+# Changelog:
+# - Stored Rollup Files listed by list_Rollup_Files (Source Files of the Year-To-Date Summary for the Pipeline Fingerprint)
+# - RTH_Delta is the Sum of the Reset-aware RTH Steps (analyze_data.build_RTH_Step_Matrix) whose later Reading falls in the Period,
+#   so Steps across Period Boundaries are counted and Hourly/Daily Deltas add up to the Monthly Consumption
+
+import os
+import numpy as np
+import pandas as pd
+import analyze_data
+import parse_data
+
+# Rollup Resolutions: Number of 1-Minute Rows per Period (Monthly = Entire Block DataFrame)
+ROLLUP_RESOLUTIONS = {
+    'hourly': 60,
+    'daily': 1440,
+    'monthly': None
+}
+
+# Length of the Timestamp String kept as the Period Label ('2025-10-01 13:00:00')
+PERIOD_LABEL_LENGTH = {
+    'hourly': 19,
+    'daily': 10,
+    'monthly': 7
+}
+
+ROLLUP_COLUMNS = ['Period', 'Meter', 'RT_Sum', 'RT_Mean', 'RT_Min', 'RT_Max', 'RT_Healthy_Count',
+                  'RTH_First', 'RTH_Last', 'RTH_Delta']
+
+
+def reshape_To_Periods(values: np.ndarray, resolution: str) -> np.ndarray:
+    """
+    Reshape a 1-Minute Column into a (Periods x Minutes per Period) Matrix.
+    Args:
+        values: 1-Minute values of the Block DataFrame
+        resolution: 'hourly', 'daily' or 'monthly'
+    Returns:
+        2D Array with one Row per Period
+    """
+    periodLength = ROLLUP_RESOLUTIONS[resolution] or len(values)
+
+    if len(values) % periodLength != 0:
+        raise ValueError(f"Block DataFrame with {len(values)} rows cannot be split into {resolution} periods")
+
+    return values.reshape(-1, periodLength)
+
+
+def list_Period_Labels(blockDataFrame: pd.DataFrame, resolution: str) -> list:
+    """
+    List the Label of each Period ('2025-10-01 13:00:00', '2025-10-01' or '2025-10').
+    Args:
+        blockDataFrame: Block DataFrame with the 'timestamp' column
+        resolution: 'hourly', 'daily' or 'monthly'
+    Returns:
+        List of Period Labels
+    """
+    periodLength = ROLLUP_RESOLUTIONS[resolution] or len(blockDataFrame)
+    periodStarts = blockDataFrame['timestamp'].iloc[::periodLength]
+    return [str(timestamp)[:PERIOD_LABEL_LENGTH[resolution]] for timestamp in periodStarts]
+
+
+def build_Meter_Rollup(blockDataFrame: pd.DataFrame, meterName: str, resolution: str) -> pd.DataFrame:
+    """
+    Build the Rollup of 1 Meter at the given Resolution.
+    Args:
+        blockDataFrame: DataFrame containing meter data
+        meterName: Full meter name (e.g., 'J_B_82_10_27')
+        resolution: 'hourly', 'daily' or 'monthly'
+    Returns:
+        DataFrame with one row per Period (RT Sum/Mean/Min/Max, Healthy Count, First/Last Healthy RTH and RTH Delta)
+        RTH Delta: Reset-aware RTH Steps assigned to the Period of their later Reading (Steps across Period Boundaries included)
+    """
+    rtValues = blockDataFrame[f'{meterName}_RT'].to_numpy(dtype='float64').round(parse_data.METER_DECIMALS)
+    rthValues = blockDataFrame[f'{meterName}_RTH'].to_numpy(dtype='float64')
+    healthValues = blockDataFrame[f'{meterName}_Health'].to_numpy()
+
+    rtMatrix = reshape_To_Periods(rtValues, resolution)
+    rthMatrix = reshape_To_Periods(rthValues, resolution)
+    rtHealthy = reshape_To_Periods((healthValues & parse_data.HEALTH_BITS['RT']) > 0, resolution)
+    rthHealthy = reshape_To_Periods(((healthValues & parse_data.HEALTH_BITS['RTH']) > 0) & (rthValues > 0), resolution)
+
+    # First and Last Healthy RTH of each Period (NaN when the Period has no Healthy RTH)
+    periodLength = rthMatrix.shape[1]
+    hasHealthyRTH = rthHealthy.any(axis=1)
+    firstIndex = rthHealthy.argmax(axis=1)
+    lastIndex = periodLength - 1 - rthHealthy[:, ::-1].argmax(axis=1)
+    periodRows = np.arange(rthMatrix.shape[0])
+    rthFirst = np.where(hasHealthyRTH, rthMatrix[periodRows, firstIndex], np.nan)
+    rthLast = np.where(hasHealthyRTH, rthMatrix[periodRows, lastIndex], np.nan)
+
+    # RTH Consumption per Period from the Step of every Healthy Reading (Register Resets as 0, Rollovers wrapped)
+    rthConsumption = analyze_data.build_RTH_Step_Matrix(rthValues[:, None])['Consumption'][:, 0]
+    rthDelta = reshape_To_Periods(rthConsumption, resolution).sum(axis=1)
+
+    return pd.DataFrame({
+        'Period': list_Period_Labels(blockDataFrame, resolution),
+        'Meter': meterName,
+        'RT_Sum': rtMatrix.sum(axis=1),
+        'RT_Mean': rtMatrix.mean(axis=1),
+        'RT_Min': rtMatrix.min(axis=1),
+        'RT_Max': rtMatrix.max(axis=1),
+        'RT_Healthy_Count': rtHealthy.sum(axis=1),
+        'RTH_First': rthFirst,
+        'RTH_Last': rthLast,
+        'RTH_Delta': rthDelta
+    }, columns=ROLLUP_COLUMNS)
+
+
+def build_Block_Total_Rollup(blockDataFrame: pd.DataFrame, meterRollups: list, metersInBlock: list, blockNumber: str, resolution: str) -> pd.DataFrame:
+    """
+    Build the Rollup of the Block Total (RT Statistics of the per-minute Block RT Sum).
+    Args:
+        blockDataFrame: DataFrame containing all meter data for the block
+        meterRollups: Rollups of every Meter in the Block at the same Resolution
+        metersInBlock: List of meter names in this block
+        blockNumber: Block number ('82')
+        resolution: 'hourly', 'daily' or 'monthly'
+    Returns:
+        DataFrame with one row per Period (Meter = 'Block 82')
+    """
+    rtColumns = [f'{meter}_RT' for meter in metersInBlock]
+    blockRT = blockDataFrame[rtColumns].to_numpy(dtype='float64').round(parse_data.METER_DECIMALS).sum(axis=1)
+    rtMatrix = reshape_To_Periods(blockRT, resolution)
+
+    return pd.DataFrame({
+        'Period': list_Period_Labels(blockDataFrame, resolution),
+        'Meter': f'Block {blockNumber}',
+        'RT_Sum': rtMatrix.sum(axis=1),
+        'RT_Mean': rtMatrix.mean(axis=1),
+        'RT_Min': rtMatrix.min(axis=1),
+        'RT_Max': rtMatrix.max(axis=1),
+        'RT_Healthy_Count': sum(rollup['RT_Healthy_Count'].to_numpy() for rollup in meterRollups),
+        'RTH_First': np.nan,
+        'RTH_Last': np.nan,
+        'RTH_Delta': sum(rollup['RTH_Delta'].to_numpy() for rollup in meterRollups)
+    }, columns=ROLLUP_COLUMNS)
+
+
+def build_Block_Rollups(blockDataFrame: pd.DataFrame, meterList: list, blockNumber: str) -> dict:
+    """
+    Build the Rollup Pyramid for every Meter in a Block and the Block Total.
+    Args:
+        blockDataFrame: DataFrame containing all meter data for the block
+        meterList: List of all meter names
+        blockNumber: Block number ('82')
+    Returns:
+        Dictionary of Resolution to {'meters': {Meter Name: Rollup DataFrame}, 'block': Block Total Rollup DataFrame}
+    """
+    metersInBlock = [meter for meter in meterList if meter.split('_')[2] == blockNumber]
+    return update_Block_Rollups({}, blockDataFrame, meterList, blockNumber, changedMeters=metersInBlock)
+
+
+def update_Block_Rollups(blockRollups: dict, blockDataFrame: pd.DataFrame, meterList: list, blockNumber: str, changedMeters: list) -> dict:
+    """
+    Incrementally update the Rollup Pyramid of a Block - only the changed Meters are rolled up again.
+    Args:
+        blockRollups: Existing Block Rollups (from build_Block_Rollups) - Updated in place
+        blockDataFrame: DataFrame containing all meter data for the block
+        meterList: List of all meter names
+        blockNumber: Block number ('82')
+        changedMeters: Meters whose Minute Data changed since the last Update
+    Returns:
+        The updated Block Rollups
+    """
+    metersInBlock = [meter for meter in meterList if meter.split('_')[2] == blockNumber]
+
+    for resolution in ROLLUP_RESOLUTIONS:
+        resolutionRollups = blockRollups.setdefault(resolution, {'meters': {}, 'block': None})
+
+        for meter in metersInBlock:
+            if meter in changedMeters or meter not in resolutionRollups['meters']:
+                resolutionRollups['meters'][meter] = build_Meter_Rollup(blockDataFrame, meter, resolution)
+
+        meterRollups = [resolutionRollups['meters'][meter] for meter in metersInBlock]
+        resolutionRollups['block'] = build_Block_Total_Rollup(blockDataFrame, meterRollups, metersInBlock, blockNumber, resolution)
+
+    return blockRollups
+
+
+def combine_Block_Rollup(blockRollups: dict, resolution: str) -> pd.DataFrame:
+    """
+    Combine the Meter and Block Total Rollups of one Resolution into a single DataFrame.
+    Args:
+        blockRollups: Block Rollups (from build_Block_Rollups)
+        resolution: 'hourly', 'daily' or 'monthly'
+    Returns:
+        DataFrame with the Block Total Rows first, followed by each Meter
+    """
+    resolutionRollups = blockRollups[resolution]
+    return pd.concat([resolutionRollups['block']] + list(resolutionRollups['meters'].values()), ignore_index=True)
+
+
+def write_Block_Rollups(blockRollups: dict, outputPath: str, blockNumber: str, targetMonth: str, targetYear: str) -> list:
+    """
+    Store the Block Rollups alongside the Reports (One CSV per Resolution).
+    Args:
+        blockRollups: Block Rollups (from build_Block_Rollups)
+        outputPath: Path to output folder
+        blockNumber: Block number ('82')
+        targetMonth: Target month
+        targetYear: Target year
+    Returns:
+        List of written File Paths
+    """
+    rollupFolder = os.path.join(outputPath, "Rollups", f"Year={targetYear}", f"Month={targetMonth}")
+    os.makedirs(rollupFolder, exist_ok=True)
+
+    writtenPaths = []
+    for resolution in blockRollups:
+        rollupPath = os.path.join(rollupFolder, f"Block_{blockNumber}_{resolution}.csv")
+        combine_Block_Rollup(blockRollups, resolution).to_csv(rollupPath, index=False)
+        writtenPaths.append(rollupPath)
+
+    return writtenPaths
+
+
+def list_Rollup_Files(outputPath: str, targetYear: str, months: list, resolution: str) -> list:
+    """
+    List the stored Rollup Files of every Block for the given Months.
+    Args:
+        outputPath: Path to output folder
+        targetYear: Target year
+        months: List of months (['01', '02', ...])
+        resolution: 'hourly', 'daily' or 'monthly'
+    Returns:
+        List of File Paths (Month Order, then File Name)
+    """
+    rollupPaths = []
+
+    for month in months:
+        rollupFolder = os.path.join(outputPath, "Rollups", f"Year={targetYear}", f"Month={month}")
+        if not os.path.exists(rollupFolder):
+            continue
+
+        for fileName in sorted(os.listdir(rollupFolder)):
+            if fileName.endswith(f"_{resolution}.csv"):
+                rollupPaths.append(os.path.join(rollupFolder, fileName))
+
+    return rollupPaths
+
+
+def read_Rollups(outputPath: str, targetYear: str, months: list, resolution: str) -> pd.DataFrame:
+    """
+    Read the stored Rollups of every Block for the given Months.
+    Args:
+        outputPath: Path to output folder
+        targetYear: Target year
+        months: List of months (['01', '02', ...])
+        resolution: 'hourly', 'daily' or 'monthly'
+    Returns:
+        DataFrame of all stored Rollups (Empty if none were found)
+    """
+    rollupFrames = [pd.read_csv(rollupPath, dtype={'Period': str}) for rollupPath in list_Rollup_Files(outputPath, targetYear, months, resolution)]
+
+    if not rollupFrames:
+        return pd.DataFrame(columns=ROLLUP_COLUMNS)
+
+    return pd.concat(rollupFrames, ignore_index=True)
+
+
+def summarize_Year_To_Date(outputPath: str, targetMonth: str, targetYear: str) -> pd.DataFrame:
+    """
+    Summarize the Year-To-Date Consumption of every Meter and Block from the stored Monthly Rollups.
+    Args:
+        outputPath: Path to output folder
+        targetMonth: Last month included in the Summary
+        targetYear: Target year
+    Returns:
+        DataFrame with one row per Meter / Block (Months, RT Sum, Healthy Count, First/Last RTH and RTH Delta)
+    """
+    months = [f'{month:02d}' for month in range(1, int(targetMonth) + 1)]
+    monthlyRollups = read_Rollups(outputPath, targetYear, months, 'monthly')
+
+    if monthlyRollups.empty:
+        return pd.DataFrame(columns=['Meter', 'Months', 'RT_Sum', 'RT_Healthy_Count', 'RTH_First', 'RTH_Last', 'RTH_Delta'])
+
+    monthlyRollups = monthlyRollups.sort_values(['Meter', 'Period'])
+    yearToDate = monthlyRollups.groupby('Meter', sort=True).agg(
+        Months=('Period', 'count'),
+        RT_Sum=('RT_Sum', 'sum'),
+        RT_Healthy_Count=('RT_Healthy_Count', 'sum'),
+        RTH_First=('RTH_First', 'first'),
+        RTH_Last=('RTH_Last', 'last'),
+        RTH_Delta=('RTH_Delta', 'sum')
+    )
+
+    return yearToDate.reset_index()
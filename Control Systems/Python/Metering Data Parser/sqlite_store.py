@@ -0,0 +1,234 @@
+# Project: Metering Data Parser
+# File Type: Function File
+
+# Description: SQLite Store
+# Optional Storage Backend that keeps the parsed Minute Data and Rollups of every Month in a local SQLite Database,
+# so Multi-Month and Year-over-Year Reports are SQL Aggregates instead of re-reading the Raw Text Files
+
+# Aurthor: Tristan Sim
+# Date: 19/10/2026
+# Version: 1.00
+# Changelog:
+
+import sqlite3
+import numpy as np
+import pandas as pd
+import parse_data
+
+# Minute Data is clustered by (meter_id, minute) - WITHOUT ROWID stores the Rows in Primary Key order
+# minute: Minutes since 1970-01-01 00:00:00 (Timestamps of the Block DataFrame are Local Time)
+SCHEMA_STATEMENTS = [
+    """CREATE TABLE IF NOT EXISTS meters (
+        meter_id TEXT PRIMARY KEY,
+        block TEXT NOT NULL,
+        category TEXT NOT NULL
+    ) WITHOUT ROWID""",
+    "CREATE INDEX IF NOT EXISTS idx_meters_block ON meters (block)",
+    "CREATE INDEX IF NOT EXISTS idx_meters_category ON meters (category)",
+    """CREATE TABLE IF NOT EXISTS meter_minute (
+        meter_id TEXT NOT NULL,
+        minute INTEGER NOT NULL,
+        rt REAL NOT NULL,
+        rth REAL NOT NULL,
+        health INTEGER NOT NULL,
+        PRIMARY KEY (meter_id, minute)
+    ) WITHOUT ROWID""",
+    """CREATE TABLE IF NOT EXISTS meter_rollup (
+        meter_id TEXT NOT NULL,
+        resolution TEXT NOT NULL,
+        period TEXT NOT NULL,
+        rt_sum REAL,
+        rt_mean REAL,
+        rt_min REAL,
+        rt_max REAL,
+        rt_healthy_count INTEGER,
+        rth_first REAL,
+        rth_last REAL,
+        rth_delta REAL,
+        PRIMARY KEY (meter_id, resolution, period)
+    ) WITHOUT ROWID"""
+]
+
+INSERT_BATCH_SIZE = 50000  # Rows per Transaction
+
+
+def open_Metering_Store(databasePath: str) -> sqlite3.Connection:
+    """
+    Open (or create) the SQLite Metering Store.
+    Args:
+        databasePath: Path to the SQLite Database File
+    Returns:
+        Open sqlite3 Connection
+    """
+    connection = sqlite3.connect(databasePath)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+
+    with connection:
+        for statement in SCHEMA_STATEMENTS:
+            connection.execute(statement)
+
+    return connection
+
+
+def execute_In_Batches(connection: sqlite3.Connection, statement: str, rows, batchSize: int = INSERT_BATCH_SIZE) -> int:
+    """
+    Bulk insert Rows with one Transaction per Batch.
+    Args:
+        connection: Open sqlite3 Connection
+        statement: Parameterized INSERT Statement
+        rows: Iterable of Row Tuples
+        batchSize: Rows per Transaction
+    Returns:
+        Number of Rows written
+    """
+    rowCount = 0
+    batch = []
+
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batchSize:
+            with connection:
+                connection.executemany(statement, batch)
+            rowCount += len(batch)
+            batch = []
+
+    if batch:
+        with connection:
+            connection.executemany(statement, batch)
+        rowCount += len(batch)
+
+    return rowCount
+
+
+def write_Meter_Registry(connection: sqlite3.Connection, meterList: list, categoryMeters: list):
+    """
+    Register every Meter with its Block and Category (CWSA / Retail).
+    Args:
+        connection: Open sqlite3 Connection
+        meterList: List of all meter names
+        categoryMeters: List of CWSA Meter Names (Filter Workbook 'Device Name' column)
+    """
+    cwsaMeters = set(categoryMeters)
+    rows = [(meter, meter.split('_')[2], 'CWSA' if meter in cwsaMeters else 'Retail') for meter in meterList]
+
+    execute_In_Batches(connection, "INSERT OR REPLACE INTO meters (meter_id, block, category) VALUES (?, ?, ?)", rows)
+
+
+def write_Block_Minute_Data(connection: sqlite3.Connection, blockDataFrame: pd.DataFrame, meterList: list, blockNumber: str) -> int:
+    """
+    Store the Minute Data (RT, RTH and Health Bitmask) of every Meter in a Block.
+    Args:
+        connection: Open sqlite3 Connection
+        blockDataFrame: DataFrame containing all meter data for the block
+        meterList: List of all meter names
+        blockNumber: Block number ('82')
+    Returns:
+        Number of Rows written
+    """
+    metersInBlock = [meter for meter in meterList if meter.split('_')[2] == blockNumber]
+    minutes = (pd.to_datetime(blockDataFrame['timestamp']).to_numpy(dtype='datetime64[m]').astype('int64')).tolist()
+
+    def generate_Rows():
+        for meter in metersInBlock:
+            rtValues = blockDataFrame[f'{meter}_RT'].to_numpy(dtype='float64').round(parse_data.METER_DECIMALS).tolist()
+            rthValues = blockDataFrame[f'{meter}_RTH'].to_numpy(dtype='float64').tolist()
+            healthValues = blockDataFrame[f'{meter}_Health'].to_numpy(dtype='int64').tolist()
+            yield from zip([meter] * len(minutes), minutes, rtValues, rthValues, healthValues)
+
+    return execute_In_Batches(connection,
+                              "INSERT OR REPLACE INTO meter_minute (meter_id, minute, rt, rth, health) VALUES (?, ?, ?, ?, ?)",
+                              generate_Rows())
+
+
+def write_Block_Rollups(connection: sqlite3.Connection, blockRollups: dict) -> int:
+    """
+    Store the Rollups of a Block (rollup_data.build_Block_Rollups) - Meter and Block Total Rows.
+    Args:
+        connection: Open sqlite3 Connection
+        blockRollups: Block Rollups
+    Returns:
+        Number of Rows written
+    """
+    def generate_Rows():
+        for resolution, resolutionRollups in blockRollups.items():
+            for rollup in [resolutionRollups['block']] + list(resolutionRollups['meters'].values()):
+                rollup = rollup.replace({np.nan: None})
+                for row in rollup.itertuples(index=False):
+                    yield (row.Meter, resolution, row.Period, row.RT_Sum, row.RT_Mean, row.RT_Min, row.RT_Max,
+                           int(row.RT_Healthy_Count), row.RTH_First, row.RTH_Last, row.RTH_Delta)
+
+    return execute_In_Batches(connection,
+                              """INSERT OR REPLACE INTO meter_rollup (meter_id, resolution, period, rt_sum, rt_mean, rt_min, rt_max,
+                                 rt_healthy_count, rth_first, rth_last, rth_delta) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                              generate_Rows())
+
+
+def query_Monthly_Consumption(connection: sqlite3.Connection, startPeriod: str, endPeriod: str, groupBy: str = 'block') -> pd.DataFrame:
+    """
+    Monthly RT Totalized Value and RTH Consumption from the stored Monthly Rollups.
+    Args:
+        connection: Open sqlite3 Connection
+        startPeriod: First Month ('2025-01')
+        endPeriod: Last Month ('2025-12')
+        groupBy: 'block', 'category' or 'meter'
+    Returns:
+        DataFrame with one row per Month and Group
+    """
+    groupColumns = {'block': 'm.block', 'category': 'm.category', 'meter': 'm.meter_id'}
+    if groupBy not in groupColumns:
+        raise ValueError(f"Unknown groupBy: {groupBy}")
+
+    statement = f"""
+        SELECT r.period AS period, {groupColumns[groupBy]} AS {groupBy},
+               COUNT(*) AS meters, SUM(r.rt_sum) AS rt_totalized, SUM(r.rth_delta) AS rth_consumption,
+               SUM(r.rt_healthy_count) AS rt_healthy_count
+        FROM meter_rollup r JOIN meters m ON m.meter_id = r.meter_id
+        WHERE r.resolution = 'monthly' AND r.period BETWEEN ? AND ?
+        GROUP BY r.period, {groupColumns[groupBy]}
+        ORDER BY r.period, {groupColumns[groupBy]}"""
+
+    return pd.read_sql_query(statement, connection, params=(startPeriod, endPeriod))
+
+
+def query_Year_Over_Year(connection: sqlite3.Connection, years: list, groupBy: str = 'block') -> pd.DataFrame:
+    """
+    Compare the Monthly RTH Consumption of the same Month across Years.
+    Args:
+        connection: Open sqlite3 Connection
+        years: List of Years (['2024', '2025'])
+        groupBy: 'block', 'category' or 'meter'
+    Returns:
+        DataFrame with one row per Month and Group, one Consumption column per Year
+    """
+    monthly = query_Monthly_Consumption(connection, f"{min(years)}-01", f"{max(years)}-12", groupBy)
+    monthly['year'] = monthly['period'].str[:4]
+    monthly['month'] = monthly['period'].str[5:7]
+    monthly = monthly[monthly['year'].isin(years)]
+
+    return monthly.pivot_table(index=['month', groupBy], columns='year', values='rth_consumption', aggfunc='sum').reset_index()
+
+
+def query_Block_Minute_Data(connection: sqlite3.Connection, blockNumber: str, startTimestamp: str, endTimestamp: str) -> pd.DataFrame:
+    """
+    Read back the Minute Data of every Meter in a Block between two Timestamps.
+    Args:
+        connection: Open sqlite3 Connection
+        blockNumber: Block number ('82')
+        startTimestamp: Start of the Range (inclusive) - '2025-10-01 00:00:00'
+        endTimestamp: End of the Range (exclusive) - '2025-11-01 00:00:00'
+    Returns:
+        DataFrame with columns: meter_id, timestamp, rt, rth, health
+    """
+    startMinute = int(np.datetime64(pd.Timestamp(startTimestamp), 'm').astype('int64'))
+    endMinute = int(np.datetime64(pd.Timestamp(endTimestamp), 'm').astype('int64'))
+
+    minuteData = pd.read_sql_query(
+        """SELECT d.meter_id, d.minute, d.rt, d.rth, d.health
+           FROM meter_minute d JOIN meters m ON m.meter_id = d.meter_id
+           WHERE m.block = ? AND d.minute >= ? AND d.minute < ?
+           ORDER BY d.meter_id, d.minute""",
+        connection, params=(blockNumber, startMinute, endMinute))
+
+    minuteData.insert(1, 'timestamp', pd.to_datetime(minuteData.pop('minute'), unit='m'))
+    return minuteData
@@ -0,0 +1,100 @@
+# Project: Metering Data Parser
+# File Type: Test File
+
+# Description: Test Anomaly Data
+# Checks that the Anomaly Detection only flags a constant-load Plateau (Value and Health kept) and that
+# Rejection of flagged Samples is opt-in (parse_data.ANOMALY_REJECTION)
+# Run with 'python -m pytest test_anomaly_data.py' or 'python -m unittest test_anomaly_data' from this Folder
+
+# Aurthor: Tristan Sim
+# Date: 19/10/2026
+# Version: 1.00
+# Changelog:
+
+import unittest
+import numpy as np
+import anomaly_data
+import parse_data
+
+TEST_METER = 'J_B_82_10_27'
+PLATEAU_MINUTES = 600  # Longer than the Stuck Rule of RT (180 Samples)
+PLATEAU_LOAD = 250.0
+
+
+def build_Test_Block() -> tuple:
+    """
+    Empty October 2025 Block 82 DataFrame and the Minute Timestamps of its first PLATEAU_MINUTES Rows.
+    """
+    blockDataFrame = parse_data.initialize_Block_DataFrame(month='10', year='2025', blockNumber='82', meterList=[TEST_METER],
+                                                           channels=parse_data.BILLING_CHANNELS)
+    timestamps = np.datetime64('2025-10-01T00:00:00', 's') + np.arange(PLATEAU_MINUTES) * np.timedelta64(60, 's')
+    return blockDataFrame, timestamps
+
+
+class Test_Constant_Load_Plateau(unittest.TestCase):
+
+    def setUp(self):
+        self.anomalyRejection = parse_data.ANOMALY_REJECTION
+
+    def tearDown(self):
+        parse_data.ANOMALY_REJECTION = self.anomalyRejection
+
+    def test_Plateau_Is_Found_By_The_Stuck_Rule(self):
+        _, timestamps = build_Test_Block()
+        values = np.full(PLATEAU_MINUTES, PLATEAU_LOAD)
+
+        isAnomaly, anomalyStatistics = anomaly_data.find_Anomalies(timestamps, values, np.ones(PLATEAU_MINUTES, dtype=bool), 'RT')
+
+        self.assertTrue(isAnomaly.all())
+        self.assertEqual(anomalyStatistics['anomaly_stuck'], PLATEAU_MINUTES)
+        self.assertEqual(len(anomalyStatistics['anomaly_timestamps']), anomaly_data.ANOMALY_TIMESTAMP_LIMIT)
+
+    def test_Plateau_Is_Flagged_Not_Rejected_By_Default(self):
+        parse_data.ANOMALY_REJECTION = False
+        blockDataFrame, timestamps = build_Test_Block()
+        values = np.full(PLATEAU_MINUTES, PLATEAU_LOAD)
+        diagnosticStatistics = {'total_data': PLATEAU_MINUTES, 'healthy_data': PLATEAU_MINUTES, 'faulty_data': 0}
+
+        blockDataFrame = parse_data.merge_Meter_Arrays(blockDataFrame, timestamps, values, np.ones(PLATEAU_MINUTES, dtype=bool),
+                                                       TEST_METER, 'RT', diagnosticStatistics)
+
+        plateauValues = blockDataFrame[f'{TEST_METER}_RT'].to_numpy()[:PLATEAU_MINUTES]
+        plateauHealth = blockDataFrame[f'{TEST_METER}_Health'].to_numpy()[:PLATEAU_MINUTES]
+        np.testing.assert_array_equal(plateauValues, PLATEAU_LOAD)
+        self.assertTrue(((plateauHealth & parse_data.HEALTH_BITS['RT']) > 0).all())
+        self.assertTrue(((plateauHealth & parse_data.ANOMALY_BITS['RT']) > 0).all())
+        self.assertEqual(diagnosticStatistics['anomaly_action'], 'flagged')
+        self.assertEqual(diagnosticStatistics['healthy_data'], PLATEAU_MINUTES)
+        self.assertEqual(diagnosticStatistics['faulty_data'], 0)
+
+    def test_Plateau_Is_Rejected_When_Opted_In(self):
+        parse_data.ANOMALY_REJECTION = True
+        blockDataFrame, timestamps = build_Test_Block()
+        values = np.full(PLATEAU_MINUTES, PLATEAU_LOAD)
+        diagnosticStatistics = {'total_data': PLATEAU_MINUTES, 'healthy_data': PLATEAU_MINUTES, 'faulty_data': 0}
+
+        blockDataFrame = parse_data.merge_Meter_Arrays(blockDataFrame, timestamps, values, np.ones(PLATEAU_MINUTES, dtype=bool),
+                                                       TEST_METER, 'RT', diagnosticStatistics)
+
+        plateauValues = blockDataFrame[f'{TEST_METER}_RT'].to_numpy()[:PLATEAU_MINUTES]
+        plateauHealth = blockDataFrame[f'{TEST_METER}_Health'].to_numpy()[:PLATEAU_MINUTES]
+        np.testing.assert_array_equal(plateauValues, 0.0)
+        self.assertFalse(((plateauHealth & parse_data.HEALTH_BITS['RT']) > 0).any())
+        self.assertEqual(diagnosticStatistics['anomaly_action'], 'rejected')
+        self.assertEqual(diagnosticStatistics['faulty_data'], PLATEAU_MINUTES)
+
+    def test_Varying_Load_Is_Not_Flagged(self):
+        parse_data.ANOMALY_REJECTION = False
+        blockDataFrame, timestamps = build_Test_Block()
+        values = PLATEAU_LOAD + 5.0 * np.sin(np.arange(PLATEAU_MINUTES) / 30.0)
+
+        blockDataFrame = parse_data.merge_Meter_Arrays(blockDataFrame, timestamps, values, np.ones(PLATEAU_MINUTES, dtype=bool),
+                                                       TEST_METER, 'RT')
+
+        plateauHealth = blockDataFrame[f'{TEST_METER}_Health'].to_numpy()[:PLATEAU_MINUTES]
+        self.assertFalse(((plateauHealth & parse_data.ANOMALY_BITS['RT']) > 0).any())
+        np.testing.assert_allclose(blockDataFrame[f'{TEST_METER}_RT'].to_numpy()[:PLATEAU_MINUTES], values, rtol=1e-6)
+
+
+if __name__ == '__main__':
+    unittest.main()
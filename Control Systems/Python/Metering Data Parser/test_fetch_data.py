@@ -0,0 +1,81 @@
+# Project: Metering Data Parser
+# File Type: Test File
+
+# Description: Test Fetch Data
+# Checks that the Fast Array Parser (Memory-mapped and Text Parser) keeps the Health State of read_Raw_Text_Data
+# when a Line has an invalid Timestamp - such Lines are skipped and take no Part in the Health State
+# Run with 'python -m pytest test_fetch_data.py' or 'python -m unittest test_fetch_data' from this Folder
+
+# Aurthor: Tristan Sim
+# Date: 19/10/2026
+# Version: 1.00
+# Changelog:
+
+import os
+import shutil
+import tempfile
+import unittest
+import fetch_data
+
+# Corrupt Line (Day 32) with a Negative Value between two Healthy Lines
+NEGATIVE_CORRUPT_LINES = ["01.10.2025 00:00:00 9006.741",
+                          "32.10.2025 00:01:00 -5.000",
+                          "01.10.2025 00:02:00 9006.759"]
+
+# Corrupt Line right after a #start - the Recovery is the next valid Line
+START_CORRUPT_LINES = ["01.10.2025 00:00:00 9006.741",
+                       "#stop",
+                       "01.10.2025 00:01:00 9006.750",
+                       "#start",
+                       "32.10.2025 00:02:00 9006.759",
+                       "01.10.2025 00:03:00 9006.768"]
+
+
+class Test_Invalid_Timestamp_Health(unittest.TestCase):
+
+    def setUp(self):
+        self.mmapParser = fetch_data.MMAP_PARSER
+        self.folderPath = tempfile.mkdtemp()
+
+    def tearDown(self):
+        fetch_data.MMAP_PARSER = self.mmapParser
+        shutil.rmtree(self.folderPath)
+
+    def write_Raw_File(self, lines: list) -> str:
+        filePath = os.path.join(self.folderPath, 'X01_01_20251001_82_10_27_BTUREADINGS11MIN.txt')
+        with open(filePath, 'w') as rawFile:
+            rawFile.write('\n'.join(lines) + '\n')
+        return filePath
+
+    def assert_Same_As_Text_Data(self, lines: list):
+        filePath = self.write_Raw_File(lines)
+        rawData, rawStatistics = fetch_data.read_Raw_Text_Data(filePath)
+
+        for mmapParser in (True, False):
+            with self.subTest(mmapParser=mmapParser):
+                fetch_data.MMAP_PARSER = mmapParser
+                timestamps, values, health, diagnosticStatistics = fetch_data.read_Raw_Text_Arrays(filePath)
+
+                self.assertEqual(health.tolist(), [row['Health'] for row in rawData])
+                self.assertEqual(values.tolist(), [row['Value'] for row in rawData])
+                self.assertEqual(len(timestamps), len(rawData))
+                for key in ('failure_timestamps', 'recovery_timestamps', 'corrupted_data_lines', 'healthy_data', 'faulty_data'):
+                    self.assertEqual(diagnosticStatistics[key], rawStatistics[key], key)
+
+    def test_Negative_Value_On_Corrupt_Line_Keeps_Health(self):
+        self.assert_Same_As_Text_Data(NEGATIVE_CORRUPT_LINES)
+
+        fetch_data.MMAP_PARSER = False
+        _, _, health, _ = fetch_data.read_Raw_Text_Arrays(self.write_Raw_File(NEGATIVE_CORRUPT_LINES))
+        self.assertEqual(health.tolist(), [True, True])
+
+    def test_Recovery_Skips_Corrupt_Line(self):
+        self.assert_Same_As_Text_Data(START_CORRUPT_LINES)
+
+    def test_Non_Padded_Corrupt_Line(self):
+        self.assert_Same_As_Text_Data([line.replace('01.10.2025 00:', '1.10.2025 0:').replace('32.10.2025 00:', '32.10.2025 0:')
+                                       for line in NEGATIVE_CORRUPT_LINES])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,298 @@
+# Project: Metering Data Parser
+# File Type: Main Program (Service)
+
+# Description: Watch Data Service
+# Long-running Service that watches the Raw Data Folder (PDD_BTUmeter) for new or grown Meter Files,
+# re-parses only the changed Files and refreshes the affected Block Outputs, Rollups and the Month-To-Date Summary
+
+# Aurthor: Tristan Sim
+# Date: 19/10/2026
+# Version: 1.03
+# Changelog:
+# - Content Fingerprint - Files re-exported with a new Modified Time or Name are served from the Parsed File Cache
+# - Target Month follows the System Clock on every Scan - the Service State and Output Folder start over at a Month Rollover
+# - A failed Scan / Parse / Refresh is logged and its Files are retried on the next Poll (Deleted Files, Reports open in Excel, Worker Errors)
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+
+# Import Custom Library
+import fetch_data
+import parse_data
+import analyze_data
+import export_data
+import multicore_process
+import rollup_data
+import metering_log
+
+logger = metering_log.get_Logger('watch_data_service')
+
+
+def scan_Data_Folder(dataFolderPath: str, namePrefix: list, filePrefix: str, filePostfix: list, delimiter: str) -> dict:
+    """
+    Take a Snapshot of every Meter File matching the Search Criteria.
+    Args:
+        dataFolderPath: Path to the Parent data folder (PDD_BTUmeter)
+        namePrefix: List of valid Meter Folder Name Prefixes
+        filePrefix: File name prefix to match ("X01_01_202510")
+        filePostfix: List of File name postfixes to match (RT, RTH)
+        delimiter: Delimiter to separate folder name and file name
+    Returns:
+        Dictionary of "MeterName;FileName" to the File Signature (Size, Modified Time)
+    """
+    snapshot = {}
+
+    for meterName in fetch_data.list_Folder_Names(dataFolderPath, namePrefix, debugFlag=False):
+        with os.scandir(os.path.join(dataFolderPath, meterName)) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.startswith(filePrefix) and entry.name.endswith(tuple(filePostfix)):
+                    fileStat = entry.stat()
+                    snapshot[meterName + delimiter + entry.name] = (fileStat.st_size, fileStat.st_mtime_ns)
+
+    return snapshot
+
+
+def update_Pending_Changes(previousSnapshot: dict, currentSnapshot: dict, pendingChanges: dict, currentTime: float):
+    """
+    Record new or grown Files as Pending (Debounce Timer restarts every time the File changes again).
+    Args:
+        previousSnapshot: File Signatures of the previous Scan
+        currentSnapshot: File Signatures of the current Scan
+        pendingChanges: Dictionary of "MeterName;FileName" to the Time of its last observed Change (Updated in place)
+        currentTime: Time of the current Scan (time.monotonic())
+    """
+    for fileEntry, signature in currentSnapshot.items():
+        if previousSnapshot.get(fileEntry) != signature:
+            pendingChanges[fileEntry] = currentTime
+
+    # Files removed while still Pending are dropped
+    for fileEntry in list(pendingChanges.keys()):
+        if fileEntry not in currentSnapshot:
+            del pendingChanges[fileEntry]
+
+
+def pop_Settled_Changes(pendingChanges: dict, currentTime: float, debounceSeconds: float) -> list:
+    """
+    Remove and return the Pending Files that have not changed for the Debounce Period.
+    Args:
+        pendingChanges: Dictionary of "MeterName;FileName" to the Time of its last observed Change (Updated in place)
+        currentTime: Time of the current Scan (time.monotonic())
+        debounceSeconds: Quiet Period before a File is considered completely written
+    Returns:
+        Sorted List of "MeterName;FileName" ready to be parsed
+    """
+    settledFiles = [fileEntry for fileEntry, changedTime in pendingChanges.items() if currentTime - changedTime >= debounceSeconds]
+
+    for fileEntry in settledFiles:
+        del pendingChanges[fileEntry]
+
+    return sorted(settledFiles)
+
+
+def parse_Meter_File(dataFolderPath: str, fileEntry: str, delimiter: str) -> tuple:
+    """
+    Parse one Meter File (Runs inside a Worker Process).
+    Args:
+        dataFolderPath: Path to the Parent data folder
+        fileEntry: File with format "MeterName;FileName"
+        delimiter: Delimiter separating meter name and file name
+    Returns:
+        Tuple of (fileEntry, Column Arrays (timestamps, values, health), diagnosticStatistics)
+    """
+    meterName, fileName = fileEntry.split(delimiter)
+    timestamps, values, health, diagnosticStatistics = fetch_data.read_Raw_Text_Arrays(os.path.join(dataFolderPath, meterName, fileName))
+    return fileEntry, (timestamps, values, health), diagnosticStatistics
+
+
+def refresh_Block_Output(blockDataFrame, blockNumber: str, meterList: list, outputFolder: str, targetMonth: str, targetYear: str) -> tuple:
+    """
+    Re-analyze one Block and rewrite its Excel Output.
+    Args:
+        blockDataFrame: DataFrame containing all meter data for the block
+        blockNumber: Block number ('82')
+        meterList: List of all meter names
+        outputFolder: Folder for the Month-To-Date Outputs
+        targetMonth: Target month
+        targetYear: Target year
+    Returns:
+        Tuple of (Block RT Statistics, Block RTH Statistics)
+    """
+    metersInBlock = [meter for meter in meterList if meter.split('_')[2] == blockNumber]
+
+    blockRTStats = analyze_data.analyze_Block_RT_Data(blockDataFrame, meterList, blockNumber, includeFaultyData=True)
+    blockRTHStats = analyze_data.analyze_Block_RTH_Data(blockDataFrame, meterList, blockNumber)
+
+    multicore_process.export_block_to_excel(
+        block_dataframe=blockDataFrame,
+        block_number=blockNumber,
+        block_rt_stats=blockRTStats,
+        block_rth_stats=blockRTHStats,
+        meters_in_block=metersInBlock,
+        output_folder=outputFolder,
+        target_month=targetMonth,
+        target_year=targetYear,
+        analyze_data_module=analyze_data
+    )
+
+    return blockRTStats, blockRTHStats
+
+
+def write_Month_To_Date_Summary(blockStatistics: dict, outputFolder: str, targetMonth: str, targetYear: str) -> str:
+    """
+    Write the Month-To-Date Summary of every Block processed so far.
+    Args:
+        blockStatistics: Dictionary of Block Number to (Block RT Statistics, Block RTH Statistics)
+        outputFolder: Folder for the Month-To-Date Outputs
+        targetMonth: Target month
+        targetYear: Target year
+    Returns:
+        Path of the Summary File
+    """
+    summaryPath = os.path.join(outputFolder, f"Month_To_Date_Summary_{targetMonth}_{targetYear}.txt")
+
+    with open(summaryPath, 'w') as summaryFile:
+        summaryFile.write("="*80 + "\n")
+        summaryFile.write("MONTH-TO-DATE METERING SUMMARY\n")
+        summaryFile.write(f"Month: {targetMonth}/{targetYear}\n")
+        summaryFile.write(f"Updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        summaryFile.write("="*80 + "\n")
+
+        for blockNumber in sorted(blockStatistics.keys()):
+            blockRTStats, blockRTHStats = blockStatistics[blockNumber]
+            export_data.write_Block_Statistics(summaryFile, blockNumber, blockRTStats, blockRTHStats)
+
+    return summaryPath
+
+
+def main():
+    """Main execution function - must be called from if __name__ == '__main__' block"""
+
+    # Configuration
+    pathDataFolder = r'C:\Repository\ControlSystems\Control Systems\Python\Metering Data Parser\data\PDD_BTUmeter'
+    pathOutputFolder = r'C:\Repository\ControlSystems\Control Systems\Python\Metering Data Parser\data\Metering Summary Report'
+
+    DELIMITER = ';'
+    NUM_WORKERS = 4           # Bounded Worker Pool for Parsing
+    POLL_INTERVAL = 10.0      # Seconds between Folder Scans
+    DEBOUNCE_SECONDS = 30.0   # File must be unchanged for this long before it is parsed
+
+    btuNamePrefix = ["J_B_"]
+    dataFilePrefix = ["X01_01_"]
+    dataFilePostfix = ["BTUREADINGS11MIN.txt", "ACCBTUReadingS11MIN.txt"]
+    channelSuffix = {dataFilePostfix[0]: 'RT', dataFilePostfix[1]: 'RTH'}
+
+    targetMonth, targetYear = None, None  # Month-To-Date - set from the System Clock on every Scan
+
+    metering_log.configure_Console_Logging()
+    executor = ProcessPoolExecutor(max_workers=NUM_WORKERS)
+    try:
+        while True:
+            # Month Rollover (and first Scan): Service State and Output Folder of the new Month
+            _, currentMonth, currentYear = fetch_data.get_datetime_yesterday()  # Default: Current Month (Month-To-Date)
+            if (currentMonth, currentYear) != (targetMonth, targetYear):
+                targetMonth, targetYear = currentMonth, currentYear
+                prefixSearchCriteria = dataFilePrefix[0] + targetYear + targetMonth
+                outputFolder = os.path.join(pathOutputFolder, "Month To Date", f"{targetMonth}_{targetYear}")
+
+                # Service State
+                fileSnapshot = {}      # "MeterName;FileName": (Size, Modified Time) of the last Scan
+                pendingChanges = {}    # "MeterName;FileName": Time of the last observed Change
+                blockDataFrames = {}   # Block Number: Block DataFrame (Month-To-Date)
+                blockMeters = {}       # Block Number: Meters the Block DataFrame was initialized with
+                blockStatistics = {}   # Block Number: (Block RT Statistics, Block RTH Statistics)
+                blockRollups = {}      # Block Number: Hourly / Daily / Monthly Rollups (Updated per changed Meter)
+
+                print(f"\nWatching {pathDataFolder} for Month {targetMonth}/{targetYear} (Ctrl+C to Stop)")
+
+            # A failed Iteration (File deleted after the Scan, Report open in Excel, Worker Error) must not stop the Service -
+            # its Files stay Pending and are retried on the next Poll
+            settledFiles = []
+            try:
+                os.makedirs(outputFolder, exist_ok=True)
+                currentSnapshot = scan_Data_Folder(pathDataFolder, btuNamePrefix, prefixSearchCriteria, dataFilePostfix, DELIMITER)
+                update_Pending_Changes(fileSnapshot, currentSnapshot, pendingChanges, time.monotonic())
+                fileSnapshot = currentSnapshot
+
+                settledFiles = pop_Settled_Changes(pendingChanges, time.monotonic(), DEBOUNCE_SECONDS)
+
+                if settledFiles:
+                    btuNameList = sorted({fileEntry.split(DELIMITER)[0] for fileEntry in currentSnapshot})
+
+                    # (Re-)Initialize Blocks that are new or gained a Meter - every File of that Block is parsed again
+                    for blockNumber in fetch_data.list_Meter_Blocks(btuNameList):
+                        metersInBlock = [meter for meter in btuNameList if meter.split('_')[2] == blockNumber]
+                        if blockMeters.get(blockNumber) != metersInBlock:
+                            blockDataFrames[blockNumber] = parse_data.initialize_Block_DataFrame(targetMonth, targetYear, blockNumber, btuNameList)
+                            blockMeters[blockNumber] = metersInBlock
+                            blockRollups[blockNumber] = {}
+                            settledFiles.extend(fileEntry for fileEntry in currentSnapshot if fileEntry.split(DELIMITER)[0] in metersInBlock)
+
+                    settledFiles = sorted(set(settledFiles))
+                    print(f"\n[{datetime.now().strftime('%H:%M:%S')}] Parsing {len(settledFiles)} changed file(s)...")
+
+                    # Content already parsed (Re-Exports, Touched Files) is served from the Parsed File Cache
+                    parsedFiles = []
+                    filesToParse = []
+                    fileFingerprints = {}
+                    for fileEntry in settledFiles:
+                        filePath = os.path.join(pathDataFolder, *fileEntry.split(DELIMITER))
+                        fileFingerprints[fileEntry] = fetch_data.fingerprint_Raw_File(filePath)
+                        cachedArrays = fetch_data.lookup_Parsed_File(fileFingerprints[fileEntry], filePath)
+                        if cachedArrays is None:
+                            filesToParse.append(fileEntry)
+                        else:
+                            parsedFiles.append((fileEntry, cachedArrays[:3], cachedArrays[3]))
+                            if 'duplicate_of' in cachedArrays[3]:
+                                print(f"Duplicate File: {fileEntry} (Same Content as {cachedArrays[3]['duplicate_of']})")
+
+                    # Parse the remaining Files in the Worker Pool
+                    for fileEntry, columnArrays, diagnosticStatistics in executor.map(parse_Meter_File, [pathDataFolder]*len(filesToParse),
+                                                                                     filesToParse, [DELIMITER]*len(filesToParse)):
+                        fetch_data.store_Parsed_File(fileFingerprints[fileEntry], os.path.join(pathDataFolder, *fileEntry.split(DELIMITER)),
+                                                     (*columnArrays, diagnosticStatistics))
+                        parsedFiles.append((fileEntry, columnArrays, diagnosticStatistics))
+
+                    # Merge into their Block in File Order
+                    changedMeters = {}   # Block Number: Set of Meters re-parsed in this Batch
+                    for fileEntry, (timestamps, values, health), diagnosticStatistics in sorted(parsedFiles, key=lambda parsedFile: parsedFile[0]):
+                        meterName, fileName = fileEntry.split(DELIMITER)
+                        blockNumber = meterName.split('_')[2]
+                        columnSuffix = next(suffix for postfix, suffix in channelSuffix.items() if fileName.endswith(postfix))
+
+                        blockDataFrames[blockNumber] = parse_data.merge_Meter_Arrays(blockDataFrames[blockNumber], timestamps, values, health,
+                                                                                     meterName, columnSuffix, diagnosticStatistics)
+                        changedMeters.setdefault(blockNumber, set()).add(meterName)
+
+                    # Refresh only the affected Block Outputs, their Rollups (changed Meters only) and the Summary
+                    for blockNumber in sorted(changedMeters):
+                        blockStatistics[blockNumber] = refresh_Block_Output(blockDataFrames[blockNumber], blockNumber, btuNameList, outputFolder, targetMonth, targetYear)
+                        rollup_data.update_Block_Rollups(blockRollups[blockNumber], blockDataFrames[blockNumber], btuNameList, blockNumber, changedMeters[blockNumber])
+                        rollup_data.write_Block_Rollups(blockRollups[blockNumber], pathOutputFolder, blockNumber, targetMonth, targetYear)
+
+                    summaryPath = write_Month_To_Date_Summary(blockStatistics, outputFolder, targetMonth, targetYear)
+                    print(f"Refreshed Blocks: {sorted(changedMeters)} | Summary: {summaryPath}")
+
+            except Exception as error:
+                logger.exception("Scan / Refresh failed - %d file(s) retried on the next Poll: %s", len(settledFiles), error)
+                for fileEntry in settledFiles:
+                    pendingChanges.setdefault(fileEntry, time.monotonic() - DEBOUNCE_SECONDS)
+                if isinstance(error, BrokenProcessPool):
+                    executor.shutdown(wait=False)
+                    executor = ProcessPoolExecutor(max_workers=NUM_WORKERS)
+
+            time.sleep(POLL_INTERVAL)
+
+    except KeyboardInterrupt:
+        print("\nWatch Data Service stopped.")
+    finally:
+        executor.shutdown()
+
+
+# ============================================================================
+# CRITICAL: This guard is REQUIRED for Windows multiprocessing
+# ============================================================================
+if __name__ == '__main__':
+    main()